@@ -0,0 +1,119 @@
+"""Define the llm-voice batch command.
+
+Renders every row of a JSONL or CSV file of (id, text, voice) prompts to an
+audio file, for example:
+
+    llm-voice batch prompts.csv --output-dir audio --provider openai \
+        --concurrency 8 --rate-limit 5 --voice-argument voice
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.cli.options import add_client_arguments, create_client, parse_options
+from llm_voice.interfaces.batch_item import BatchProgress, BatchStatus
+from llm_voice.tts.batch_synthesizer import BatchSynthesizer, read_batch_items
+
+if TYPE_CHECKING:
+    from llm_voice.tts.base import TextToSpeechClient
+
+
+def add_parser(subparsers: Any) -> None:
+    """Add the batch command to the llm-voice subcommands.
+
+    Args:
+        subparsers: The subparsers of the llm-voice parser.
+    """
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        "batch",
+        help="Render a JSONL or CSV file of prompts to audio files.",
+        description="Render a JSONL or CSV file of (id, text, voice) prompts to "
+        "audio files. Prompts rendered by a previous run with the same text, "
+        "voice and settings are skipped.",
+    )
+    parser.add_argument("input", help="JSONL or CSV file with id, text and voice.")
+    parser.add_argument(
+        "--output-dir",
+        default="audio",
+        help="Directory to write the audio files to.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of prompts rendered at the same time.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="Maximum requests per second to the provider.",
+    )
+    parser.add_argument(
+        "--voice-argument",
+        default="voice",
+        help="Constructor argument the voice column is passed as, for example "
+        "voice_id for elevenlabs.",
+    )
+    add_client_arguments(parser)
+    parser.set_defaults(run=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the batch command.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, 1 when any prompt failed.
+    """
+
+    def client_factory(voice: str | None) -> TextToSpeechClient:
+        if voice is None:
+            return create_client(args)
+
+        return create_client(args, **{args.voice_argument: voice})
+
+    # Credentials don't change the audio, so rotating them renders nothing again.
+    client_options: dict[str, Any] = {
+        name: value
+        for name, value in parse_options(args.option).items()
+        if not name.endswith("api_key")
+    }
+    synthesizer = BatchSynthesizer(
+        client_factory,
+        args.output_dir,
+        concurrency=args.concurrency,
+        requests_per_second=args.rate_limit,
+        on_progress=print_progress,
+        client_options=client_options,
+    )
+    failed: int = 0
+
+    for result in synthesizer.render(read_batch_items(args.input)):
+        if result.status == BatchStatus.FAILED:
+            failed += 1
+            print(f"\nFailed {result.item.id}: {result.error}", file=sys.stderr)
+
+    print(file=sys.stderr)
+    return 1 if failed else 0
+
+
+def print_progress(progress: BatchProgress) -> None:
+    """Print the progress of the batch on a single updating line.
+
+    Args:
+        progress: The progress of the batch.
+    """
+    print(
+        f"\r{progress.completed} done: {progress.rendered} rendered, "
+        f"{progress.skipped} skipped, {progress.failed} failed | "
+        f"{progress.items_per_second:.1f} items/s, "
+        f"{progress.characters_per_second:.0f} chars/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
@@ -0,0 +1,210 @@
+"""Define the llm-voice loadtest command.
+
+Starts a local mock of the provider APIs and runs concurrent voice sessions
+against it with the real clients, for example:
+
+    llm-voice loadtest --llm openai --tts elevenlabs --sessions 200 \
+        --concurrency 50 --tokens-per-second 40 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.loadtest.load_generator import LoadGenerator
+from llm_voice.loadtest.mock_provider_server import (
+    MockProviderConfig,
+    MockProviderServer,
+)
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.load_test_report import LoadTestReport
+    from llm_voice.llm.base import LLMClient
+    from llm_voice.tts.base import TextToSpeechClient
+
+MOCK_API_KEY = "mock"
+MOCK_MODEL = "mock"
+
+
+def add_parser(subparsers: Any) -> None:
+    """Add the loadtest command to the llm-voice subcommands.
+
+    Args:
+        subparsers: The subparsers of the llm-voice parser.
+    """
+    defaults = MockProviderConfig()
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        "loadtest",
+        help="Load test the voice pipeline against local mock providers.",
+        description="Run concurrent voice sessions with the real LLM and text to "
+        "speech clients against a local server that mimics the provider APIs, "
+        "and report the time to first audio and the provider requests.",
+    )
+    parser.add_argument("--llm", choices=["openai", "ollama"], default="openai")
+    parser.add_argument("--tts", choices=["openai", "elevenlabs"], default="openai")
+    parser.add_argument(
+        "--sessions", type=int, default=50, help="Number of sessions to run."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Number of sessions running at the same time.",
+    )
+    parser.add_argument(
+        "--synthesis-concurrency",
+        type=int,
+        default=1,
+        help="Number of sentences each session synthesizes at the same time.",
+    )
+    parser.add_argument(
+        "--response-text",
+        default=defaults.response_text,
+        help="Text every chat completion answers with.",
+    )
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=defaults.tokens_per_second
+    )
+    parser.add_argument(
+        "--first-token-latency",
+        type=float,
+        default=defaults.first_token_latency,
+        help="Mean seconds before the first token.",
+    )
+    parser.add_argument(
+        "--tts-latency",
+        type=float,
+        default=defaults.tts_latency,
+        help="Mean seconds before text to speech audio is returned.",
+    )
+    parser.add_argument(
+        "--latency-jitter",
+        type=float,
+        default=defaults.latency_jitter,
+        help="Standard deviation of the latencies in seconds.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=defaults.error_rate,
+        help="Fraction of requests answered with a 500 error.",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=defaults.rate_limit_rate,
+        help="Fraction of requests answered with a 429 error.",
+    )
+    parser.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        help="Requests in flight beyond which the server answers with 429.",
+    )
+    parser.set_defaults(run=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the loadtest command.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, 1 when any session failed.
+    """
+    config = MockProviderConfig(
+        response_text=args.response_text,
+        tokens_per_second=args.tokens_per_second,
+        first_token_latency=args.first_token_latency,
+        tts_latency=args.tts_latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_concurrent_requests=args.max_concurrent_requests,
+    )
+
+    with MockProviderServer(config) as server:
+        generator = LoadGenerator(
+            create_llm_client(args.llm, server.url),
+            create_text_to_speech_client(args.tts, server.url),
+            stats=server.stats,
+            synthesis_concurrency=args.synthesis_concurrency,
+        )
+        report: LoadTestReport = generator.run(args.sessions, args.concurrency)
+
+    print_report(report)
+    return 1 if report.failed else 0
+
+
+def create_llm_client(name: str, url: str) -> LLMClient:
+    """Create an LLM client talking to the mock server.
+
+    Args:
+        name: The provider, openai or ollama.
+        url: The URL of the mock server.
+
+    Returns:
+        The LLM client.
+    """
+    if name == "ollama":
+        from llm_voice.llm.ollama_client import OllamaClient
+
+        return OllamaClient(model_name=MOCK_MODEL, host=url)
+
+    from llm_voice.llm.openai_client import OpenAIClient
+
+    return OpenAIClient(api_key=MOCK_API_KEY, model=MOCK_MODEL, base_url=f"{url}/v1")
+
+
+def create_text_to_speech_client(name: str, url: str) -> TextToSpeechClient:
+    """Create a text to speech client talking to the mock server.
+
+    Args:
+        name: The provider, openai or elevenlabs.
+        url: The URL of the mock server.
+
+    Returns:
+        The text to speech client.
+    """
+    if name == "elevenlabs":
+        from llm_voice.tts.eleven_labs_text_to_speech_client import (
+            ElevenLabsTextToSpeechClient,
+        )
+
+        return ElevenLabsTextToSpeechClient(api_key=MOCK_API_KEY, base_url=url)
+
+    from llm_voice.tts.openai_text_to_speech_client import OpenAITextToSpeechClient
+
+    return OpenAITextToSpeechClient(api_key=MOCK_API_KEY, base_url=f"{url}/v1")
+
+
+def print_report(report: LoadTestReport) -> None:
+    """Print the summary of a load test.
+
+    Args:
+        report: The report of the test.
+    """
+
+    def seconds(value: float | None) -> str:
+        return "-" if value is None else f"{value:.3f}s"
+
+    print(
+        f"{len(report.sessions)} sessions, {report.concurrency} concurrent, "
+        f"{report.failed} failed in {report.elapsed:.1f}s "
+        f"({report.sessions_per_second:.2f} sessions/s)"
+    )
+    print(
+        "Time to first audio: "
+        f"p50 {seconds(report.time_to_first_audio(50))}, "
+        f"p90 {seconds(report.time_to_first_audio(90))}, "
+        f"p99 {seconds(report.time_to_first_audio(99))}"
+    )
+
+    for name, value in sorted(report.server_stats.items()):
+        print(f"  {name}: {value}")
+
+    for session in report.sessions:
+        if session.error is not None:
+            print(f"Session {session.index} failed: {session.error}", file=sys.stderr)
@@ -0,0 +1,49 @@
+"""Define the llm-voice command line entry point."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from llm_voice.cli import (
+    batch_command,
+    loadtest_command,
+    pack_command,
+    speak_command,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the llm-voice command and its subcommands.
+
+    Returns:
+        The argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="llm-voice",
+        description="Low latency speech from LLM chat completion streams.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    batch_command.add_parser(subparsers)
+    pack_command.add_parser(subparsers)
+    loadtest_command.add_parser(subparsers)
+    speak_command.add_parser(subparsers)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the llm-voice command.
+
+    Args:
+        argv: The arguments, defaults to the process arguments.
+
+    Returns:
+        The exit code.
+    """
+    args: argparse.Namespace = build_parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
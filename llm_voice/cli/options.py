@@ -0,0 +1,89 @@
+"""Define helpers shared by the command line subcommands."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.registry import TEXT_TO_SPEECH_CLIENTS
+
+if TYPE_CHECKING:
+    from llm_voice.tts.base import TextToSpeechClient
+
+
+def add_client_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments that select and configure the text to speech client.
+
+    Args:
+        parser: The parser of the subcommand.
+    """
+    parser.add_argument(
+        "--provider",
+        default="openai",
+        help=f"Text to speech client, one of {TEXT_TO_SPEECH_CLIENTS.available()}.",
+    )
+    parser.add_argument(
+        "--option",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Argument passed to the client's constructor, values are parsed as "
+        "JSON when possible. Can be repeated.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=[audio_format.value for audio_format in AudioFormat],
+        help="Audio format to request from the client.",
+    )
+
+
+def parse_options(options: list[str]) -> dict[str, Any]:
+    """Parse NAME=VALUE options into constructor keyword arguments.
+
+    Args:
+        options: The options given on the command line.
+
+    Returns:
+        The keyword arguments.
+
+    Raises:
+        argparse.ArgumentTypeError: If an option has no '='.
+    """
+    kwargs: dict[str, Any] = {}
+
+    for option in options:
+        name, separator, value = option.partition("=")
+
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, got '{option}'.")
+
+        try:
+            kwargs[name] = json.loads(value)
+        except json.JSONDecodeError:
+            kwargs[name] = value
+
+    return kwargs
+
+
+def create_client(
+    args: argparse.Namespace,
+    **overrides: Any,
+) -> TextToSpeechClient:
+    """Create the text to speech client selected on the command line.
+
+    Args:
+        args: The parsed arguments with the client arguments.
+        **overrides: Constructor arguments that take precedence over the options.
+
+    Returns:
+        The client, switched to the requested format when one was given.
+    """
+    kwargs: dict[str, Any] = parse_options(args.option) | overrides
+    client: TextToSpeechClient = TEXT_TO_SPEECH_CLIENTS.create(args.provider, **kwargs)
+
+    if args.format is not None:
+        client.negotiate_format([AudioFormat(args.format)])
+
+    return client
@@ -0,0 +1,71 @@
+"""Define the llm-voice pack command.
+
+Packs a directory of audio files into a single memory-mapped audio pack, for
+example the output of llm-voice batch:
+
+    llm-voice pack audio prompts.lvpack --items prompts.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any
+
+from llm_voice.tts.batch_synthesizer import output_stem, read_batch_items
+from llm_voice.utils.audio_pack import AudioPackBuilder
+
+
+def add_parser(subparsers: Any) -> None:
+    """Add the pack command to the llm-voice subcommands.
+
+    Args:
+        subparsers: The subparsers of the llm-voice parser.
+    """
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        "pack",
+        help="Pack a directory of audio files into an audio pack.",
+        description="Pack the WAV, MP3, Ogg and AIFF files of a directory into a "
+        "single indexed file that is memory-mapped at runtime. Clips are looked "
+        "up by their text, which is the file name unless --items is given.",
+    )
+    parser.add_argument("directory", help="Directory holding the audio files.")
+    parser.add_argument("output", help="Audio pack file to write.")
+    parser.add_argument(
+        "--items",
+        help="JSONL or CSV file of the llm-voice batch run that rendered the "
+        "directory, which provides the text and voice of every file.",
+    )
+    parser.set_defaults(run=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the pack command.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, 1 when there was nothing to pack.
+    """
+    builder = AudioPackBuilder()
+
+    if args.items is None:
+        builder.add_directory(args.directory)
+    else:
+        texts: dict[str, str] = {}
+        voices: dict[str, str | None] = {}
+
+        for item in read_batch_items(args.items):
+            texts[output_stem(item.id)] = item.text
+            voices[output_stem(item.id)] = item.voice
+
+        builder.add_directory(args.directory, texts, voices)
+
+    if not len(builder):
+        print(f"No audio files to pack in {args.directory}", file=sys.stderr)
+        return 1
+
+    builder.write(args.output)
+    print(f"Packed {len(builder)} clips into {args.output}", file=sys.stderr)
+    return 0
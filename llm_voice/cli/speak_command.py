@@ -0,0 +1,229 @@
+"""Define the llm-voice speak command.
+
+Speaks text from stdin as it arrives, so the output of any LLM command line
+tool can be piped into it:
+
+    ollama run llama3 "Tell me a joke" | llm-voice speak --provider openai --report
+"""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import re
+import sys
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.cli.options import add_client_arguments, create_client
+from llm_voice.interfaces.audio_device import AudioDeviceType
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.responder.voice_responder_fast import VoiceResponderFast
+from llm_voice.utils.audio_devices import AudioDevices
+from llm_voice.utils.fan_out_sink import FanOutSink
+from llm_voice.utils.pcm_player import PcmPlayer
+from llm_voice.utils.wav_file_sink import WavFileSink
+
+if TYPE_CHECKING:
+    import io
+    from collections.abc import Callable, Iterator
+
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.sentence_timing import SentenceTiming
+    from llm_voice.tts.base import TextToSpeechClient
+    from llm_voice.utils.pcm_sink import PcmSink
+
+# Words, whitespace and single punctuation marks, so sentence terminators arrive
+# as separate tokens like in LLM streams.
+TOKEN_PATTERN: re.Pattern[str] = re.compile(r"\w+|\s+|[^\w\s]")
+READ_SIZE = 4096
+REPORT_TEXT_WIDTH = 40
+
+
+def add_parser(subparsers: Any) -> None:
+    """Add the speak command to the llm-voice subcommands.
+
+    Args:
+        subparsers: The subparsers of the llm-voice parser.
+    """
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        "speak",
+        help="Speak text from stdin as it arrives.",
+        description="Read text from stdin without buffering and speak it sentence "
+        "by sentence as it arrives, for example piped from an LLM command line "
+        "tool.",
+    )
+    parser.add_argument(
+        "--device",
+        action="append",
+        default=[],
+        help="Name or index of the output device, defaults to the first one. "
+        "Can be repeated to play on several devices at once.",
+    )
+    parser.add_argument(
+        "--no-playback",
+        action="store_true",
+        help="Discard the audio in real time instead of playing it, for example "
+        "to measure latency. Needs a client that supports PCM16.",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="Also write the audio to a WAV file. Needs a client that supports PCM16.",
+    )
+    parser.add_argument(
+        "--speech-rate", type=float, default=1.0, help="Speed of the speech."
+    )
+    parser.add_argument(
+        "--synthesis-concurrency",
+        type=int,
+        default=1,
+        help="Number of sentences synthesized at the same time.",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print the latency of every sentence to stderr on exit.",
+    )
+    add_client_arguments(parser)
+    parser.set_defaults(run=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the speak command.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, 2 when the options can not be used together.
+    """
+    client: TextToSpeechClient = create_client(args)
+    player_class: Callable[[AudioDevice], PcmSink] = PcmPlayer
+
+    if (args.no_playback or args.record) and (
+        AudioFormat.PCM16 not in client.supported_formats
+    ):
+        print(
+            f"--no-playback and --record need PCM16 audio from {args.provider}",
+            file=sys.stderr,
+        )
+        return 2
+
+    if args.no_playback:
+        from llm_voice.loadtest.load_generator import NULL_OUTPUT_DEVICE
+        from llm_voice.loadtest.null_pcm_player import NullPcmPlayer
+
+        output_devices: list[AudioDevice] = [NULL_OUTPUT_DEVICE]
+        player_class = NullPcmPlayer
+    else:
+        output_devices = [
+            get_output_device(name_or_index) for name_or_index in args.device
+        ] or [get_output_device(None)]
+
+    def player_factory(_output_device: AudioDevice) -> PcmSink:
+        sinks: list[PcmSink] = [player_class(device) for device in output_devices]
+
+        if args.record:
+            sinks.append(WavFileSink(args.record))
+
+        # Synthesized once, played on every device and recorded.
+        return sinks[0] if len(sinks) == 1 else FanOutSink(sinks)
+
+    timings: list[SentenceTiming] = []
+    responder = VoiceResponderFast(
+        client,
+        output_devices[0],
+        speech_rate=args.speech_rate,
+        synthesis_concurrency=args.synthesis_concurrency,
+        player_factory=player_factory,
+        on_sentence=timings.append,
+    )
+
+    try:
+        responder.respond(read_tokens(sys.stdin.buffer))
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if args.report:
+            print_report(timings)
+
+    return 0
+
+
+def read_tokens(stream: io.BufferedIOBase) -> Iterator[str]:
+    """Read text as soon as it is written to a stream and split it into tokens.
+
+    Args:
+        stream: The binary stream, such as sys.stdin.buffer.
+
+    Returns:
+        The tokens, all of the text split into words, whitespace and
+        punctuation marks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    # read1 returns whatever is available instead of waiting for a full buffer.
+    while data := stream.read1(READ_SIZE):
+        yield from TOKEN_PATTERN.findall(decoder.decode(data))
+
+    yield from TOKEN_PATTERN.findall(decoder.decode(b"", final=True))
+
+
+def get_output_device(name_or_index: str | None) -> AudioDevice:
+    """Get the output device selected on the command line.
+
+    Args:
+        name_or_index: The name or index of the device, None for the first one.
+
+    Returns:
+        The output device.
+    """
+    if name_or_index is None:
+        return AudioDevices.get_first_of_type(AudioDeviceType.OUTPUT)
+
+    if name_or_index.isdigit():
+        return AudioDevices.get_device_by_index(int(name_or_index))
+
+    return AudioDevices.get_device_by_name(name_or_index)
+
+
+def print_report(timings: list[SentenceTiming]) -> None:
+    """Print the latency of every sentence.
+
+    Times are seconds since the command started reading stdin.
+
+    Args:
+        timings: The timings of the sentences in playback order.
+    """
+
+    def seconds(value: float | None) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    print(
+        f"{'submitted':>9} {'synthesis':>9} {'played':>7} {'audio':>6}  text",
+        file=sys.stderr,
+    )
+
+    for timing in timings:
+        text: str = " ".join(timing.text.split())
+
+        if len(text) > REPORT_TEXT_WIDTH:
+            text = text[: REPORT_TEXT_WIDTH - 3] + "..."
+
+        if timing.error is not None:
+            text += f" (skipped: {timing.error})"
+
+        print(
+            f"{seconds(timing.submitted):>9} "
+            f"{seconds(timing.synthesis_latency):>9} "
+            f"{seconds(timing.played):>7} "
+            f"{seconds(timing.audio_duration):>6}  {text}",
+            file=sys.stderr,
+        )
+
+    played: list[float] = [
+        timing.played for timing in timings if timing.played is not None
+    ]
+
+    if played:
+        print(f"First audio after {min(played):.2f}s", file=sys.stderr)
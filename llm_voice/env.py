@@ -1,7 +1,50 @@
+"""Read configuration from the environment and the .env file on first use.
+
+Reading is deferred so that importing the package neither touches the file
+system nor fails when a setting is missing. MODEL_NAME and OPENAI_API_KEY can
+still be imported from this module, which reads them at that point.
+"""
+
+import functools
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
 
-MODEL_NAME: str = os.environ["MODEL_NAME"]
-OPENAI_API_KEY: str | None = os.environ.get("OPENAI_API_KEY")
+@functools.cache
+def load_env() -> None:
+    """Load the .env file into the environment, only the first time it is called."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def get_model_name() -> str:
+    """Get the name of the model to use for the LLM client.
+
+    Returns:
+        The MODEL_NAME setting.
+
+    Raises:
+        KeyError: If MODEL_NAME is not set.
+    """
+    load_env()
+    return os.environ["MODEL_NAME"]
+
+
+def get_openai_api_key() -> str | None:
+    """Get the OpenAI API key.
+
+    Returns:
+        The OPENAI_API_KEY setting, None when not set.
+    """
+    load_env()
+    return os.environ.get("OPENAI_API_KEY")
+
+
+def __getattr__(name: str) -> str | None:
+    if name == "MODEL_NAME":
+        return get_model_name()
+
+    if name == "OPENAI_API_KEY":
+        return get_openai_api_key()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,16 @@
+"""Define the text to speech error."""
+
+
+class TextToSpeechError(Exception):
+    """Generic error in a TextToSpeechClient class."""
+
+    def __init__(self, message: str, *, retryable: bool = False) -> None:
+        """Create a new TextToSpeechError instance.
+
+        Args:
+            message: The error message.
+            retryable: Whether repeating the request may succeed, for example
+                after a connection error.
+        """
+        super().__init__(message)
+        self.retryable: bool = retryable
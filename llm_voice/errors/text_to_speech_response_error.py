@@ -0,0 +1,28 @@
+"""Define the text to speech response error."""
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+
+# Statuses of transient failures that are worth another attempt.
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class TextToSpeechResponseError(TextToSpeechError):
+    """A text to speech provider returned an error or a response that is not audio."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Create a new TextToSpeechResponseError instance.
+
+        Args:
+            message: The error message.
+            status_code: The HTTP status code of the response.
+            content_type: The content type of the response.
+        """
+        super().__init__(message, retryable=status_code in RETRYABLE_STATUS_CODES)
+        self.status_code: int | None = status_code
+        self.content_type: str | None = content_type
@@ -0,0 +1,17 @@
+"""Define the text to speech timeout error."""
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+
+
+class TextToSpeechTimeoutError(TextToSpeechError):
+    """Speech was not synthesized before its request timeout or deadline."""
+
+    def __init__(self, message: str, *, retryable: bool = True) -> None:
+        """Create a new TextToSpeechTimeoutError instance.
+
+        Args:
+            message: The error message.
+            retryable: Whether a new attempt may succeed, False once the
+                deadline itself has passed.
+        """
+        super().__init__(message, retryable=retryable)
@@ -1,6 +1,6 @@
 """Define the audio device options data model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -20,3 +20,17 @@ class AudioDevice:
     index: int
     name: str
     device_type: AudioDeviceType
+    default_sample_rate: int | None = None
+    host_api: str | None = None
+
+
+@dataclass(frozen=True)
+class AudioDeviceChanges:
+    """Devices that appeared or disappeared between two device scans."""
+
+    added: list[AudioDevice] = field(default_factory=list)
+    removed: list[AudioDevice] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Whether any device was added or removed."""
+        return bool(self.added or self.removed)
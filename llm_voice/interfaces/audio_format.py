@@ -0,0 +1,45 @@
+"""Define the audio format data models shared by TTS clients and players."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class AudioFormat(str, Enum):
+    """Encoding of synthesized audio.
+
+    PCM16 is mono or interleaved 16-bit little endian samples without a header.
+    When PCM16 audio is written to a file it is wrapped in a WAV header, which
+    does not require any decoding to play back.
+    """
+
+    PCM16 = "pcm16"
+    WAV = "wav"
+    OPUS = "opus"
+    MP3 = "mp3"
+    AIFF = "aiff"
+
+    @property
+    def extension(self) -> str:
+        """The file extension used when the audio is saved to a file."""
+        return {
+            AudioFormat.PCM16: ".wav",
+            AudioFormat.WAV: ".wav",
+            AudioFormat.OPUS: ".ogg",
+            AudioFormat.MP3: ".mp3",
+            AudioFormat.AIFF: ".aiff",
+        }[self]
+
+
+@dataclass(frozen=True)
+class AudioSpec:
+    """Format, sample rate and channel count of synthesized audio.
+
+    Attributes:
+        format: The audio encoding.
+        sample_rate: The sample rate in Hz, None when chosen by the provider.
+        channels: The number of channels.
+    """
+
+    format: AudioFormat
+    sample_rate: int | None = None
+    channels: int = 1
@@ -0,0 +1,81 @@
+"""Define the batch synthesis data models."""
+
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """A prompt to render in a batch.
+
+    Attributes:
+        id: The unique id of the prompt, used as the output file name.
+        text: The text to speak.
+        voice: The voice to speak it with, None for the client's default.
+    """
+
+    id: str
+    text: str
+    voice: str | None = None
+
+
+class BatchStatus(str, Enum):
+    """Outcome of rendering a batch item."""
+
+    __slots__ = ()
+    RENDERED = "rendered"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Result of rendering a batch item.
+
+    Attributes:
+        item: The rendered item.
+        status: Whether the item was rendered, skipped or failed.
+        path: The audio file of the item, None when it failed.
+        content_hash: The hash of everything that determines the audio.
+        duration: The seconds spent rendering the item.
+        error: The error message when the item failed.
+    """
+
+    item: BatchItem
+    status: BatchStatus
+    path: Path | None
+    content_hash: str
+    duration: float = 0.0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchProgress:
+    """Progress of a running batch.
+
+    Attributes:
+        completed: The number of finished items, including skipped and failed.
+        rendered: The number of items rendered by this run.
+        skipped: The number of items already rendered by a previous run.
+        failed: The number of items that failed.
+        elapsed: The seconds since the batch started.
+        characters: The number of characters rendered by this run.
+    """
+
+    completed: int
+    rendered: int
+    skipped: int
+    failed: int
+    elapsed: float
+    characters: int
+
+    @property
+    def items_per_second(self) -> float:
+        """The number of items rendered per second by this run."""
+        return self.rendered / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def characters_per_second(self) -> float:
+        """The number of characters rendered per second by this run."""
+        return self.characters / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,21 @@
+"""Define the filler clip data model."""
+
+from dataclasses import dataclass
+
+from llm_voice.interfaces.pcm_audio import PcmAudio
+
+
+@dataclass(frozen=True)
+class FillerClip:
+    """Short pre-rendered clip played while the LLM has not answered yet.
+
+    Attributes:
+        name: The name of the clip, the stem of its WAV file.
+        audio: The audio of the clip.
+        keywords: Words in the user's request that make the clip a fit, empty
+            for a clip that fits any request such as a breath or a chime.
+    """
+
+    name: str
+    audio: PcmAudio
+    keywords: tuple[str, ...] = ()
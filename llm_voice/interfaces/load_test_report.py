@@ -0,0 +1,78 @@
+"""Define the load test data models."""
+
+import statistics
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SessionResult:
+    """Result of one simulated voice session.
+
+    Attributes:
+        index: The number of the session.
+        started: The seconds after the start of the test the session started.
+        duration: The seconds from the request to the end of playback.
+        time_to_first_audio: The seconds from the request until audio started
+            playing, None when no audio played.
+        audio_seconds: The seconds of audio played.
+        error: The error message when the session failed.
+    """
+
+    index: int
+    started: float
+    duration: float
+    time_to_first_audio: float | None
+    audio_seconds: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    """Summary of a load test.
+
+    Attributes:
+        sessions: The result of every session in start order.
+        concurrency: The number of sessions run at the same time.
+        elapsed: The seconds the whole test took.
+        server_stats: The request counters of the mock provider server.
+    """
+
+    sessions: list[SessionResult]
+    concurrency: int
+    elapsed: float
+    server_stats: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> int:
+        """The number of sessions that failed."""
+        return sum(1 for session in self.sessions if session.error is not None)
+
+    @property
+    def sessions_per_second(self) -> float:
+        """The number of sessions completed per second."""
+        return len(self.sessions) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def time_to_first_audio(self, percentile: float) -> float | None:
+        """Get a percentile of the time to first audio of the sessions.
+
+        Args:
+            percentile: The percentile, from 0 to 100.
+
+        Returns:
+            The seconds, None when no session played audio.
+        """
+        values: list[float] = sorted(
+            session.time_to_first_audio
+            for session in self.sessions
+            if session.time_to_first_audio is not None
+        )
+
+        if not values:
+            return None
+
+        if len(values) == 1:
+            return values[0]
+
+        return statistics.quantiles(values, n=100, method="inclusive")[
+            min(98, max(0, round(percentile) - 1))
+        ]
@@ -0,0 +1,39 @@
+"""Define the packed clip data model."""
+
+from dataclasses import dataclass
+
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.interfaces.pcm_audio import PcmAudio
+
+
+@dataclass(frozen=True, slots=True)
+class PackedClip:
+    """Clip served from an audio pack without copying its audio.
+
+    Attributes:
+        format: The encoding of the audio, WAV files are packed as PCM16.
+        data: The audio, a read-only view of the memory-mapped pack.
+        sample_rate: The sample rate in Hz, None when unknown.
+        channels: The number of channels.
+        duration: The duration in seconds, 0.0 when unknown.
+    """
+
+    format: AudioFormat
+    data: memoryview
+    sample_rate: int | None
+    channels: int
+    duration: float
+
+    def as_pcm(self) -> PcmAudio:
+        """View the clip as PCM audio for PcmPlayer, without copying it.
+
+        Returns:
+            The PCM audio.
+
+        Raises:
+            ValueError: If the clip is not PCM16.
+        """
+        if self.format != AudioFormat.PCM16 or self.sample_rate is None:
+            raise ValueError(f"Expected a PCM16 clip, got {self.format.value}.")
+
+        return PcmAudio(self.data, self.sample_rate, self.channels)
@@ -0,0 +1,30 @@
+"""Define the in-memory PCM audio data model."""
+
+from dataclasses import dataclass
+
+PCM16_SAMPLE_WIDTH = 2
+
+
+@dataclass(frozen=True, slots=True)
+class PcmAudio:
+    """Block of 16-bit little endian PCM audio held in memory.
+
+    Attributes:
+        data: The interleaved samples.
+        sample_rate: The sample rate in Hz.
+        channels: The number of interleaved channels.
+    """
+
+    data: bytes | bytearray | memoryview
+    sample_rate: int
+    channels: int = 1
+
+    @property
+    def frame_count(self) -> int:
+        """The number of sample frames."""
+        return memoryview(self.data).nbytes // (PCM16_SAMPLE_WIDTH * self.channels)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the audio in seconds."""
+        return self.frame_count / self.sample_rate
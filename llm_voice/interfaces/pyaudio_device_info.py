@@ -9,7 +9,7 @@ class PyAudioDeviceInfo(TypedDict):
     index: int
     structVersion: str
     name: str
-    hostApi: str
+    hostApi: int
     maxInputChannels: int
     maxOutputChannels: int
     defaultLowInputLatency: int
@@ -0,0 +1,35 @@
+"""Define the sentence timing data model."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SentenceTiming:
+    """Timing of one text to speech request of a response.
+
+    Times are in seconds since the response started. Short sentences merged
+    into one request share a single timing.
+
+    Attributes:
+        text: The text of the request.
+        submitted: When the text was sent to the text to speech client.
+        synthesized: When its audio was ready, None when synthesis failed.
+        played: When its audio was handed to the player, None when skipped.
+        audio_duration: The seconds of PCM audio, None for audio files.
+        error: The error message when the sentence was skipped.
+    """
+
+    text: str
+    submitted: float
+    synthesized: float | None
+    played: float | None
+    audio_duration: float | None
+    error: str | None = None
+
+    @property
+    def synthesis_latency(self) -> float | None:
+        """The seconds from submitting the text until its audio was ready."""
+        if self.synthesized is None:
+            return None
+
+        return self.synthesized - self.submitted
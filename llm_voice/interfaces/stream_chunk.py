@@ -0,0 +1,54 @@
+"""Define the chat completion stream chunk data models."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TokenUsage:
+    """Token counts and server-side timings of a chat completion.
+
+    Timings are only reported by some providers, such as Ollama.
+
+    Attributes:
+        prompt_tokens: The number of prompt tokens, None when not reported.
+        completion_tokens: The number of generated tokens, None when not
+            reported.
+        load_duration: The seconds spent loading the model.
+        prompt_eval_duration: The seconds spent evaluating the prompt.
+        eval_duration: The seconds spent generating the completion.
+        total_duration: The seconds the server spent on the request.
+    """
+
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    load_duration: float | None = None
+    prompt_eval_duration: float | None = None
+    eval_duration: float | None = None
+    total_duration: float | None = None
+
+    @property
+    def eval_rate(self) -> float | None:
+        """The generated tokens per second, None when not reported."""
+        if not self.completion_tokens or not self.eval_duration:
+            return None
+
+        return self.completion_tokens / self.eval_duration
+
+
+@dataclass(frozen=True, slots=True)
+class StreamChunk:
+    """Chunk of a chat completion stream.
+
+    Attributes:
+        text: The generated text, empty for chunks that only carry metadata.
+        received: The time.monotonic() the chunk arrived.
+        finish_reason: Why generation stopped, such as "stop" or "length", set
+            on the chunk that ends the completion.
+        usage: The token usage and timings, set on the last chunk when the
+            provider reports them.
+    """
+
+    text: str
+    received: float
+    finish_reason: str | None = None
+    usage: TokenUsage | None = None
@@ -1,9 +1,18 @@
 """Module for interacting with the OpenAI API."""
 
+from __future__ import annotations
+
 import abc
+import time
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+from llm_voice.interfaces.stream_chunk import StreamChunk
+
+if TYPE_CHECKING:
+    from llm_voice.llm.conversation import Conversation
 
 
 class ChatRole(str, Enum):
@@ -41,14 +50,14 @@ class LLMClient(abc.ABC):
     @abc.abstractmethod
     def generate_chat_completion(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
     ) -> str | None:
         """Generate a chat completion.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
@@ -58,16 +67,42 @@ class LLMClient(abc.ABC):
     @abc.abstractmethod
     def generate_chat_completion_stream(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
     ) -> Iterator[str]:
         """Generate a chat completion.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
             The stream response from the model.
         """
+
+    def generate_chat_completion_chunks(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[StreamChunk]:
+        """Generate a chat completion stream with timing and usage metadata.
+
+        The default implementation wraps generate_chat_completion_stream, so the
+        chunks only carry their text and arrival time. Clients whose API reports
+        the finish reason, token usage or server timings override it.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The chunks of the response, without chunks that carry nothing.
+        """
+        for text in self.generate_chat_completion_stream(
+            messages,
+            temperature=temperature,
+        ):
+            if text:
+                yield StreamChunk(text=text, received=time.monotonic())
@@ -0,0 +1,282 @@
+"""Define the Conversation class.
+
+A conversation keeps the chat history of a voice session within a token budget
+so prompts, and with them the LLM time to first token, stop growing with the
+length of the session. The system prompt is pinned as the first message so that
+providers can reuse their cached prompt prefix, the oldest turns are dropped
+when the budget is exceeded and, when a summarizer client is given, the dropped
+turns are summarized on a background thread and kept as a short system note.
+
+Each message also caches its provider specific form, so LLM clients passed a
+conversation only convert the messages added since the previous request.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from llm_voice.llm.base import ChatMessage, MessageRole
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from llm_voice.llm.base import LLMClient
+
+T = TypeVar("T")
+
+# Rough token estimate for English text and the per-message framing overhead.
+CHARACTERS_PER_TOKEN = 4
+MESSAGE_TOKEN_OVERHEAD = 4
+
+SUMMARY_PROMPT = (
+    "Summarize the conversation below in a few sentences. Keep names, facts and "
+    "decisions the assistant will need to continue the conversation."
+)
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of the given text.
+
+    Args:
+        text: The text to estimate.
+
+    Returns:
+        The approximate number of tokens.
+    """
+    return math.ceil(len(text) / CHARACTERS_PER_TOKEN)
+
+
+@dataclass
+class _Entry:
+    message: ChatMessage
+    tokens: int
+    serialized: dict[str, Any] = field(default_factory=dict)
+
+
+class Conversation:
+    """Token budgeted chat history with cached provider serialization."""
+
+    def __init__(
+        self,
+        system_prompt: str | None = None,
+        token_budget: int = 4096,
+        summarizer: LLMClient | None = None,
+        token_counter: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        """Create a new Conversation instance.
+
+        Args:
+            system_prompt: The system prompt pinned as the first message.
+            token_budget: The approximate maximum number of prompt tokens.
+            summarizer: Optional LLM client used to summarize dropped turns.
+            token_counter: Function returning the number of tokens of a text.
+        """
+        self._token_budget: int = token_budget
+        self._summarizer: LLMClient | None = summarizer
+        self._token_counter: Callable[[str], int] = token_counter
+        self._system: _Entry | None = None
+        self._summary: _Entry | None = None
+        self._turns: list[_Entry] = []
+        self._lock = threading.RLock()
+        self._pending_summary: list[ChatMessage] = []
+        self._summary_thread: threading.Thread | None = None
+
+        if system_prompt is not None:
+            self._system = self._create_entry(
+                ChatMessage(role=MessageRole.SYSTEM, content=system_prompt)
+            )
+
+    @property
+    def messages(self) -> list[ChatMessage]:
+        """The messages to send, starting with the pinned system prompt."""
+        return [entry.message for entry in self._entries()]
+
+    @property
+    def token_count(self) -> int:
+        """The approximate number of tokens of the messages to send."""
+        return sum(entry.tokens for entry in self._entries())
+
+    def add_user_message(self, content: str) -> None:
+        """Add a user message, dropping old turns if the budget is exceeded.
+
+        Args:
+            content: The text of the message.
+        """
+        self.add_message(ChatMessage(role=MessageRole.USER, content=content))
+
+    def add_assistant_message(self, content: str) -> None:
+        """Add an assistant message, dropping old turns if the budget is exceeded.
+
+        Args:
+            content: The text of the message.
+        """
+        self.add_message(ChatMessage(role=MessageRole.ASSISTANT, content=content))
+
+    def add_message(self, message: ChatMessage) -> None:
+        """Add a message, dropping old turns if the budget is exceeded.
+
+        Args:
+            message: The message to add.
+        """
+        with self._lock:
+            self._turns.append(self._create_entry(message))
+            self._enforce_budget()
+
+    def record_stream(self, stream: Iterable[str | None]) -> Iterator[str]:
+        """Pass a completion stream through and add it as an assistant message.
+
+        Args:
+            stream: The chat completion stream.
+
+        Returns:
+            The chunks of the stream, without None chunks.
+        """
+        chunks: list[str] = []
+
+        for chunk in stream:
+            if chunk is None:
+                continue
+
+            chunks.append(chunk)
+            yield chunk
+
+        self.add_assistant_message("".join(chunks))
+
+    def serialize(self, key: str, serializer: Callable[[ChatMessage], T]) -> list[T]:
+        """Get the messages in a provider specific form.
+
+        Messages are only converted the first time they are serialized for a key.
+
+        Args:
+            key: The cache key of the provider format.
+            serializer: Function converting a message to the provider format.
+
+        Returns:
+            The converted messages.
+        """
+        with self._lock:
+            entries: list[_Entry] = self._entries()
+
+        serialized: list[T] = []
+
+        for entry in entries:
+            if key not in entry.serialized:
+                entry.serialized[key] = serializer(entry.message)
+
+            serialized.append(entry.serialized[key])
+
+        return serialized
+
+    def wait_for_summary(self, timeout: float | None = None) -> None:
+        """Wait for a running background summarization to finish.
+
+        Args:
+            timeout: The maximum number of seconds to wait.
+        """
+        with self._lock:
+            summary_thread: threading.Thread | None = self._summary_thread
+
+        if summary_thread is not None:
+            summary_thread.join(timeout)
+
+    def _entries(self) -> list[_Entry]:
+        with self._lock:
+            pinned: list[_Entry] = [
+                entry for entry in (self._system, self._summary) if entry is not None
+            ]
+            return pinned + self._turns
+
+    def _create_entry(self, message: ChatMessage) -> _Entry:
+        return _Entry(
+            message=message,
+            tokens=self._token_counter(message.content) + MESSAGE_TOKEN_OVERHEAD,
+        )
+
+    def _enforce_budget(self) -> None:
+        """Drop the oldest turns until the budget is met, keeping the newest."""
+        dropped: list[_Entry] = []
+
+        while len(self._turns) > 1 and self.token_count > self._token_budget:
+            dropped.append(self._turns.pop(0))
+
+            # Drop the reply along with its question so turns stay paired.
+            if len(self._turns) > 1 and self._turns[0].message.role not in {
+                MessageRole.USER,
+                MessageRole.SYSTEM,
+            }:
+                dropped.append(self._turns.pop(0))
+
+        if not dropped:
+            return
+
+        logger.debug(f"Conversation: dropped {len(dropped)} messages over budget")
+
+        if self._summarizer is not None:
+            self._start_summary([entry.message for entry in dropped])
+
+    def _start_summary(self, dropped: list[ChatMessage]) -> None:
+        """Queue dropped turns for summarization on the background thread."""
+        with self._lock:
+            self._pending_summary += dropped
+
+            # The thread clears itself under the lock once the queue is empty,
+            # so a running thread always picks up what was queued here.
+            if self._summary_thread is None:
+                self._summary_thread = threading.Thread(
+                    target=self._summarize,
+                    daemon=True,
+                )
+                self._summary_thread.start()
+
+    def _summarize(self) -> None:
+        """Fold dropped turns into the summary until none are pending."""
+        assert self._summarizer is not None
+
+        while True:
+            with self._lock:
+                dropped: list[ChatMessage] = self._pending_summary
+                self._pending_summary = []
+
+                if not dropped:
+                    self._summary_thread = None
+                    return
+
+                transcript: list[str] = (
+                    [self._summary.message.content] if self._summary else []
+                )
+
+            transcript += [
+                f"{message.role.value}: {message.content}" for message in dropped
+            ]
+
+            try:
+                summary: str | None = self._summarizer.generate_chat_completion(
+                    [
+                        ChatMessage(role=MessageRole.SYSTEM, content=SUMMARY_PROMPT),
+                        ChatMessage(
+                            role=MessageRole.USER,
+                            content="\n".join(transcript),
+                        ),
+                    ],
+                )
+            except Exception as e:  # noqa: BLE001
+                # Any LLM client can summarize, and their SDKs share no error
+                # type. A failed summary only loses the dropped turns.
+                logger.warning(f"Conversation: summarization failed: {e}")
+                continue
+
+            if not summary:
+                continue
+
+            with self._lock:
+                self._summary = self._create_entry(
+                    ChatMessage(
+                        role=MessageRole.SYSTEM,
+                        content=f"{SUMMARY_PREFIX}{summary}",
+                    )
+                )
+                self._enforce_budget()
@@ -1,28 +1,52 @@
 """Module for interacting with the OpenAI API."""
 
-from typing import Any, Iterator, Mapping
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, cast
+from llm_voice.interfaces.stream_chunk import StreamChunk, TokenUsage
 from llm_voice.llm.base import ChatMessage, LLMClient, MessageRole
-import ollama
-from ollama import Message as OllamaMessage
+from llm_voice.llm.conversation import Conversation
+from llm_voice.utils.cancel_scope import track_response
+
+if TYPE_CHECKING:
+    from ollama import Client
+    from ollama import Message as OllamaMessage
 
 
 class OllamaClient(LLMClient):
     """Client for interacting with the Ollama Client."""
 
-    def __init__(self, model_name: str = "llama3") -> None:
-        """Initialize the OllamaClient instance."""
+    def __init__(self, model_name: str = "llama3", host: str | None = None) -> None:
+        """Initialize the OllamaClient instance.
+
+        Args:
+            model_name: The model to use.
+            host: The URL of the Ollama server, defaults to the OLLAMA_HOST env
+                var or the local server.
+        """
+        import ollama
+
         self._model: str = model_name
+        # One client per instance keeps its HTTP connections alive between
+        # requests. It is created here so the SDK is imported on the caller's
+        # thread, not concurrently by the threads of parallel requests. The hook
+        # lets RacingLLMClient abort a stream it no longer needs.
+        self._client: Client = ollama.Client(
+            host=host,
+            event_hooks={"response": [track_response]},
+        )
 
     def generate_chat_completion(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
     ) -> str | None:
         """Generate a chat completion.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
@@ -31,7 +55,7 @@ class OllamaClient(LLMClient):
         ollama_messages: list[OllamaMessage] = (
             self._from_chat_messages_to_open_ai_chat_messages(messages)
         )
-        response: Mapping[str, Any] = ollama.chat(  # type:ignore
+        response: Mapping[str, Any] = self._client.chat(  # type:ignore
             messages=ollama_messages,
             model=self._model,
         )
@@ -39,34 +63,85 @@ class OllamaClient(LLMClient):
 
     def generate_chat_completion_stream(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
     ) -> Iterator[str]:
         """Generate a chat completion stream.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
             The stream response from the model.
         """
+        for chunk in self.generate_chat_completion_chunks(
+            messages,
+            temperature=temperature,
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    def generate_chat_completion_chunks(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[StreamChunk]:
+        """Generate a chat completion stream with its usage and server timings.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The chunks of the response. The last chunk has the finish reason,
+            the token counts and the model load, prompt evaluation and
+            generation times reported by Ollama.
+        """
         ollama_messages: list[OllamaMessage] = (
             self._from_chat_messages_to_open_ai_chat_messages(messages)
         )
-        response: Iterator[Mapping[str, Any]] = ollama.chat(  # type:ignore
+        response: Iterator[Mapping[str, Any]] = self._client.chat(  # type:ignore
             messages=ollama_messages, model=self._model, stream=True
         )
 
         for message in response:
-            if message["message"]["content"] is not None:
-                yield message["message"]["content"]
+            received: float = time.monotonic()
+            text: str = message["message"]["content"] or ""
+
+            if not message.get("done"):
+                if text:
+                    yield StreamChunk(text=text, received=received)
+
+                continue
+
+            yield StreamChunk(
+                text=text,
+                received=received,
+                finish_reason=message.get("done_reason") or "stop",
+                usage=TokenUsage(
+                    prompt_tokens=message.get("prompt_eval_count"),
+                    completion_tokens=message.get("eval_count"),
+                    load_duration=_seconds(message.get("load_duration")),
+                    prompt_eval_duration=_seconds(message.get("prompt_eval_duration")),
+                    eval_duration=_seconds(message.get("eval_duration")),
+                    total_duration=_seconds(message.get("total_duration")),
+                ),
+            )
 
     def _from_chat_messages_to_open_ai_chat_messages(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
     ) -> list[OllamaMessage]:
+        if isinstance(messages, Conversation):
+            # Only messages added since the last request are converted.
+            return messages.serialize(
+                "ollama",
+                self._from_chat_message_to_open_ai_chat_message,
+            )
+
         return [
             self._from_chat_message_to_open_ai_chat_message(message)
             for message in messages
@@ -76,22 +151,19 @@ class OllamaClient(LLMClient):
         self,
         message: ChatMessage,
     ) -> OllamaMessage:
-        if message.role == MessageRole.SYSTEM:
-            return OllamaMessage(
-                role="system",
-                content=message.content,
+        if message.role in {
+            MessageRole.SYSTEM,
+            MessageRole.ASSISTANT,
+            MessageRole.USER,
+        }:
+            return cast(
+                "OllamaMessage",
+                {"role": message.role.value, "content": message.content},
             )
 
-        if message.role == MessageRole.ASSISTANT:
-            return OllamaMessage(
-                role="assistant",
-                content=message.content,
-            )
+        raise ValueError(f"Unknown message role: {message.role}")
 
-        if message.role == MessageRole.USER:
-            return OllamaMessage(
-                role="user",
-                content=message.content,
-            )
 
-        raise ValueError(f"Unknown message role: {message.role}")
+def _seconds(nanoseconds: int | None) -> float | None:
+    """Convert an Ollama duration to seconds."""
+    return None if nanoseconds is None else nanoseconds / 1e9
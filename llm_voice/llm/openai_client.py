@@ -1,24 +1,23 @@
 """Module for interacting with the OpenAI API."""
 
+from __future__ import annotations
+
+import time
 from collections.abc import Iterator
-from openai import OpenAI, Stream
-from openai.types.chat import (
-    ChatCompletionAssistantMessageParam,
-    ChatCompletionMessageParam,
-    ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam,
-)
-from openai.types.chat.chat_completion import ChatCompletion
-from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
-from openai.types.chat.chat_completion_function_message_param import (
-    ChatCompletionFunctionMessageParam,
-)
-from openai.types.chat.chat_completion_message import ChatCompletionMessage
-from openai.types.chat.chat_completion_tool_message_param import (
-    ChatCompletionToolMessageParam,
-)
-from llm_voice.env import MODEL_NAME, OPENAI_API_KEY
+from typing import TYPE_CHECKING, Any, cast
+
+from llm_voice.env import get_model_name, get_openai_api_key
+from llm_voice.interfaces.stream_chunk import StreamChunk, TokenUsage
 from llm_voice.llm.base import ChatMessage, LLMClient, MessageRole
+from llm_voice.llm.conversation import Conversation
+from llm_voice.utils.cancel_scope import track_response
+
+if TYPE_CHECKING:
+    from openai import Stream
+    from openai.types.chat import ChatCompletionMessageParam
+    from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, Choice
+    from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
 
 class TextGenerationError(Exception):
@@ -35,44 +34,51 @@ class OpenAIClient(LLMClient):
     def __init__(
         self,
         api_key: str | None = None,
-        model: str = MODEL_NAME,
+        model: str | None = None,
+        base_url: str | None = None,
     ) -> None:
         """Initialize the OpenAIClient instance.
 
         Args:
-            api_key: The OpenAI API key.
+            api_key: The OpenAI API key, read from OPENAI_API_KEY when None.
+            model: The model to use, read from MODEL_NAME when None.
+            base_url: The URL of an OpenAI compatible API, defaults to OpenAI's.
         """
-        if not api_key and not OPENAI_API_KEY:
+        from openai import DefaultHttpxClient, OpenAI
+
+        api_key = api_key or get_openai_api_key()
+
+        if not api_key:
             raise ValueError(
                 "Expected api_key parameter or OPENAI_API_KEY env var to be set.",
             )
 
-        api_key = api_key or OPENAI_API_KEY
-        self._openai_client = OpenAI(api_key=api_key)
-        self._model: str = model
+        # The hook lets RacingLLMClient abort a stream it no longer needs.
+        self._openai_client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=DefaultHttpxClient(event_hooks={"response": [track_response]}),
+        )
+        self._model: str = model or get_model_name()
 
     def generate_chat_completion(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
     ) -> str | None:
         """Generate a chat completion.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
             The response from the model.
         """
-        open_ai_chat_completion_messages: list[
-            ChatCompletionSystemMessageParam
-            | ChatCompletionUserMessageParam
-            | ChatCompletionAssistantMessageParam
-            | ChatCompletionToolMessageParam
-            | ChatCompletionFunctionMessageParam
-        ] = self._from_chat_messages_to_open_ai_chat_messages(messages)
+        open_ai_chat_completion_messages: list[ChatCompletionMessageParam] = (
+            self._from_chat_messages_to_open_ai_chat_messages(messages)
+        )
 
         response: ChatCompletion = self._openai_client.chat.completions.create(
             model=self._model,
@@ -95,46 +101,113 @@ class OpenAIClient(LLMClient):
 
     def generate_chat_completion_stream(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
         *,
         temperature: float = 0.5,
-    ) -> Iterator[str | None]:
+    ) -> Iterator[str]:
         """Generate a chat completion.
 
         Args:
-            messages: The list of input messages.
+            messages: The list of input messages or a conversation.
             temperature: The temperature to use for the model.
 
         Returns:
-            The response from the model.
+            The response from the model, without chunks that carry no text.
         """
-        open_ai_chat_completion_messages: list[
-            ChatCompletionSystemMessageParam
-            | ChatCompletionUserMessageParam
-            | ChatCompletionAssistantMessageParam
-            | ChatCompletionToolMessageParam
-            | ChatCompletionFunctionMessageParam
-        ] = self._from_chat_messages_to_open_ai_chat_messages(messages)
-
-        response: Stream[ChatCompletionChunk] = (
-            self._openai_client.chat.completions.create(
-                model=self._model,
-                messages=open_ai_chat_completion_messages,
-                temperature=temperature,
-                stream=True,
-            )
+        response: Stream[ChatCompletionChunk] = self._create_stream(
+            messages, temperature
         )
 
-        for chunk in response:
-            if chunk.choices[0].delta is None:
-                continue
+        # Closing the generator early closes the HTTP response.
+        with response:
+            for chunk in response:
+                if not chunk.choices or chunk.choices[0].delta is None:
+                    continue
 
-            yield chunk.choices[0].delta.content
+                # The role and finish chunks have no content.
+                if chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    def generate_chat_completion_chunks(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[StreamChunk]:
+        """Generate a chat completion stream with its finish reason and usage.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The chunks of the response. The finish reason is set on the chunk
+            that ends the completion and the token usage on the last chunk.
+        """
+        response: Stream[ChatCompletionChunk] = self._create_stream(
+            messages,
+            temperature,
+            stream_options={"include_usage": True},
+        )
+
+        with response:
+            for chunk in response:
+                received: float = time.monotonic()
+                usage: TokenUsage | None = None
+
+                if chunk.usage is not None:
+                    usage = TokenUsage(
+                        prompt_tokens=chunk.usage.prompt_tokens,
+                        completion_tokens=chunk.usage.completion_tokens,
+                    )
+
+                # The usage chunk has no choices.
+                choice: Choice | None = chunk.choices[0] if chunk.choices else None
+                text: str = (
+                    choice.delta.content or ""
+                    if choice is not None and choice.delta is not None
+                    else ""
+                )
+                finish_reason: str | None = (
+                    None if choice is None else choice.finish_reason
+                )
+
+                if text or finish_reason or usage:
+                    yield StreamChunk(
+                        text=text,
+                        received=received,
+                        finish_reason=finish_reason,
+                        usage=usage,
+                    )
+
+    def _create_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        temperature: float,
+        **kwargs: Any,
+    ) -> Stream[ChatCompletionChunk]:
+        open_ai_chat_completion_messages: list[ChatCompletionMessageParam] = (
+            self._from_chat_messages_to_open_ai_chat_messages(messages)
+        )
+        return self._openai_client.chat.completions.create(
+            model=self._model,
+            messages=open_ai_chat_completion_messages,
+            temperature=temperature,
+            stream=True,
+            **kwargs,
+        )
 
     def _from_chat_messages_to_open_ai_chat_messages(
         self,
-        messages: list[ChatMessage],
+        messages: list[ChatMessage] | Conversation,
     ) -> list[ChatCompletionMessageParam]:
+        if isinstance(messages, Conversation):
+            # Only messages added since the last request are converted.
+            return messages.serialize(
+                "openai",
+                self._from_chat_message_to_open_ai_chat_message,
+            )
+
         return [
             self._from_chat_message_to_open_ai_chat_message(message)
             for message in messages
@@ -144,22 +217,14 @@ class OpenAIClient(LLMClient):
         self,
         message: ChatMessage,
     ) -> ChatCompletionMessageParam:
-        if message.role == MessageRole.SYSTEM:
-            return ChatCompletionSystemMessageParam(
-                role=message.role.value,
-                content=message.content,
-            )
-
-        if message.role == MessageRole.ASSISTANT:
-            return ChatCompletionAssistantMessageParam(
-                role=message.role.value,
-                content=message.content,
-            )
-
-        if message.role == MessageRole.USER:
-            return ChatCompletionUserMessageParam(
-                role=message.role.value,
-                content=message.content,
+        if message.role in {
+            MessageRole.SYSTEM,
+            MessageRole.ASSISTANT,
+            MessageRole.USER,
+        }:
+            return cast(
+                "ChatCompletionMessageParam",
+                {"role": message.role.value, "content": message.content},
             )
 
         raise ValueError(f"Unknown message role: {message.role}")
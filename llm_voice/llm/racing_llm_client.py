@@ -0,0 +1,376 @@
+"""Define the RacingLLMClient class.
+
+The racing client sends the same chat request to several LLM backends at once,
+for example a local Ollama model that sometimes stalls on model loading and a
+hosted model with a steadier but higher time to first token. The stream of the
+backend that produces its first tokens first is used and the other streams are
+closed, so the response starts as early as the fastest backend allows at the
+cost of an extra request per response.
+
+Every backend has its win rate and time to first token tracked, the latter as
+an exponentially weighted moving average (EWMA).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from llm_voice.interfaces.stream_chunk import StreamChunk
+from llm_voice.llm.base import LLMClient
+from llm_voice.utils.cancel_scope import CancelScope
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from llm_voice.llm.base import ChatMessage
+    from llm_voice.llm.conversation import Conversation
+
+
+@dataclass
+class BackendStats:
+    """Race statistics of a single backend.
+
+    Attributes:
+        name: The name of the backend.
+        races: The number of races the backend was entered in.
+        wins: The number of races whose response came from the backend.
+        failures: The number of requests that failed before being cancelled.
+        time_to_first_token_ewma: The EWMA of the seconds until the first token,
+            including the tokens of lost races that arrived before cancellation.
+        last_time_to_first_token: The seconds until the latest first token.
+    """
+
+    name: str
+    races: int = 0
+    wins: int = 0
+    failures: int = 0
+    time_to_first_token_ewma: float | None = None
+    last_time_to_first_token: float | None = None
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of races won."""
+        return self.wins / self.races if self.races else 0.0
+
+
+class RacingLLMClient(LLMClient):
+    """LLM client that streams from whichever backend responds first."""
+
+    def __init__(
+        self,
+        clients: Sequence[LLMClient] | Mapping[str, LLMClient],
+        *,
+        first_tokens: int = 1,
+        smoothing: float = 0.3,
+    ) -> None:
+        """Create a new RacingLLMClient instance.
+
+        Args:
+            clients: The backends to race, either as a list (named by class
+                name) or a mapping of name to client.
+            first_tokens: The number of tokens a backend must produce to win,
+                a backend that finishes with fewer wins as well. Raise it to
+                avoid committing to a backend that stalls after its first token.
+            smoothing: The EWMA weight given to the newest time to first token.
+        """
+        if isinstance(clients, Mapping):
+            named_clients = dict(clients)
+        else:
+            named_clients = {}
+            for client in clients:
+                name: str = type(client).__name__
+                suffix = 2
+                while name in named_clients:
+                    name = f"{type(client).__name__}-{suffix}"
+                    suffix += 1
+                named_clients[name] = client
+
+        if not named_clients:
+            raise ValueError("Expected at least one LLM client.")
+
+        if first_tokens < 1:
+            raise ValueError("first_tokens must be at least 1.")
+
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing must be in (0, 1], got {smoothing}.")
+
+        self._clients: dict[str, LLMClient] = named_clients
+        self._first_tokens: int = first_tokens
+        self._smoothing: float = smoothing
+        self._stats: dict[str, BackendStats] = {
+            name: BackendStats(name=name) for name in named_clients
+        }
+        self._lock = threading.Lock()
+
+    def generate_chat_completion(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> str | None:
+        """Generate a chat completion from the backend that responds first.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The response from the model.
+        """
+        return "".join(
+            self.generate_chat_completion_stream(messages, temperature=temperature)
+        )
+
+    def generate_chat_completion_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[str]:
+        """Generate a chat completion stream from the backend that responds first.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The stream response from the winning backend, without empty chunks.
+
+        Raises:
+            Exception: The error of the last backend to fail, if all of them fail.
+        """
+        for chunk in self.generate_chat_completion_chunks(
+            messages,
+            temperature=temperature,
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    def generate_chat_completion_chunks(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[StreamChunk]:
+        """Generate a chat completion stream from the backend that responds first.
+
+        The request is started on every backend. Once one has produced
+        first_tokens tokens the others are cancelled. The sockets of their HTTP
+        responses are shut down right away, even while a backend stalls between
+        chunks, for clients whose httpx client has the track_response hook such
+        as OpenAIClient and OllamaClient. Other clients are closed at their next
+        chunk.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The chunks of the winning backend, with its metadata.
+
+        Raises:
+            Exception: The error of the last backend to fail, if all of them fail.
+        """
+        events = queue.Queue[tuple[_Contender, _Event]]()
+        contenders: list[_Contender] = [
+            _Contender(self, name, client, events)
+            for name, client in self._clients.items()
+        ]
+
+        for contender in contenders:
+            contender.start(messages, temperature)
+
+        try:
+            winner: _Contender = self._await_winner(contenders, events)
+
+            for loser in contenders:
+                if loser is not winner:
+                    loser.cancel()
+
+            yield from winner.chunks()
+        finally:
+            # Also stops the winner when the caller stops reading.
+            for contender in contenders:
+                contender.cancel()
+
+    def get_stats(self) -> dict[str, BackendStats]:
+        """Get a snapshot of the race statistics of every backend.
+
+        Returns:
+            Mapping of backend name to a copy of its statistics.
+        """
+        with self._lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def _await_winner(
+        self,
+        contenders: list[_Contender],
+        events: queue.Queue[tuple[_Contender, _Event]],
+    ) -> _Contender:
+        running: int = len(contenders)
+
+        while True:
+            contender, event = events.get()
+
+            if event == _Event.READY:
+                self._record_win(contender.name)
+                logger.debug(f"RacingLLMClient: {contender.name} won the race")
+                return contender
+
+            running -= 1
+            assert contender.error is not None
+
+            if not running:
+                raise contender.error
+
+            logger.warning(
+                f"RacingLLMClient: {contender.name} failed: {contender.error}"
+            )
+
+    def _record_start(self, name: str) -> None:
+        with self._lock:
+            self._stats[name].races += 1
+
+    def _record_first_token(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stats: BackendStats = self._stats[name]
+            stats.last_time_to_first_token = seconds
+            stats.time_to_first_token_ewma = (
+                seconds
+                if stats.time_to_first_token_ewma is None
+                else self._smoothing * seconds
+                + (1 - self._smoothing) * stats.time_to_first_token_ewma
+            )
+
+    def _record_win(self, name: str) -> None:
+        with self._lock:
+            self._stats[name].wins += 1
+
+    def _record_failure(self, name: str) -> None:
+        with self._lock:
+            self._stats[name].failures += 1
+
+
+class _Event(Enum):
+    # The backend produced first_tokens tokens or finished.
+    READY = "ready"
+    # The backend failed before it was cancelled.
+    FAILED = "failed"
+
+
+# Marks the end of a backend's chunk queue.
+_END = object()
+
+
+class _Contender:
+    """Reads the stream of one backend on its own thread."""
+
+    def __init__(
+        self,
+        racer: RacingLLMClient,
+        name: str,
+        client: LLMClient,
+        events: queue.Queue[tuple[_Contender, _Event]],
+    ) -> None:
+        self.name: str = name
+        self.error: Exception | None = None
+        self._racer: RacingLLMClient = racer
+        self._client: LLMClient = client
+        self._events: queue.Queue[tuple[_Contender, _Event]] = events
+        self._chunks = queue.Queue[object]()
+        self._cancelled = threading.Event()
+        self._scope = CancelScope()
+
+    def start(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        temperature: float,
+    ) -> None:
+        self._racer._record_start(self.name)
+        threading.Thread(
+            target=self._run,
+            args=(messages, temperature),
+            name=f"llm-race-{self.name}",
+            daemon=True,
+        ).start()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        # Wakes the thread even while the backend stalls between chunks.
+        self._scope.cancel()
+
+    def chunks(self) -> Iterator[StreamChunk]:
+        while True:
+            chunk: object = self._chunks.get()
+
+            if chunk is _END:
+                return
+
+            if isinstance(chunk, Exception):
+                raise chunk
+
+            assert isinstance(chunk, StreamChunk)
+            yield chunk
+
+    def _run(
+        self, messages: list[ChatMessage] | Conversation, temperature: float
+    ) -> None:
+        started: float = time.monotonic()
+        count: int = 0
+
+        try:
+            with self._scope:
+                stream: Iterator[StreamChunk] = (
+                    self._client.generate_chat_completion_chunks(
+                        messages,
+                        temperature=temperature,
+                    )
+                )
+
+                try:
+                    for chunk in stream:
+                        if chunk.text and not count:
+                            self._racer._record_first_token(
+                                self.name, chunk.received - started
+                            )
+
+                        if self._cancelled.is_set():
+                            break
+
+                        self._chunks.put(chunk)
+
+                        # Chunks that only carry metadata don't count as tokens.
+                        if not chunk.text:
+                            continue
+
+                        count += 1
+
+                        if count == self._racer._first_tokens:
+                            self._events.put((self, _Event.READY))
+                finally:
+                    close = getattr(stream, "close", None)
+
+                    if close is not None:
+                        close()
+        except Exception as e:  # noqa: BLE001
+            if self._cancelled.is_set():
+                return
+
+            self._racer._record_failure(self.name)
+            self.error = e
+            self._chunks.put(e)
+
+            if count < self._racer._first_tokens:
+                self._events.put((self, _Event.FAILED))
+
+            return
+
+        self._chunks.put(_END)
+
+        if count < self._racer._first_tokens:
+            self._events.put((self, _Event.READY))
@@ -0,0 +1 @@
+"""Load testing against local mock provider servers."""
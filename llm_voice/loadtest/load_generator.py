@@ -0,0 +1,170 @@
+"""Define the LoadGenerator class.
+
+Runs many simulated voice sessions at the same time. Each session streams a
+chat completion into a VoiceResponderFast that plays through a NullPcmPlayer,
+so the whole pipeline of LLM client, sentence splitting, TTS requests and
+real-time playback is exercised without audio hardware.
+
+Example:
+    with MockProviderServer() as server:
+        generator = LoadGenerator(
+            llm_client=OpenAIClient(api_key="mock", base_url=server.url + "/v1"),
+            text_to_speech_client=OpenAITextToSpeechClient(
+                api_key="mock", base_url=server.url + "/v1"
+            ),
+        )
+        report = generator.run(sessions=100, concurrency=20)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.interfaces.audio_device import AudioDevice, AudioDeviceType
+from llm_voice.interfaces.load_test_report import LoadTestReport, SessionResult
+from llm_voice.llm.base import ChatMessage, MessageRole
+from llm_voice.loadtest.null_pcm_player import NullPcmPlayer
+from llm_voice.responder.voice_responder_fast import VoiceResponderFast
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from llm_voice.llm.base import LLMClient
+    from llm_voice.tts.base import TextToSpeechClient
+
+DEFAULT_PROMPT = "Tell me something interesting."
+NULL_OUTPUT_DEVICE = AudioDevice(
+    index=-1,
+    name="Null output",
+    device_type=AudioDeviceType.OUTPUT,
+    default_sample_rate=24000,
+)
+
+
+class LoadGenerator:
+    """Runs concurrent voice sessions and reports their latency."""
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        text_to_speech_client: TextToSpeechClient,
+        prompt: str = DEFAULT_PROMPT,
+        output_device: AudioDevice = NULL_OUTPUT_DEVICE,
+        stats: Callable[[], dict[str, int]] | None = None,
+        **responder_kwargs: Any,
+    ) -> None:
+        """Create a new LoadGenerator instance.
+
+        The clients are shared by all sessions, like in a server handling many
+        calls, so their connection pools are part of the test.
+
+        Args:
+            llm_client: The LLM client every session streams from.
+            text_to_speech_client: The text to speech client every session
+                speaks with.
+            prompt: The user message of every session.
+            output_device: The device the audio would be played on, its sample
+                rate is the rate PCM audio is requested at.
+            stats: Returns the counters of the server under test for the report,
+                for example MockProviderServer.stats.
+            **responder_kwargs: Further arguments of VoiceResponderFast.
+        """
+        self._llm_client: LLMClient = llm_client
+        self._text_to_speech_client: TextToSpeechClient = text_to_speech_client
+        self._messages: list[ChatMessage] = [
+            ChatMessage(role=MessageRole.USER, content=prompt)
+        ]
+        self._output_device: AudioDevice = output_device
+        self._stats: Callable[[], dict[str, int]] | None = stats
+        self._responder_kwargs: dict[str, Any] = responder_kwargs
+
+    def run(self, sessions: int, concurrency: int) -> LoadTestReport:
+        """Run the sessions, concurrency of them at a time.
+
+        Args:
+            sessions: The number of sessions to run.
+            concurrency: The number of sessions running at the same time.
+
+        Returns:
+            The report of the test.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        logger.info(f"Running {sessions} sessions, {concurrency} at a time")
+        start: float = time.monotonic()
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="load-session"
+        ) as executor:
+            results: list[SessionResult] = list(
+                executor.map(
+                    lambda index: self.run_session(index, start),
+                    range(sessions),
+                )
+            )
+
+        return LoadTestReport(
+            sessions=results,
+            concurrency=concurrency,
+            elapsed=time.monotonic() - start,
+            server_stats={} if self._stats is None else self._stats(),
+        )
+
+    def run_session(self, index: int, test_start: float) -> SessionResult:
+        """Run a single session.
+
+        Args:
+            index: The number of the session.
+            test_start: The time.monotonic() the test started.
+
+        Returns:
+            The result of the session, failures are recorded in it.
+        """
+        players: list[NullPcmPlayer] = []
+        players_lock = threading.Lock()
+
+        def player_factory(output_device: AudioDevice) -> NullPcmPlayer:
+            player = NullPcmPlayer(output_device)
+
+            with players_lock:
+                players.append(player)
+
+            return player
+
+        responder = VoiceResponderFast(
+            self._text_to_speech_client,
+            self._output_device,
+            player_factory=player_factory,
+            **self._responder_kwargs,
+        )
+        start: float = time.monotonic()
+        error: str | None = None
+
+        try:
+            responder.respond(
+                token
+                for token in self._llm_client.generate_chat_completion_stream(
+                    self._messages
+                )
+                if token
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Session {index} failed: {e}")
+            error = f"{type(e).__name__}: {e}"
+
+        first_played: list[float] = [
+            player.first_played for player in players if player.first_played
+        ]
+        return SessionResult(
+            index=index,
+            started=start - test_start,
+            duration=time.monotonic() - start,
+            time_to_first_audio=min(first_played) - start if first_played else None,
+            audio_seconds=sum(player.audio_seconds for player in players),
+            error=error,
+        )
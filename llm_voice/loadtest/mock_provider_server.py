@@ -0,0 +1,487 @@
+"""Define the MockProviderServer class.
+
+The mock server speaks the HTTP wire formats of the providers, so the real
+clients can be load tested against it by pointing their base URL at it:
+
+    OpenAI      POST /v1/chat/completions     JSON or server-sent events
+                POST /v1/audio/speech         audio
+    Ollama      POST /api/chat                JSON or newline delimited JSON
+    ElevenLabs  POST /v1/text-to-speech/{id}  audio, also with /stream
+
+Token rate, latency, injected errors and rate limiting are set with
+MockProviderConfig. The server keeps connections alive and counts requests,
+responses by status and TCP connections, which shows how the clients' connection
+pools behave under load.
+
+Example:
+    with MockProviderServer(MockProviderConfig(tokens_per_second=40)) as server:
+        llm_client = OpenAIClient(api_key="mock", model="mock", base_url=server.url + "/v1")
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+from llm_voice.interfaces.pcm_audio import PCM16_SAMPLE_WIDTH
+from llm_voice.llm.conversation import estimate_tokens
+from llm_voice.utils.logger import logger
+from llm_voice.utils.lookahead_budget import estimate_speech_duration
+from llm_voice.utils.wav_file import to_wav_bytes
+
+DEFAULT_RESPONSE = (
+    "Sure. Here is a short answer to your question. It is long enough to be "
+    "spoken as a few sentences, which is what a voice assistant usually says. "
+    "Anything else?"
+)
+# Words and punctuation with their leading whitespace, like LLM tokens.
+TOKEN_PATTERN: re.Pattern[str] = re.compile(r"\s*\w+|\s*[^\w\s]")
+# Silent MPEG-1 Layer III frame at 128 kbps and 44.1 kHz.
+SILENT_MP3_FRAME: bytes = b"\xff\xfb\x90\x64" + bytes(413)
+MP3_FRAME_DURATION = 1152 / 44100
+OPENAI_PCM_SAMPLE_RATE = 24000
+
+
+@dataclass(frozen=True)
+class MockProviderConfig:
+    """Behavior of the mock provider server.
+
+    Attributes:
+        response_text: The text every chat completion answers with.
+        tokens_per_second: The rate chat completion tokens are streamed at.
+        first_token_latency: The mean seconds before the first token.
+        tts_latency: The mean seconds before text to speech audio is returned.
+        latency_jitter: The standard deviation of both latencies in seconds.
+        error_rate: The fraction of requests answered with a 500 error.
+        rate_limit_rate: The fraction of requests answered with a 429 error.
+        max_concurrent_requests: Requests beyond this many in flight are
+            answered with a 429 error, None for no limit.
+        retry_after: The Retry-After seconds of 429 responses.
+    """
+
+    response_text: str = DEFAULT_RESPONSE
+    tokens_per_second: float = 50.0
+    first_token_latency: float = 0.3
+    tts_latency: float = 0.2
+    latency_jitter: float = 0.05
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    max_concurrent_requests: int | None = None
+    retry_after: float = 1.0
+
+
+class MockProviderServer:
+    """Local HTTP server emulating the OpenAI, Ollama and ElevenLabs APIs."""
+
+    def __init__(
+        self,
+        config: MockProviderConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Create a new MockProviderServer instance.
+
+        Args:
+            config: The behavior of the server, defaults to MockProviderConfig().
+            host: The host to listen on.
+            port: The port to listen on, 0 for a free port.
+        """
+        self.config: MockProviderConfig = config or MockProviderConfig()
+        self._server = _Server((host, port), _Handler, self)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stats: Counter[str] = Counter()
+        self._in_flight: int = 0
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="mock-provider-server",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.debug(f"MockProviderServer listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        """Get the counters of the server.
+
+        Returns:
+            The number of connections, requests, requests per route, responses
+            per status and the peak of concurrent requests.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _enter_request(self) -> bool:
+        """Count a request, False when it exceeds max_concurrent_requests."""
+        with self._lock:
+            limit: int | None = self.config.max_concurrent_requests
+
+            if limit is not None and self._in_flight >= limit:
+                return False
+
+            self._in_flight += 1
+            self._stats["peak_concurrent_requests"] = max(
+                self._stats["peak_concurrent_requests"], self._in_flight
+            )
+            return True
+
+    def _exit_request(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _latency(self, mean: float) -> float:
+        return max(0.0, random.gauss(mean, self.config.latency_jitter))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        handler: type[BaseHTTPRequestHandler],
+        mock: MockProviderServer,
+    ) -> None:
+        self.mock: MockProviderServer = mock
+        super().__init__(address, handler)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections alive like the real APIs.
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.mock._count("connections")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"MockProviderServer: {format % args}")
+
+    def do_GET(self) -> None:
+        path: str = urlsplit(self.path).path
+
+        if path == "/v1/voices":
+            self._send_json(200, {"voices": []})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+
+    def do_POST(self) -> None:
+        mock: MockProviderServer = self.server.mock
+        url = urlsplit(self.path)
+        length: int = int(self.headers.get("Content-Length", 0))
+        body: dict[str, Any] = json.loads(self.rfile.read(length) or b"{}")
+        mock._count("requests")
+
+        if not mock._enter_request():
+            self._send_rate_limited()
+            return
+
+        try:
+            if random.random() < mock.config.rate_limit_rate:
+                self._send_rate_limited()
+            elif random.random() < mock.config.error_rate:
+                mock._count("injected_errors")
+                self._send_json(500, {"error": {"message": "Injected error."}})
+            elif url.path == "/v1/chat/completions":
+                mock._count("openai_chat")
+                self._openai_chat(body)
+            elif url.path == "/api/chat":
+                mock._count("ollama_chat")
+                self._ollama_chat(body)
+            elif url.path == "/v1/audio/speech":
+                mock._count("openai_speech")
+                self._openai_speech(body)
+            elif url.path.startswith("/v1/text-to-speech/"):
+                mock._count("elevenlabs_speech")
+                self._elevenlabs_speech(body, parse_qs(url.query))
+            else:
+                self._send_json(404, {"error": {"message": f"Unknown path {url.path}"}})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away, for example after a timeout.
+            self.close_connection = True
+        finally:
+            mock._exit_request()
+
+    def _openai_chat(self, body: dict[str, Any]) -> None:
+        model: str = body.get("model", "mock")
+        created: int = int(time.time())
+
+        if not body.get("stream"):
+            time.sleep(self._chat_duration())
+            self._send_json(
+                200,
+                {
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {
+                                "role": "assistant",
+                                "content": self.server.mock.config.response_text,
+                            },
+                            "finish_reason": "stop",
+                        }
+                    ],
+                },
+            )
+            return
+
+        def chunk(delta: dict[str, str], finish_reason: str | None) -> bytes:
+            event: dict[str, Any] = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+            }
+            return f"data: {json.dumps(event)}\n\n".encode()
+
+        self._start_chunked(200, "text/event-stream")
+        completion_tokens: int = 0
+
+        for token in self._tokens():
+            self._write_chunk(chunk({"role": "assistant", "content": token}, None))
+            completion_tokens += 1
+
+        self._write_chunk(chunk({}, "stop"))
+
+        if (body.get("stream_options") or {}).get("include_usage"):
+            prompt_tokens: int = _prompt_tokens(body)
+            usage_event: dict[str, Any] = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+            self._write_chunk(f"data: {json.dumps(usage_event)}\n\n".encode())
+
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._end_chunked()
+
+    def _ollama_chat(self, body: dict[str, Any]) -> None:
+        model: str = body.get("model", "mock")
+
+        def message(content: str, done: bool) -> dict[str, Any]:
+            result: dict[str, Any] = {
+                "model": model,
+                "created_at": datetime.now(UTC).isoformat(),
+                "message": {"role": "assistant", "content": content},
+                "done": done,
+            }
+
+            if done:
+                result["done_reason"] = "stop"
+
+            return result
+
+        # Ollama streams unless told otherwise.
+        if body.get("stream") is False:
+            time.sleep(self._chat_duration())
+            self._send_json(200, message(self.server.mock.config.response_text, True))
+            return
+
+        self._start_chunked(200, "application/x-ndjson")
+        started: float = time.monotonic()
+        first_token: float | None = None
+        eval_count: int = 0
+
+        for token in self._tokens():
+            first_token = first_token or time.monotonic()
+            self._write_chunk(json.dumps(message(token, False)).encode() + b"\n")
+            eval_count += 1
+
+        done: float = time.monotonic()
+        first_token = first_token or done
+        # Durations are reported in nanoseconds.
+        final: dict[str, Any] = message("", True) | {
+            "total_duration": round((done - started) * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": _prompt_tokens(body),
+            "prompt_eval_duration": round((first_token - started) * 1e9),
+            "eval_count": eval_count,
+            "eval_duration": round((done - first_token) * 1e9),
+        }
+        self._write_chunk(json.dumps(final).encode() + b"\n")
+        self._end_chunked()
+
+    def _openai_speech(self, body: dict[str, Any]) -> None:
+        response_format: str = body.get("response_format", "mp3")
+        duration: float = self._speech_duration(
+            body.get("input", ""), body.get("speed", 1.0)
+        )
+
+        if response_format == "pcm":
+            self._send_audio("audio/pcm", _silence(duration, OPENAI_PCM_SAMPLE_RATE))
+        elif response_format == "wav":
+            self._send_audio(
+                "audio/wav",
+                to_wav_bytes(
+                    _silence(duration, OPENAI_PCM_SAMPLE_RATE),
+                    OPENAI_PCM_SAMPLE_RATE,
+                ),
+            )
+        elif response_format == "mp3":
+            self._send_audio("audio/mpeg", _silent_mp3(duration))
+        else:
+            self._send_json(
+                400, {"error": {"message": f"Unsupported format {response_format}"}}
+            )
+
+    def _elevenlabs_speech(
+        self,
+        body: dict[str, Any],
+        query: dict[str, list[str]],
+    ) -> None:
+        output_format: str = query.get("output_format", ["mp3_44100_128"])[0]
+        duration: float = self._speech_duration(body.get("text", ""))
+
+        if output_format.startswith("pcm_"):
+            sample_rate = int(output_format.removeprefix("pcm_"))
+            self._send_audio("audio/pcm", _silence(duration, sample_rate))
+        elif output_format.startswith("mp3_"):
+            self._send_audio("audio/mpeg", _silent_mp3(duration))
+        else:
+            self._send_json(
+                400, {"detail": {"message": f"Unsupported format {output_format}"}}
+            )
+
+    def _tokens(self) -> Iterator[str]:
+        config: MockProviderConfig = self.server.mock.config
+        time.sleep(self.server.mock._latency(config.first_token_latency))
+        tokens: list[str] = TOKEN_PATTERN.findall(config.response_text)
+        interval: float = 1.0 / config.tokens_per_second
+
+        for index, token in enumerate(tokens):
+            if index:
+                time.sleep(interval)
+
+            yield token
+
+    def _chat_duration(self) -> float:
+        config: MockProviderConfig = self.server.mock.config
+        token_count: int = len(TOKEN_PATTERN.findall(config.response_text))
+        return (
+            self.server.mock._latency(config.first_token_latency)
+            + token_count / config.tokens_per_second
+        )
+
+    def _speech_duration(self, text: str, speed: float = 1.0) -> float:
+        time.sleep(self.server.mock._latency(self.server.mock.config.tts_latency))
+        return estimate_speech_duration(text, speed)
+
+    def _send_rate_limited(self) -> None:
+        self.server.mock._count("rate_limited")
+        self._send_json(
+            429,
+            {"error": {"message": "Rate limit reached.", "type": "rate_limit"}},
+            {"Retry-After": str(self.server.mock.config.retry_after)},
+        )
+
+    def _send_json(
+        self,
+        status: int,
+        payload: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        body: bytes = json.dumps(payload).encode()
+        self.server.mock._count(f"status_{status}")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_audio(self, content_type: str, audio: bytes) -> None:
+        self.server.mock._count("status_200")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(audio)))
+        self.end_headers()
+        self.wfile.write(audio)
+
+    def _start_chunked(self, status: int, content_type: str) -> None:
+        self.server.mock._count(f"status_{status}")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_chunked(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def _prompt_tokens(body: dict[str, Any]) -> int:
+    """Estimate the prompt tokens of a chat request."""
+    return sum(
+        estimate_tokens(str(message.get("content", "")))
+        for message in body.get("messages", [])
+    )
+
+
+def _silence(duration: float, sample_rate: int) -> bytes:
+    return bytes(round(duration * sample_rate) * PCM16_SAMPLE_WIDTH)
+
+
+def _silent_mp3(duration: float) -> bytes:
+    return SILENT_MP3_FRAME * max(1, round(duration / MP3_FRAME_DURATION))
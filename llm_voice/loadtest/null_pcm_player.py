@@ -0,0 +1,76 @@
+"""Define the NullPcmPlayer class."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from llm_voice.utils.pcm_player import DEFAULT_BUFFER_DURATION, PcmPlayer
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+
+
+class NullPcmPlayer(PcmPlayer):
+    """Player that discards audio in real time, without an output device.
+
+    Like PcmPlayer it blocks while more than the buffer duration of audio is
+    queued and close waits until the queued audio has played, so responders
+    are paced exactly as on real hardware.
+    """
+
+    def __init__(
+        self,
+        output_device: AudioDevice,
+        buffer_duration: float = DEFAULT_BUFFER_DURATION,
+    ) -> None:
+        """Initialize the NullPcmPlayer instance.
+
+        Args:
+            output_device: The output device the audio would be played on.
+            buffer_duration: The seconds of audio that can be queued.
+        """
+        super().__init__(output_device, buffer_duration)
+        self._lock = threading.Lock()
+        self._playing_until: float = 0.0
+        self._first_played: float | None = None
+        self._audio_seconds: float = 0.0
+
+    @property
+    def first_played(self) -> float | None:
+        """The time.monotonic() the first audio started playing, None before."""
+        return self._first_played
+
+    @property
+    def audio_seconds(self) -> float:
+        """The seconds of audio played."""
+        return self._audio_seconds
+
+    def play(self, audio: PcmAudio) -> None:
+        """Queue the audio, blocking until it fits into the buffer.
+
+        Args:
+            audio: The audio to play.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+
+            if self._first_played is None and audio.duration > 0:
+                self._first_played = now
+
+            self._playing_until = max(self._playing_until, now) + audio.duration
+            self._audio_seconds += audio.duration
+            wait: float = self._playing_until - now - self._buffer_duration
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def close(self) -> None:
+        """Wait until the queued audio has played."""
+        with self._lock:
+            wait: float = self._playing_until - time.monotonic()
+
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,150 @@
+"""Define the provider registries.
+
+Providers are registered by name as "module:ClassName" references and the module
+is only imported when the provider is first looked up, so importing llm_voice
+stays cheap and the SDK of a provider (openai, google-cloud-texttospeech, gTTS,
+ollama, ...) is only loaded by the processes that use it.
+
+Example:
+    tts_client = TEXT_TO_SPEECH_CLIENTS.create("openai", voice="nova")
+    llm_client = LLM_CLIENTS.create("ollama", model_name="llama3")
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from llm_voice.llm.base import LLMClient
+    from llm_voice.tts.base import TextToSpeechClient
+
+T = TypeVar("T")
+
+
+class ProviderRegistry(Generic[T]):
+    """Registry of provider classes that are imported on first use."""
+
+    def __init__(self, kind: str, providers: dict[str, str] | None = None) -> None:
+        """Create a new ProviderRegistry instance.
+
+        Args:
+            kind: The kind of provider, used in error messages.
+            providers: The provider names mapped to "module:ClassName" references.
+        """
+        self._kind: str = kind
+        self._references: dict[str, str] = {}
+        self._classes: dict[str, type[T]] = {}
+        self._lock = threading.Lock()
+
+        for name, reference in (providers or {}).items():
+            self.register(name, reference)
+
+    def register(self, name: str, provider: str | type[T]) -> None:
+        """Register a provider, replacing any provider with the same name.
+
+        Args:
+            name: The name to look the provider up by.
+            provider: The provider class or a "module:ClassName" reference to it.
+
+        Raises:
+            ValueError: If the reference is not of the form "module:ClassName".
+        """
+        with self._lock:
+            self._classes.pop(name, None)
+
+            if isinstance(provider, str):
+                if provider.count(":") != 1:
+                    raise ValueError(
+                        f"Expected a 'module:ClassName' reference, got '{provider}'.",
+                    )
+
+                self._references[name] = provider
+            else:
+                self._references.pop(name, None)
+                self._classes[name] = provider
+
+    def available(self) -> list[str]:
+        """Get the names of the registered providers without importing them.
+
+        Returns:
+            The sorted provider names.
+        """
+        with self._lock:
+            return sorted(self._references.keys() | self._classes.keys())
+
+    def get(self, name: str) -> type[T]:
+        """Get a provider class, importing its module the first time.
+
+        Args:
+            name: The name of the provider.
+
+        Returns:
+            The provider class.
+
+        Raises:
+            KeyError: If no provider is registered under the name.
+            ImportError: If the provider's module or its SDK can not be imported.
+        """
+        with self._lock:
+            if name in self._classes:
+                return self._classes[name]
+
+            if name not in self._references:
+                known: list[str] = sorted(
+                    self._references.keys() | self._classes.keys()
+                )
+                raise KeyError(
+                    f"Unknown {self._kind} '{name}', expected one of {known}."
+                )
+
+            module_name, class_name = self._references[name].split(":")
+            provider: type[T] = getattr(
+                importlib.import_module(module_name), class_name
+            )
+            self._classes[name] = provider
+            return provider
+
+    def create(self, name: str, *args: Any, **kwargs: Any) -> T:
+        """Create an instance of a provider.
+
+        Args:
+            name: The name of the provider.
+            *args: Positional arguments passed to the provider's constructor.
+            **kwargs: Keyword arguments passed to the provider's constructor.
+
+        Returns:
+            The provider instance.
+        """
+        return self.get(name)(*args, **kwargs)
+
+
+TEXT_TO_SPEECH_CLIENTS: ProviderRegistry[TextToSpeechClient] = ProviderRegistry(
+    "text to speech client",
+    {
+        "apple-say": (
+            "llm_voice.tts.apple_say_text_to_speech_client:AppleSayTextToSpeechClient"
+        ),
+        "elevenlabs": (
+            "llm_voice.tts.eleven_labs_text_to_speech_client:"
+            "ElevenLabsTextToSpeechClient"
+        ),
+        "espeak": "llm_voice.tts.espeak_text_to_speech_client:EspeakTextToSpeechClient",
+        "google": "llm_voice.tts.google_text_to_speech_client:GoogleTextToSpeechClient",
+        "google-cloud": (
+            "llm_voice.tts.google_cloud_text_to_speech_client:"
+            "GoogleCloudTextToSpeechClient"
+        ),
+        "openai": "llm_voice.tts.openai_text_to_speech_client:OpenAITextToSpeechClient",
+        "piper": "llm_voice.tts.piper_text_to_speech_client:PiperTextToSpeechClient",
+    },
+)
+
+LLM_CLIENTS: ProviderRegistry[LLMClient] = ProviderRegistry(
+    "LLM client",
+    {
+        "ollama": "llm_voice.llm.ollama_client:OllamaClient",
+        "openai": "llm_voice.llm.openai_client:OpenAIClient",
+    },
+)
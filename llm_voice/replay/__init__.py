@@ -0,0 +1 @@
+"""Record and replay package."""
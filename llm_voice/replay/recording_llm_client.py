@@ -0,0 +1,107 @@
+"""Define the RecordingLLMClient class."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from llm_voice.llm.base import LLMClient
+
+if TYPE_CHECKING:
+    from llm_voice.llm.base import ChatMessage
+    from llm_voice.llm.conversation import Conversation
+    from llm_voice.replay.session_store import SessionStore
+
+
+class RecordingLLMClient(LLMClient):
+    """LLM client that records the completions of another client to a session.
+
+    Stream chunks are stored with the seconds since the request was made, so
+    the time to first token and the gaps between tokens can be replayed.
+    """
+
+    def __init__(self, client: LLMClient, session: SessionStore) -> None:
+        """Create a new RecordingLLMClient instance.
+
+        Args:
+            client: The client whose completions are recorded.
+            session: The session to record to.
+        """
+        self._client: LLMClient = client
+        self._session: SessionStore = session
+        self._stream_ids = itertools.count()
+        self._stream_ids_lock = threading.Lock()
+
+    def generate_chat_completion(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> str | None:
+        """Generate a chat completion and record it.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The response from the model.
+        """
+        started: float = time.monotonic()
+        completion: str | None = self._client.generate_chat_completion(
+            messages,
+            temperature=temperature,
+        )
+        self._session.record(
+            {
+                "type": "llm_completion",
+                "latency": time.monotonic() - started,
+                "text": completion,
+            }
+        )
+        return completion
+
+    def generate_chat_completion_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[str]:
+        """Generate a chat completion stream and record its chunks.
+
+        Args:
+            messages: The list of input messages or a conversation.
+            temperature: The temperature to use for the model.
+
+        Returns:
+            The stream response from the model.
+        """
+        with self._stream_ids_lock:
+            stream_id: int = next(self._stream_ids)
+
+        started: float = time.monotonic()
+
+        for chunk in self._client.generate_chat_completion_stream(
+            messages,
+            temperature=temperature,
+        ):
+            self._session.record(
+                {
+                    "type": "llm_chunk",
+                    "stream": stream_id,
+                    "offset": time.monotonic() - started,
+                    "text": chunk,
+                }
+            )
+            yield chunk
+
+        self._session.record(
+            {
+                "type": "llm_stream_end",
+                "stream": stream_id,
+                "offset": time.monotonic() - started,
+            }
+        )
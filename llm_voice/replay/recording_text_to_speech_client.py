@@ -0,0 +1,147 @@
+"""Define the RecordingTextToSpeechClient class."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from llm_voice.tts.base import TextToSpeechClient
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.audio_format import AudioFormat, AudioSpec
+    from llm_voice.replay.session_store import SessionStore
+
+
+class RecordingTextToSpeechClient(TextToSpeechClient):
+    """Text to speech client that records the audio of another client to a session.
+
+    Every request is stored with its text, output format, latency and audio.
+    Failed requests are recorded with their error so they can be replayed too.
+    """
+
+    def __init__(self, client: TextToSpeechClient, session: SessionStore) -> None:
+        """Create a new RecordingTextToSpeechClient instance.
+
+        Args:
+            client: The client whose audio is recorded.
+            session: The session to record to.
+        """
+        self._client: TextToSpeechClient = client
+        self._session: SessionStore = session
+
+    @property
+    def audio_extension(self) -> str:  # type: ignore[override]
+        """The file extension of the wrapped client."""
+        return self._client.audio_extension
+
+    @property
+    def supported_formats(self) -> tuple[AudioFormat, ...]:  # type: ignore[override]
+        """The formats of the wrapped client."""
+        return self._client.supported_formats
+
+    @property
+    def output_spec(self) -> AudioSpec:  # type: ignore[override]
+        """The output spec of the wrapped client."""
+        return self._client.output_spec
+
+    @property
+    def supports_speaking_rate(self) -> bool:  # type: ignore[override]
+        """Whether the wrapped client can change the speed of speech itself."""
+        return self._client.supports_speaking_rate
+
+    @property
+    def speaking_rate(self) -> float:  # type: ignore[override]
+        """The speed of speech of the wrapped client."""
+        return self._client.speaking_rate
+
+    @speaking_rate.setter
+    def speaking_rate(self, speaking_rate: float) -> None:
+        self._client.speaking_rate = speaking_rate
+
+    def negotiate_format(
+        self,
+        preferred_formats: Sequence[AudioFormat],
+        sample_rate: int | None = None,
+    ) -> AudioSpec:
+        """Switch the wrapped client to the first preferred format it supports.
+
+        Args:
+            preferred_formats: The acceptable formats, most preferred first.
+            sample_rate: The preferred sample rate in Hz, None for the default.
+
+        Returns:
+            The output spec the client will produce from now on.
+        """
+        return self._client.negotiate_format(preferred_formats, sample_rate)
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: Path,
+        force: bool = True,
+    ) -> None:
+        """Convert the text with the wrapped client and record the file.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+            audio_file_path: The path to save the audio file.
+            force: Whether to overwrite the file if it already exists.
+        """
+        started: float = time.monotonic()
+
+        try:
+            self._client.convert_text_to_audio(text_to_speak, audio_file_path, force)
+        except Exception as e:
+            self._record("file", text_to_speak, started, error=e)
+            raise
+
+        self._record(
+            "file",
+            text_to_speak,
+            started,
+            Path(audio_file_path).read_bytes(),
+        )
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Synthesize the text with the wrapped client and record the audio.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The audio in the negotiated output format.
+        """
+        started: float = time.monotonic()
+
+        try:
+            audio: bytes = self._client.synthesize(text_to_speak)
+        except Exception as e:
+            self._record("audio", text_to_speak, started, error=e)
+            raise
+
+        self._record("audio", text_to_speak, started, audio)
+        return audio
+
+    def _record(
+        self,
+        kind: Literal["file", "audio"],
+        text_to_speak: str,
+        started: float,
+        audio: bytes | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._session.record(
+            {
+                "type": "tts",
+                "kind": kind,
+                "text": text_to_speak,
+                "format": self.output_spec.format.value,
+                "sample_rate": self.output_spec.sample_rate,
+                "extension": self.audio_extension,
+                "latency": time.monotonic() - started,
+                "error": None if error is None else f"{type(error).__name__}: {error}",
+            },
+            audio,
+        )
@@ -0,0 +1,124 @@
+"""Define the ReplayLLMClient class."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.llm.base import LLMClient
+
+if TYPE_CHECKING:
+    from llm_voice.llm.base import ChatMessage
+    from llm_voice.llm.conversation import Conversation
+    from llm_voice.replay.session_store import SessionStore
+
+
+def sleep_until(started: float, offset: float) -> None:
+    """Sleep until the given number of seconds after the start time.
+
+    Args:
+        started: The time.monotonic() start time.
+        offset: The seconds after the start time to wake up at.
+    """
+    delay: float = started + offset - time.monotonic()
+
+    if delay > 0:
+        time.sleep(delay)
+
+
+class ReplayLLMClient(LLMClient):
+    """LLM client that replays the completions of a recorded session.
+
+    Each request returns the next recorded completion or stream regardless of
+    the messages, with the recorded timing multiplied by time_scale.
+    """
+
+    def __init__(self, session: SessionStore, time_scale: float = 1.0) -> None:
+        """Create a new ReplayLLMClient instance.
+
+        Args:
+            session: The recorded session.
+            time_scale: Factor applied to the recorded timing, 0 replays
+                without any delay and 2.0 at half the recorded speed.
+        """
+        self._time_scale: float = time_scale
+        self._completions: deque[dict[str, Any]] = deque(
+            session.events("llm_completion")
+        )
+        streams: dict[int, list[dict[str, Any]]] = {}
+
+        for event in session.events():
+            if event["type"] in {"llm_chunk", "llm_stream_end"}:
+                streams.setdefault(event["stream"], []).append(event)
+
+        self._streams: deque[list[dict[str, Any]]] = deque(
+            streams[stream_id] for stream_id in sorted(streams)
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def stream_count(self) -> int:
+        """The number of recorded streams not replayed yet."""
+        return len(self._streams)
+
+    def generate_chat_completion(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> str | None:
+        """Return the next recorded completion after its recorded latency.
+
+        Args:
+            messages: Ignored, the recording is replayed as is.
+            temperature: Ignored.
+
+        Returns:
+            The recorded response.
+
+        Raises:
+            ValueError: If every recorded completion was replayed.
+        """
+        with self._lock:
+            if not self._completions:
+                raise ValueError("Every recorded completion was replayed.")
+
+            event: dict[str, Any] = self._completions.popleft()
+
+        time.sleep(event["latency"] * self._time_scale)
+        return event["text"]
+
+    def generate_chat_completion_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[str]:
+        """Replay the next recorded stream with its recorded chunk timing.
+
+        Args:
+            messages: Ignored, the recording is replayed as is.
+            temperature: Ignored.
+
+        Returns:
+            The recorded chunks.
+
+        Raises:
+            ValueError: If every recorded stream was replayed.
+        """
+        with self._lock:
+            if not self._streams:
+                raise ValueError("Every recorded stream was replayed.")
+
+            events: list[dict[str, Any]] = self._streams.popleft()
+
+        started: float = time.monotonic()
+
+        for event in events:
+            sleep_until(started, event["offset"] * self._time_scale)
+
+            if event["type"] == "llm_chunk":
+                yield event["text"]
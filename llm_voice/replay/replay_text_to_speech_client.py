@@ -0,0 +1,233 @@
+"""Define the ReplayTextToSpeechClient class."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.tts.base import TextToSpeechClient
+from llm_voice.utils.wav_file import parse_wav, write_wav
+
+if TYPE_CHECKING:
+    from llm_voice.replay.session_store import SessionStore
+
+
+class ReplayTextToSpeechClient(TextToSpeechClient):
+    """Text to speech client that replays the audio of a recorded session.
+
+    Requests are matched by text. A text recorded several times replays its
+    recordings in order and then keeps returning the last one. Each request
+    takes the recorded latency multiplied by time_scale, and recorded failures
+    are raised as TextToSpeechError.
+
+    Whether the responder merges short sentences into one request depends on
+    timing, so the replayed requests may not line up with the recorded ones.
+    For PCM16 output, a request spanning several recorded texts returns their
+    audio joined in order. A request that only starts a recorded text returns
+    all of its audio, and the requests for the rest of that text return no
+    audio, so the same audio is played either way.
+    """
+
+    def __init__(self, session: SessionStore, time_scale: float = 1.0) -> None:
+        """Create a new ReplayTextToSpeechClient instance.
+
+        Args:
+            session: The recorded session.
+            time_scale: Factor applied to the recorded latencies, 0 replays
+                without any delay.
+
+        Raises:
+            ValueError: If the session has no recorded speech.
+        """
+        self._session: SessionStore = session
+        self._time_scale: float = time_scale
+        self._recordings: dict[str, deque[dict[str, Any]]] = {}
+        self._sample_rates: dict[AudioFormat, int | None] = {}
+        self._lock = threading.Lock()
+        # The rest of a recorded text whose audio an earlier request returned.
+        self._continuation: str = ""
+
+        for event in session.events("tts"):
+            self._recordings.setdefault(event["text"], deque()).append(event)
+            self._sample_rates.setdefault(
+                AudioFormat(event["format"]),
+                event["sample_rate"],
+            )
+
+        if not self._sample_rates:
+            raise ValueError(f"The session {session.path} has no recorded speech.")
+
+        self.supported_formats = tuple(self._sample_rates)
+        self.negotiate_format(self.supported_formats)
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: Path,
+        force: bool = True,
+    ) -> None:
+        """Write the recorded audio of the text to a file.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+            audio_file_path: The path to save the audio file.
+            force: Whether to overwrite the file if it already exists.
+
+        Raises:
+            FileExistsError: If the audio file path already exists and force is false.
+        """
+        audio_file_path = Path(audio_file_path)
+
+        if audio_file_path.exists() and not force:
+            raise FileExistsError(
+                f"The audio file path already exists: {audio_file_path}",
+            )
+
+        if self.output_spec.format == AudioFormat.PCM16:
+            assert self.output_spec.sample_rate is not None
+            write_wav(
+                audio_file_path,
+                self.synthesize(text_to_speak),
+                self.output_spec.sample_rate,
+            )
+            return
+
+        events, payloads = self._replay(text_to_speak)
+
+        if len(events) != 1:
+            raise TextToSpeechError(
+                f"No {self.output_spec.format.value} audio recorded for "
+                f"'{text_to_speak}' as a single request.",
+            )
+
+        audio_file_path.write_bytes(payloads[0])
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Return the recorded audio of the text.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The recorded audio, raw samples for PCM16.
+        """
+        events, payloads = self._replay(text_to_speak)
+
+        if self.output_spec.format != AudioFormat.PCM16:
+            if len(events) != 1:
+                raise TextToSpeechError(
+                    f"No {self.output_spec.format.value} audio recorded for "
+                    f"'{text_to_speak}' as a single request.",
+                )
+
+            return payloads[0]
+
+        return b"".join(
+            parse_wav(payload)[0] if event["kind"] == "file" else payload
+            for event, payload in zip(events, payloads, strict=True)
+        )
+
+    def _replay(self, text_to_speak: str) -> tuple[list[dict[str, Any]], list[bytes]]:
+        """Find the recordings making up the text and wait for their latency.
+
+        Returns:
+            The recorded events in order and their audio.
+
+        Raises:
+            TextToSpeechError: If the text was not recorded or its recording
+                failed.
+        """
+        with self._lock:
+            events: list[dict[str, Any]] = self._match(text_to_speak)
+
+        time.sleep(sum(event["latency"] for event in events) * self._time_scale)
+
+        for event in events:
+            if event["error"] is not None:
+                raise TextToSpeechError(f"Recorded failure: {event['error']}")
+
+        return events, [self._session.read_payload(event) for event in events]
+
+    def _match(self, text_to_speak: str) -> list[dict[str, Any]]:
+        """Take the recordings that cover the text, in order."""
+        events: list[dict[str, Any]] = []
+        remaining: str = text_to_speak
+
+        while remaining:
+            if self._continuation:
+                if self._continuation.startswith(remaining):
+                    self._continuation = self._continuation[len(remaining) :]
+                    break
+
+                if remaining.startswith(self._continuation):
+                    remaining = remaining[len(self._continuation) :]
+                    self._continuation = ""
+                    continue
+
+                # The responder moved on to other text.
+                self._continuation = ""
+
+            texts: list[str] = self._recorded_texts()
+
+            if remaining in texts:
+                events.append(self._take(remaining))
+                break
+
+            prefixes: list[str] = [text for text in texts if remaining.startswith(text)]
+
+            if prefixes:
+                text: str = max(prefixes, key=len)
+                events.append(self._take(text))
+                remaining = remaining[len(text) :]
+                continue
+
+            merged: list[str] = [text for text in texts if text.startswith(remaining)]
+
+            if merged:
+                text = min(merged, key=len)
+                events.append(self._take(text))
+                self._continuation = text[len(remaining) :]
+                break
+
+            raise TextToSpeechError(
+                f"No {self.output_spec.format.value} audio recorded for "
+                f"'{text_to_speak}'.",
+            )
+
+        return events
+
+    def _recorded_texts(self) -> list[str]:
+        return [
+            text
+            for text, recordings in self._recordings.items()
+            if any(
+                event["format"] == self.output_spec.format.value for event in recordings
+            )
+        ]
+
+    def _take(self, text: str) -> dict[str, Any]:
+        recordings: list[dict[str, Any]] = [
+            event
+            for event in self._recordings[text]
+            if event["format"] == self.output_spec.format.value
+        ]
+        event: dict[str, Any] = recordings[0]
+
+        # Keep the last recording of the text for later requests.
+        if len(recordings) > 1:
+            self._recordings[text].remove(event)
+
+        return event
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        # Recorded audio is replayed at its recorded sample rate.
+        return self._sample_rates[audio_format]
@@ -0,0 +1,82 @@
+"""Define the SessionReplayer class.
+
+Example:
+    Record a session:
+
+        with SessionStore("session", mode="w") as session:
+            llm_client = RecordingLLMClient(OllamaClient(), session)
+            tts_client = RecordingTextToSpeechClient(OpenAITextToSpeechClient(), session)
+            VoiceResponderFast(tts_client, output_device).respond(
+                llm_client.generate_chat_completion_stream(messages)
+            )
+
+    Replay it offline at the recorded speed:
+
+        SessionReplayer("session").replay(output_device)
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.replay.replay_llm_client import ReplayLLMClient
+from llm_voice.replay.replay_text_to_speech_client import ReplayTextToSpeechClient
+from llm_voice.replay.session_store import SessionStore
+from llm_voice.responder.voice_responder_fast import VoiceResponderFast
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.audio_device import AudioDevice
+
+
+class SessionReplayer:
+    """Replays the token streams and speech of a recorded session."""
+
+    def __init__(self, path: str | Path, time_scale: float = 1.0) -> None:
+        """Load a recorded session.
+
+        Args:
+            path: The session directory.
+            time_scale: Factor applied to the recorded timing, 0 replays
+                without any delay and 2.0 at half the recorded speed.
+        """
+        session = SessionStore(path)
+        self.llm_client = ReplayLLMClient(session, time_scale)
+        self.text_to_speech_client = ReplayTextToSpeechClient(session, time_scale)
+
+    def replay(
+        self, output_device: AudioDevice, **responder_options: Any
+    ) -> list[float]:
+        """Speak every recorded stream through a VoiceResponderFast.
+
+        Short sentences are not merged unless coalesce_seconds is passed, since
+        merging depends on timing and would not reproduce the recorded requests.
+
+        Args:
+            output_device: The output device to speak on.
+            **responder_options: Options passed to VoiceResponderFast.
+
+        Returns:
+            The seconds each response took, from request to end of playback.
+        """
+        responder_options.setdefault("coalesce_seconds", None)
+        responder = VoiceResponderFast(
+            self.text_to_speech_client,
+            output_device,
+            **responder_options,
+        )
+        durations: list[float] = []
+
+        while self.llm_client.stream_count:
+            started: float = time.monotonic()
+            responder.respond(
+                self.llm_client.generate_chat_completion_stream(
+                    [],
+                )
+            )
+            durations.append(time.monotonic() - started)
+            logger.info(f"Replayed response {len(durations)} in {durations[-1]:.2f}s")
+
+        return durations
@@ -0,0 +1,124 @@
+"""Define the SessionStore class.
+
+A recorded session is a directory with two files. events.jsonl holds one JSON
+object per recorded event in the order they happened, and payloads.bin holds
+the audio of the events back to back, referenced from each event by offset and
+length. Both files are only appended to while recording, so a session stays
+readable up to its last complete event if the recording process dies.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Literal, Self, TextIO
+
+EVENTS_FILE_NAME = "events.jsonl"
+PAYLOADS_FILE_NAME = "payloads.bin"
+
+
+class SessionStore:
+    """On-disk store of the events and audio payloads of a recorded session."""
+
+    def __init__(self, path: str | Path, mode: Literal["r", "w"] = "r") -> None:
+        """Open a session directory.
+
+        Args:
+            path: The session directory.
+            mode: "w" to record a new session, replacing any existing one, or
+                "r" to read a recorded session.
+        """
+        self.path = Path(path)
+        self._mode: Literal["r", "w"] = mode
+        self._lock = threading.Lock()
+        self._started: float = time.monotonic()
+        self._events: TextIO | None = None
+        self._payloads: BinaryIO | None = None
+        self._payload_size: int = 0
+
+        if mode == "w":
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._events = (self.path / EVENTS_FILE_NAME).open("w", encoding="utf-8")
+            self._payloads = (self.path / PAYLOADS_FILE_NAME).open("wb")
+
+    def record(self, event: dict[str, Any], payload: bytes | None = None) -> None:
+        """Append an event and its optional payload to the session.
+
+        The event gets a "time" key with the seconds since the session started.
+
+        Args:
+            event: The JSON serializable event, with a "type" key.
+            payload: Binary data stored alongside the event, such as audio.
+        """
+        if self._events is None or self._payloads is None:
+            raise ValueError("The session is not open for recording.")
+
+        with self._lock:
+            event = {"time": round(time.monotonic() - self._started, 6), **event}
+
+            if payload is not None:
+                self._payloads.write(payload)
+                self._payloads.flush()
+                event["payload"] = [self._payload_size, len(payload)]
+                self._payload_size += len(payload)
+
+            self._events.write(json.dumps(event, separators=(",", ":")) + "\n")
+            self._events.flush()
+
+    def events(self, event_type: str | None = None) -> Iterator[dict[str, Any]]:
+        """Read the recorded events in order.
+
+        Args:
+            event_type: Only return events of this type, None for all events.
+
+        Returns:
+            The events.
+        """
+        with (self.path / EVENTS_FILE_NAME).open(encoding="utf-8") as events:
+            for line in events:
+                try:
+                    event: dict[str, Any] = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line of a session whose recorder was killed.
+                    break
+
+                if event_type is None or event["type"] == event_type:
+                    yield event
+
+    def read_payload(self, event: dict[str, Any]) -> bytes:
+        """Read the payload of an event.
+
+        Args:
+            event: The event read with events.
+
+        Returns:
+            The payload, empty when the event has none.
+        """
+        if "payload" not in event:
+            return b""
+
+        offset, length = event["payload"]
+
+        with (self.path / PAYLOADS_FILE_NAME).open("rb") as payloads:
+            payloads.seek(offset)
+            return payloads.read(length)
+
+    def close(self) -> None:
+        """Close the files of a session opened for recording."""
+        with self._lock:
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+
+            if self._payloads is not None:
+                self._payloads.close()
+                self._payloads = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
@@ -1,19 +1,41 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
 from pathlib import Path
 import queue
 import tempfile
 import time
 import threading
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from llm_voice.errors.respond_error import RespondError
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.interfaces.audio_format import AudioFormat, AudioSpec
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.interfaces.sentence_timing import SentenceTiming
+from llm_voice.utils.audio_post_processor import AudioPostProcessor
+from llm_voice.utils.audio import Int16Array, as_bytes, as_int16, convert_pcm
+from llm_voice.utils.lookahead_budget import (
+    LookaheadBudget,
+    Reservation,
+    estimate_speech_duration,
+)
+from llm_voice.tts.request_policy import request_deadline
 from llm_voice.utils.mp3_file import Mp3File
 from llm_voice.utils.logger import logger
+from llm_voice.utils.pcm_player import PcmPlayer
+from llm_voice.utils.time_stretch import time_stretch
 
 if TYPE_CHECKING:
     from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.filler_clip import FillerClip
     from llm_voice.tts.base import TextToSpeechClient
+    from llm_voice.utils.filler_clips import FillerClips
+    from llm_voice.utils.pcm_sink import PcmSink
+
+# Seconds of queued audio kept in reserve while short sentences are held back.
+COALESCE_MARGIN_SECONDS = 1.0
 
 
 class VoiceResponderFast:
@@ -24,17 +46,89 @@ class VoiceResponderFast:
         text_to_speech_client: TextToSpeechClient,
         output_device: AudioDevice,
         speech_rate: float = 1.0,
+        synthesis_concurrency: int = 1,
+        prefer_pcm: bool = True,
+        audio_post_processor: AudioPostProcessor | None = None,
+        lookahead_seconds: float | None = 10.0,
+        deadline_slack: float | None = 3.0,
+        coalesce_seconds: float | None = 2.0,
+        filler_clips: FillerClips | None = None,
+        filler_delay: float = 0.6,
+        player_factory: Callable[[AudioDevice], PcmSink] = PcmPlayer,
+        on_sentence: Callable[[SentenceTiming], None] | None = None,
     ) -> None:
         """Initialize the VoiceResponderFast.
 
         Args:
             text_to_speech_client: The text to speech client.
             output_device: The output device to speak to the user on.
-            speech_rate: The speech rate.
+            speech_rate: The speed of speech. Clients that support it apply the
+                rate while synthesizing, otherwise PCM audio is time-stretched
+                before playback and files are played back faster.
+            synthesis_concurrency: The number of sentences synthesized at the same
+                time. Raise it for clients that scale with parallel requests, such
+                as ProcessPoolTextToSpeechClient. Playback order is unchanged.
+            prefer_pcm: Whether to request raw PCM at the output device's sample
+                rate from clients that support it. PCM audio is played from
+                memory on the output device without writing or decoding a file.
+            audio_post_processor: Optional processor that trims silence, inserts
+                punctuation pauses and crossfades sentences. Only applies to
+                PCM playback.
+            lookahead_seconds: The maximum seconds of audio synthesized ahead of
+                playback. Once reached, synthesis and reading of the text stream
+                pause until playback catches up, so long responses use constant
+                memory and interrupted responses are not synthesized in full.
+                None removes the limit.
+            deadline_slack: Seconds a sentence may arrive after playback reaches
+                it. Each sentence's TTS requests, including retries, must finish
+                by then, otherwise the sentence is skipped. None disables the
+                deadlines.
+            coalesce_seconds: Sentences estimated to be shorter than this many
+                seconds of speech are merged with the following ones into a
+                single TTS request, as long as enough audio is queued ahead of
+                them. The first sentence is always sent on its own. None sends
+                every sentence separately.
+            filler_clips: Optional pre-rendered acknowledgements, one of which
+                is played when the first token of a response is slow to arrive.
+                The speech follows the clip without cutting it off.
+            filler_delay: Seconds to wait for the first token before a filler
+                clip is played.
+            player_factory: Creates the sink of each response's PCM audio from
+                the output device, replaced to run without audio hardware or to
+                fan the audio out to several devices and recordings with
+                FanOutSink. Audio files are always played on their own.
+            on_sentence: Optional callback receiving the timing of every text
+                to speech request once its audio was played or skipped.
         """
+        if synthesis_concurrency < 1:
+            raise ValueError("synthesis_concurrency must be at least 1.")
+
         self._text_to_speech_client: TextToSpeechClient = text_to_speech_client
         self._speech_rate: float = speech_rate
+        self._local_speech_rate: float = 1.0
+
+        if speech_rate != 1.0:
+            if text_to_speech_client.supports_speaking_rate:
+                text_to_speech_client.speaking_rate = speech_rate
+            else:
+                self._local_speech_rate = speech_rate
+        self._synthesis_concurrency: int = synthesis_concurrency
+        self._lookahead_seconds: float | None = lookahead_seconds
+        self._deadline_slack: float | None = deadline_slack
+        self._coalesce_seconds: float | None = coalesce_seconds
+        self._filler_clips: FillerClips | None = filler_clips
+        self._filler_delay: float = filler_delay
+        self._player_factory: Callable[[AudioDevice], PcmSink] = player_factory
+        self._on_sentence: Callable[[SentenceTiming], None] | None = on_sentence
         self.output_device: AudioDevice = output_device
+        self._pcm_spec: AudioSpec | None = None
+        self._audio_post_processor: AudioPostProcessor | None = audio_post_processor
+
+        if prefer_pcm and AudioFormat.PCM16 in text_to_speech_client.supported_formats:
+            self._pcm_spec = text_to_speech_client.negotiate_format(
+                [AudioFormat.PCM16],
+                sample_rate=output_device.default_sample_rate,
+            )
 
     def generate(self, audio_filename: str, text_to_speak: str) -> None:
         """Generate audio from text using text-to-speech client.
@@ -49,89 +143,425 @@ class VoiceResponderFast:
                 text_to_speak,
                 Path(audio_filename),
             )
+        except TextToSpeechError:
+            raise
+        except Exception as e:
+            raise RespondError(f"Error running computer voice response: {e}") from e
+
+    def generate_audio_file(self, text_to_speak: str) -> str:
+        """Generate a temporary audio file for the given text.
+
+        Args:
+            text_to_speak: The text to generate audio for.
+
+        Returns:
+            The filename of the generated audio file.
+        """
+        # Create temp file with extension
+        with tempfile.NamedTemporaryFile(
+            suffix=self._text_to_speech_client.audio_extension,
+            delete=False,
+        ) as audio_file:
+            logger.debug(
+                f"VoiceResponderFast: Generating audio file ({audio_file.name}) for: '{text_to_speak}'"
+            )
+            self.generate(audio_file.name, text_to_speak)
+
+        audio_file_path = Path(audio_file.name)
+
+        while (
+            not audio_file_path.exists()
+            or not audio_file_path.is_file()
+            or audio_file_path.stat().st_size == 0
+        ):
+            time.sleep(0.1)
+
+        return audio_file.name
+
+    def generate_pcm(self, text_to_speak: str) -> PcmAudio:
+        """Generate PCM audio at the output device's sample rate for the given text.
+
+        Args:
+            text_to_speak: The text to generate audio for.
+
+        Returns:
+            The generated audio.
+        """
+        assert self._pcm_spec is not None and self._pcm_spec.sample_rate is not None
+
+        try:
+            logger.debug(f"VoiceResponderFast.generate_pcm - '{text_to_speak}'")
+            audio = PcmAudio(
+                data=self._text_to_speech_client.synthesize(text_to_speak),
+                sample_rate=self._pcm_spec.sample_rate,
+            )
+        except TextToSpeechError:
+            raise
         except Exception as e:
             raise RespondError(f"Error running computer voice response: {e}") from e
 
-    def respond(self, text_to_speak: Iterable[str]) -> None:
+        audio = convert_pcm(audio, sample_rate=self.output_device.default_sample_rate)
+
+        if self._local_speech_rate == 1.0:
+            return audio
+
+        stretched: Int16Array = time_stretch(
+            as_int16(audio.data),
+            audio.sample_rate,
+            self._local_speech_rate,
+        )
+        return PcmAudio(data=as_bytes(stretched), sample_rate=audio.sample_rate)
+
+    def respond(
+        self,
+        text_to_speak: Iterable[str],
+        filler_context: str | None = None,
+    ) -> None:
+        """Speak the text stream sentence by sentence as it is generated.
+
+        Args:
+            text_to_speak: The text stream to speak.
+            filler_context: The user's request, used to pick a fitting filler
+                clip.
+        """
         lock = threading.Lock()
         sentence: str = ""
-        generate_queue = queue.Queue[str]()
-        speak_queue = queue.Queue[str]()
+        # The single slot makes the token loop wait while the budget is used up.
+        generate_queue = queue.Queue[str](maxsize=1)
+        speak_queue = queue.Queue[tuple[str, Future[str | PcmAudio], Reservation]]()
+        budget = LookaheadBudget(self._lookahead_seconds)
+        executor = ThreadPoolExecutor(max_workers=self._synthesis_concurrency)
+        pcm_player: PcmSink = self._player_factory(self.output_device)
+        started: float = time.monotonic()
+        # Set when the text stream fails or is interrupted.
+        cancelled = threading.Event()
+        # When each request was submitted and, once done, synthesized.
+        timestamps: dict[Future[str | PcmAudio], list[float]] = {}
+        generate_audio = (
+            self.generate_audio_file if self._pcm_spec is None else self.generate_pcm
+        )
 
         def generate_worker(
-            generate_queue: queue.Queue[str], speak_queue: queue.Queue[str]
+            generate_queue: queue.Queue[str],
+            speak_queue: queue.Queue[tuple[str, Future[str | PcmAudio], Reservation]],
         ) -> None:
+            held: str = ""
+            first: bool = True
+
             while True:
-                item: str = generate_queue.get()
+                try:
+                    item: str = generate_queue.get(timeout=hold_timeout(held))
+                except queue.Empty:
+                    # Playback is running low, stop waiting for more text.
+                    submit_sentence(held, speak_queue)
+                    held = ""
+                    continue
 
                 if item is None:
+                    if held:
+                        submit_sentence(held, speak_queue)
+
                     break
 
-                # Create temp file with extension
-                with tempfile.NamedTemporaryFile(
-                    suffix=self._text_to_speech_client.audio_extension,
-                    delete=False,
-                ) as audio_file:
-                    logger.debug(
-                        f"VoiceResponderFast: Generating audio file ({audio_file.name}) for: '{item}'"
-                    )
-                    self.generate(audio_file.name, item)
-
-                audio_file_path = Path(audio_file.name)
-
-                while (
-                    not audio_file_path.exists()
-                    or not audio_file_path.is_file()
-                    or audio_file_path.stat().st_size == 0
-                ):
-                    time.sleep(0.1)
-
-                speak_queue.put(audio_file.name)
+                text: str = held + item
+                held = ""
+
+                if not first and should_hold(text):
+                    held = text
+                else:
+                    submit_sentence(text, speak_queue)
+                    first = False
+
                 generate_queue.task_done()
 
-        def speak_worker(speak_queue: queue.Queue[str]) -> None:
+        def should_hold(text: str) -> bool:
+            # Short sentences are merged into one request while enough audio
+            # is queued to hide the wait for the next sentence.
+            return (
+                self._coalesce_seconds is not None
+                and estimate_speech_duration(text, self._speech_rate)
+                < self._coalesce_seconds
+                and budget.reserved > COALESCE_MARGIN_SECONDS
+            )
+
+        def hold_timeout(held: str) -> float | None:
+            if not held:
+                return None
+
+            return max(0.0, budget.reserved - COALESCE_MARGIN_SECONDS)
+
+        def submit_sentence(
+            text: str,
+            speak_queue: queue.Queue[tuple[str, Future[str | PcmAudio], Reservation]],
+        ) -> None:
+            if cancelled.is_set():
+                return
+
+            reservation: Reservation = budget.reserve(
+                estimate_speech_duration(text, self._speech_rate)
+            )
+
+            if cancelled.is_set():
+                reservation.release()
+                return
+            deadline: float | None = None
+
+            if self._deadline_slack is not None:
+                # Playback reaches the sentence once the audio ahead of it
+                # has played.
+                audio_ahead: float = budget.reserved - reservation.seconds
+                deadline = time.monotonic() + audio_ahead + self._deadline_slack
+
+            # Futures are queued in sentence order, so up to
+            # synthesis_concurrency sentences are generated in parallel
+            # while playback still follows the original order.
+            request_timestamps: list[float] = [time.monotonic()]
+            audio_future = executor.submit(
+                generate_before, text, deadline, request_timestamps
+            )
+            timestamps[audio_future] = request_timestamps
+            audio_future.add_done_callback(
+                functools.partial(on_generated, reservation=reservation)
+            )
+            speak_queue.put((text, audio_future, reservation))
+
+        def generate_before(
+            text: str,
+            deadline: float | None,
+            request_timestamps: list[float],
+        ) -> str | PcmAudio:
+            with request_deadline(deadline):
+                audio: str | PcmAudio = generate_audio(text)
+
+            request_timestamps.append(time.monotonic())
+            return audio
+
+        def on_generated(
+            audio_future: Future[str | PcmAudio],
+            reservation: Reservation,
+        ) -> None:
+            # Cancelled futures also run the callback, and exception() raises
+            # for them.
+            if audio_future.cancelled() or audio_future.exception() is not None:
+                return
+
+            audio: str | PcmAudio = audio_future.result()
+
+            # Replace the estimate with the real duration once it is known.
+            if isinstance(audio, PcmAudio):
+                reservation.resize(audio.duration)
+
+        def play_pcm(audio: PcmAudio) -> None:
+            logger.debug(
+                f"Playing {audio.duration:.2f}s of PCM audio on output "
+                f"device: {self.output_device}"
+            )
+
+            with lock:
+                pcm_player.play(audio)
+
+        def speak_worker(
+            speak_queue: queue.Queue[tuple[str, Future[str | PcmAudio], Reservation]],
+        ) -> None:
+            try:
+                speak_items(speak_queue)
+            finally:
+                # Never leave the generate worker blocked on the budget.
+                budget.close()
+
+        def speak_items(
+            speak_queue: queue.Queue[tuple[str, Future[str | PcmAudio], Reservation]],
+        ) -> None:
+            sample_rate: int | None = None
+
             while True:
-                audio_filename: str = speak_queue.get()
-                if audio_filename is None:
+                speak_item = speak_queue.get()
+                if speak_item is None:
                     break
 
-                logger.debug(f"Playing audio: {audio_filename}")
+                spoken_text, audio_future, reservation = speak_item
+
+                if cancelled.is_set():
+                    discard(spoken_text, audio_future, reservation)
+                    speak_queue.task_done()
+                    continue
+
+                try:
+                    audio: str | PcmAudio = audio_future.result()
+                except TextToSpeechError as e:
+                    # Skip the sentence rather than stall or end the response.
+                    logger.warning(f"Skipping sentence '{spoken_text}': {e}")
+                    report_timing(spoken_text, audio_future, None, None, str(e))
+                    reservation.release()
+                    speak_queue.task_done()
+                    continue
+
+                played: float = time.monotonic()
 
                 try:
-                    mp3_file = Mp3File(Path(audio_filename))
-
-                    logger.debug(
-                        f"Playing audio: {audio_filename} on output device: {self.output_device}"
-                    )
-
-                    with lock:
-                        mp3_file.play()
-                except Exception as e:
-                    raise RespondError(
-                        f"Error playing computer voice response: {e}"
-                    ) from e
+                    if isinstance(audio, PcmAudio):
+                        if self._audio_post_processor is not None:
+                            sample_rate = audio.sample_rate
+                            audio = self._audio_post_processor.process(
+                                audio, spoken_text
+                            )
+
+                        play_pcm(audio)
+                    else:
+                        play_file(audio)
                 finally:
-                    logger.debug(f"Deleting audio file: {audio_filename}")
-                    Path(audio_filename).unlink(missing_ok=True)  # Remove the file
+                    reservation.release()
+
+                report_timing(
+                    spoken_text,
+                    audio_future,
+                    played,
+                    audio.duration if isinstance(audio, PcmAudio) else None,
+                    None,
+                )
 
                 speak_queue.task_done()
 
+            if self._audio_post_processor is not None and sample_rate is not None:
+                play_pcm(self._audio_post_processor.flush(sample_rate))
+
+        def discard(
+            spoken_text: str,
+            audio_future: Future[str | PcmAudio],
+            reservation: Reservation,
+        ) -> None:
+            reservation.release()
+
+            if not audio_future.cancel() and audio_future.done():
+                audio: str | PcmAudio | None = (
+                    None if audio_future.exception() else audio_future.result()
+                )
+
+                if isinstance(audio, str):
+                    Path(audio).unlink(missing_ok=True)
+
+            report_timing(spoken_text, audio_future, None, None, "interrupted")
+
+        def report_timing(
+            spoken_text: str,
+            audio_future: Future[str | PcmAudio],
+            played: float | None,
+            audio_duration: float | None,
+            error: str | None,
+        ) -> None:
+            submitted, *synthesized = timestamps.pop(audio_future)
+
+            if self._on_sentence is None:
+                return
+
+            self._on_sentence(
+                SentenceTiming(
+                    text=spoken_text,
+                    submitted=submitted - started,
+                    synthesized=synthesized[0] - started if synthesized else None,
+                    played=None if played is None else played - started,
+                    audio_duration=audio_duration,
+                    error=error,
+                )
+            )
+
+        def play_filler() -> None:
+            assert self._filler_clips is not None
+
+            # Speech only starts after the first token, so the clip either takes
+            # the lock ahead of it or sees that the token arrived and stays
+            # silent.
+            with lock:
+                if filler_cancelled.is_set():
+                    return
+
+                clip: FillerClip | None = self._filler_clips.choose(filler_context)
+
+                if clip is None:
+                    return
+
+                logger.debug(f"Playing filler clip '{clip.name}'")
+                audio: PcmAudio = convert_pcm(
+                    clip.audio,
+                    sample_rate=self.output_device.default_sample_rate,
+                    channels=1,
+                )
+                pcm_player.play(audio)
+
+                if self._pcm_spec is None:
+                    # Files play on their own stream, so let the clip finish.
+                    pcm_player.close()
+
+        def play_file(audio_filename: str) -> None:
+            logger.debug(f"Playing audio: {audio_filename}")
+
+            try:
+                mp3_file = Mp3File(Path(audio_filename))
+
+                logger.debug(
+                    f"Playing audio: {audio_filename} on output device: {self.output_device}"
+                )
+
+                with lock:
+                    mp3_file.play(speed=self._local_speech_rate)
+            except Exception as e:
+                raise RespondError(f"Error playing computer voice response: {e}") from e
+            finally:
+                logger.debug(f"Deleting audio file: {audio_filename}")
+                Path(audio_filename).unlink(missing_ok=True)  # Remove the file
+
         generate_thread = threading.Thread(
             target=generate_worker, args=(generate_queue, speak_queue)
         )
         speak_thread = threading.Thread(target=speak_worker, args=(speak_queue,))
         generate_thread.start()
         speak_thread.start()
+        filler_timer: threading.Timer | None = None
+        filler_cancelled = threading.Event()
+
+        if self._filler_clips is not None:
+            filler_timer = threading.Timer(self._filler_delay, play_filler)
+            filler_timer.start()
 
-        for chat_message in text_to_speak:
-            current_text: str = chat_message
-            sentence += current_text
+        completed: bool = False
 
-            if current_text.strip() in {".", "!", "?"}:
+        try:
+            for chat_message in text_to_speak:
+                if filler_timer is not None and not filler_cancelled.is_set():
+                    # A clip that already started keeps the lock, so it is
+                    # played ahead of the speech without holding up synthesis.
+                    filler_cancelled.set()
+                    filler_timer.cancel()
+
+                current_text: str = chat_message
+                sentence += current_text
+
+                if current_text.strip() in {".", "!", "?"}:
+                    generate_queue.put(sentence)
+                    sentence = ""
+
+            # Speak text after the last sentence terminator as well.
+            if sentence.strip():
                 generate_queue.put(sentence)
-                sentence = ""
 
-        generate_queue.put(None)  # type: ignore
-        generate_thread.join()
-        speak_queue.put(None)  # type: ignore
-        speak_thread.join()
+            completed = True
+        finally:
+            if filler_timer is not None:
+                filler_cancelled.set()
+                filler_timer.cancel()
+                filler_timer.join()
+
+            if not completed:
+                # Drop the queued sentences instead of speaking them, and wake
+                # the generate worker if it waits for the budget.
+                cancelled.set()
+                budget.close()
+
+            # Always stop the workers, they would otherwise block on their
+            # queues forever when the text stream raises.
+            generate_queue.put(None)  # type: ignore
+            generate_thread.join()
+            speak_queue.put(None)  # type: ignore
+            speak_thread.join()
+            executor.shutdown(cancel_futures=not completed)
+            pcm_player.close()
@@ -31,10 +31,18 @@ class VoiceResponder(Responder):
             text_to_speech_client: The text to speech client.
             output_device: The output device to speak to the user on.
             audio_filename: The audio filename.
-            speech_rate: The speech rate.
+            speech_rate: The speed of speech. Clients that support it apply the
+                rate while synthesizing, otherwise the file is played back faster.
         """
         self._text_to_speech_client: TextToSpeechClient = text_to_speech_client
         self._speech_rate: float = speech_rate
+        self._playback_speed: float = 1.0
+
+        if speech_rate != 1.0:
+            if text_to_speech_client.supports_speaking_rate:
+                text_to_speech_client.speaking_rate = speech_rate
+            else:
+                self._playback_speed = speech_rate
         self.output_device: AudioDevice = output_device
         self._audio_filename_path: Path = Path.cwd() / (
             audio_filename + self._text_to_speech_client.audio_extension
@@ -73,7 +81,7 @@ class VoiceResponder(Responder):
                 )
 
             mp3_file = Mp3File(self._audio_filename_path)
-            mp3_file.play()
+            mp3_file.play(speed=self._playback_speed)
         except Exception as e:
             raise RespondError(f"Error running computer voice response: {e}") from e
         finally:
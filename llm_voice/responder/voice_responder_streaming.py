@@ -0,0 +1,56 @@
+"""Define the streaming voice responder concrete class."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from llm_voice.errors.respond_error import RespondError
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.utils.logger import logger
+from llm_voice.utils.pcm_player import PcmPlayer
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.tts.base import StreamingTextToSpeechClient
+
+
+class VoiceResponderStreaming:
+    """Responder that pipes the chat completion stream into a streaming TTS client.
+
+    Unlike VoiceResponderFast it does not wait for whole sentences, the text
+    is sent as it streams and the audio is played as it arrives.
+    """
+
+    def __init__(
+        self,
+        streaming_client: StreamingTextToSpeechClient,
+        output_device: AudioDevice,
+    ) -> None:
+        """Initialize the VoiceResponderStreaming.
+
+        Args:
+            streaming_client: The client converting streamed text to audio.
+            output_device: The output device to speak to the user on.
+        """
+        self._streaming_client: StreamingTextToSpeechClient = streaming_client
+        self.output_device: AudioDevice = output_device
+
+    def respond(self, text_to_speak: Iterable[str]) -> None:
+        """Speak the text stream on the output device as it is generated.
+
+        Args:
+            text_to_speak: The text stream to speak.
+        """
+        pcm_player = PcmPlayer(self.output_device)
+
+        try:
+            for audio in self._streaming_client.stream(text_to_speak):
+                logger.debug(
+                    f"VoiceResponderStreaming received {audio.duration:.2f}s of audio"
+                )
+                pcm_player.play(audio)
+        except TextToSpeechError as e:
+            raise RespondError(f"Error streaming voice response: {e}") from e
+        finally:
+            pcm_player.close()
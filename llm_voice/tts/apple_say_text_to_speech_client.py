@@ -3,14 +3,25 @@
 import subprocess
 from pathlib import Path
 
+from llm_voice.interfaces.audio_format import AudioFormat, AudioSpec
 from llm_voice.tts.base import TextToSpeechClient
 from llm_voice.utils.logger import logger
 
+DEFAULT_PCM_SAMPLE_RATE = 22050
+# The default speaking rate of the built-in voices in words per minute.
+DEFAULT_WORDS_PER_MINUTE = 175
+
 
 class AppleSayTextToSpeechClient(TextToSpeechClient):
-    """Apple 'say' TTS CLI client that generates an AIFF file."""
+    """Apple 'say' TTS CLI client that generates an AIFF file.
+
+    WAV and PCM16 output write a 16-bit little endian WAV file instead.
+    """
 
     audio_extension = ".aiff"
+    supported_formats = (AudioFormat.AIFF, AudioFormat.WAV, AudioFormat.PCM16)
+    output_spec = AudioSpec(AudioFormat.AIFF)
+    supports_speaking_rate = True
 
     def convert_text_to_audio(
         self,
@@ -34,5 +45,25 @@ class AppleSayTextToSpeechClient(TextToSpeechClient):
             )
 
         cmd: list[str] = ["say", text_to_speak, "-o", str(audio_file_path)]
+
+        if self.output_spec.format != AudioFormat.AIFF:
+            cmd += [
+                "--file-format=WAVE",
+                f"--data-format=LEI16@{self.output_spec.sample_rate}",
+            ]
+
+        if self.speaking_rate != 1.0:
+            cmd += ["-r", str(round(DEFAULT_WORDS_PER_MINUTE * self.speaking_rate))]
+
         logger.debug(cmd)
         subprocess.call(cmd)
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        if audio_format == AudioFormat.AIFF:
+            return None
+
+        return sample_rate or DEFAULT_PCM_SAMPLE_RATE
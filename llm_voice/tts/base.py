@@ -1,13 +1,33 @@
 """Define the interface for text to speech clients."""
 
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 
+from llm_voice.interfaces.audio_format import AudioFormat, AudioSpec
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.tts.request_policy import RequestPolicy
+from llm_voice.utils.wav_file import parse_wav, to_wav_bytes, write_wav
+
 
 class TextToSpeechClient(ABC):
-    """Interface for text to speech clients."""
+    """Interface for text to speech clients.
+
+    Clients produce MP3 audio unless they list other entries in supported_formats,
+    in which case the output format can be changed with negotiate_format.
+    Clients that can change the speed of speech themselves set
+    supports_speaking_rate and apply speaking_rate to every request.
+    Network clients run their requests through request_policy, which bounds
+    them by the deadline set with llm_voice.tts.request_policy.request_deadline.
+    """
 
     audio_extension: str
+    supported_formats: tuple[AudioFormat, ...] = (AudioFormat.MP3,)
+    output_spec: AudioSpec = AudioSpec(AudioFormat.MP3)
+    supports_speaking_rate: bool = False
+    speaking_rate: float = 1.0
+    request_policy: RequestPolicy = RequestPolicy()
 
     @abstractmethod
     def convert_text_to_audio(
@@ -23,3 +43,165 @@ class TextToSpeechClient(ABC):
             audio_file_path: The path to save the audio file.
             force: Whether to overwrite the file if it already exists.
         """
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio in the negotiated output format.
+
+        PCM16 audio is returned as raw samples without a header. The default
+        implementation goes through a temporary file, clients that receive the
+        audio in memory override it.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The encoded audio.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            audio_file_path = Path(directory) / f"speech{self.audio_extension}"
+            self.convert_text_to_audio(text_to_speak, audio_file_path)
+            audio: bytes = audio_file_path.read_bytes()
+
+        if self.output_spec.format == AudioFormat.PCM16:
+            return parse_wav(audio)[0]
+
+        return audio
+
+    def negotiate_format(
+        self,
+        preferred_formats: Sequence[AudioFormat],
+        sample_rate: int | None = None,
+    ) -> AudioSpec:
+        """Switch to the first preferred format this client supports.
+
+        Args:
+            preferred_formats: The acceptable formats, most preferred first.
+            sample_rate: The preferred sample rate in Hz, None for the default.
+
+        Returns:
+            The output spec the client will produce from now on. The sample rate
+            may differ from the requested one when the provider does not offer it.
+
+        Raises:
+            ValueError: If none of the preferred formats are supported.
+        """
+        for audio_format in preferred_formats:
+            if audio_format in self.supported_formats:
+                self.output_spec = AudioSpec(
+                    format=audio_format,
+                    sample_rate=self._select_sample_rate(audio_format, sample_rate),
+                )
+                self.audio_extension = audio_format.extension
+                return self.output_spec
+
+        raise ValueError(
+            f"{type(self).__name__} supports {list(self.supported_formats)}, "
+            f"none of {list(preferred_formats)}.",
+        )
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        """Return the sample rate the provider will produce for the request.
+
+        Args:
+            audio_format: The negotiated format.
+            sample_rate: The preferred sample rate in Hz.
+
+        Returns:
+            The sample rate in Hz, None when chosen by the provider.
+        """
+        return sample_rate
+
+
+class PcmTextToSpeechClient(TextToSpeechClient):
+    """Interface for text to speech clients that synthesize raw PCM in memory."""
+
+    audio_extension = ".wav"
+    sample_rate: int
+    supported_formats = (AudioFormat.PCM16, AudioFormat.WAV)
+    output_spec = AudioSpec(AudioFormat.WAV)
+
+    @abstractmethod
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        """Convert the given text to mono 16-bit little endian PCM audio.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The PCM samples at the client's sample rate.
+        """
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio in the negotiated output format.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            Raw PCM samples for PCM16 and a WAV file otherwise.
+        """
+        pcm: bytes = self.synthesize_pcm(text_to_speak)
+
+        if self.output_spec.format == AudioFormat.PCM16:
+            return pcm
+
+        return to_wav_bytes(pcm, self.sample_rate)
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: str | Path,
+        force: bool = True,
+    ) -> None:
+        """Convert the given text to audio and save it as a WAV file.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+            audio_file_path: The path to save the audio file.
+            force: Whether to overwrite the file if it already exists.
+
+        Raises:
+            FileExistsError: If the audio file path already exists and force is false.
+        """
+        if isinstance(audio_file_path, str):
+            audio_file_path = Path(audio_file_path)
+
+        if audio_file_path.exists() and not force:
+            raise FileExistsError(
+                f"The audio file path already exists: {audio_file_path}",
+            )
+
+        write_wav(audio_file_path, self.synthesize_pcm(text_to_speak), self.sample_rate)
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        # The engine always synthesizes at the voice's native rate.
+        return self.sample_rate
+
+
+class StreamingTextToSpeechClient(ABC):
+    """Interface for clients that take text and return audio as it streams.
+
+    Streaming clients keep one request open for a whole response, so speech can
+    start before the text of the first sentence is complete.
+    """
+
+    sample_rate: int
+
+    @abstractmethod
+    def stream(self, text_chunks: Iterable[str]) -> Iterator[PcmAudio]:
+        """Speak text as it is produced and yield the audio as it arrives.
+
+        Args:
+            text_chunks: The text to speak, such as a chat completion stream.
+
+        Returns:
+            The mono PCM audio at sample_rate in the order it is spoken.
+        """
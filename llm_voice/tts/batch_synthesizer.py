@@ -0,0 +1,304 @@
+"""Define the BatchSynthesizer class.
+
+The batch synthesizer pre-renders large sets of prompts to audio files with any
+TextToSpeechClient. Items are rendered concurrently, requests can be rate
+limited to stay within provider quotas and every rendered item is recorded in a
+manifest in the output directory together with a hash of its text, voice,
+client settings and client options. Running the same batch again skips the items whose hash is
+unchanged, so an interrupted batch resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.interfaces.batch_item import (
+    BatchItem,
+    BatchProgress,
+    BatchResult,
+    BatchStatus,
+)
+from llm_voice.utils.logger import logger
+from llm_voice.utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from llm_voice.tts.base import TextToSpeechClient
+
+MANIFEST_FILE_NAME = ".llm-voice-batch.jsonl"
+
+
+def read_batch_items(path: str | Path) -> Iterator[BatchItem]:
+    """Read batch items from a JSONL or CSV file.
+
+    Each JSONL line and CSV row has an id and a text and may have a voice.
+
+    Args:
+        path: The file to read, CSV when it ends in .csv and JSONL otherwise.
+
+    Returns:
+        The items in file order.
+
+    Raises:
+        ValueError: If a row misses the id or text, or an id is repeated.
+    """
+    path = Path(path)
+    seen_ids: set[str] = set()
+
+    with path.open(newline="", encoding="utf-8") as file:
+        if path.suffix.lower() == ".csv":
+            rows: Iterable[dict[str, str]] = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+
+        for row_number, row in enumerate(rows, start=1):
+            if not row.get("id") or not row.get("text"):
+                raise ValueError(f"{path}: row {row_number} needs an id and a text.")
+
+            item = BatchItem(
+                id=str(row["id"]),
+                text=row["text"],
+                voice=row.get("voice") or None,
+            )
+
+            if item.id in seen_ids:
+                raise ValueError(f"{path}: duplicate id '{item.id}'.")
+
+            seen_ids.add(item.id)
+            yield item
+
+
+def output_stem(item_id: str) -> str:
+    """Get the file name, without extension, of a batch item's audio.
+
+    Args:
+        item_id: The id of the item.
+
+    Returns:
+        The id with characters that are unsafe in file names replaced.
+    """
+    return re.sub(r"[^\w.-]", "_", item_id)
+
+
+class BatchSynthesizer:
+    """Renders batches of prompts to audio files concurrently and resumably."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[str | None], TextToSpeechClient],
+        output_directory: str | Path,
+        *,
+        concurrency: int = 4,
+        requests_per_second: float | None = None,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+        client_options: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Create a new BatchSynthesizer instance.
+
+        Args:
+            client_factory: Function returning the client for a voice, or for
+                the default voice when given None. It is called once per voice.
+            output_directory: The directory the audio files are written to.
+            concurrency: The number of items rendered at the same time.
+            requests_per_second: The maximum rate of requests to the provider,
+                None for no limit.
+            on_progress: Optional function called after every finished item.
+            client_options: The options the clients are created with, such as
+                the model. They are part of every item's hash, so items are
+                rendered again when they change.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        self._client_factory: Callable[[str | None], TextToSpeechClient] = (
+            client_factory
+        )
+        self._output_directory = Path(output_directory)
+        self._concurrency: int = concurrency
+        self._rate_limiter: RateLimiter | None = (
+            None
+            if requests_per_second is None
+            else RateLimiter(requests_per_second, burst=concurrency)
+        )
+        self._on_progress: Callable[[BatchProgress], None] | None = on_progress
+        self._client_options: dict[str, Any] = dict(client_options or {})
+        self._clients: dict[str | None, TextToSpeechClient] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> Path:
+        """The manifest of the rendered items in the output directory."""
+        return self._output_directory / MANIFEST_FILE_NAME
+
+    def render(self, items: Iterable[BatchItem]) -> Iterator[BatchResult]:
+        """Render the items that have not been rendered with the same settings.
+
+        Items are read lazily and at most twice the concurrency are in flight,
+        so memory stays flat for large inputs.
+
+        Args:
+            items: The items to render.
+
+        Returns:
+            The results in completion order.
+        """
+        self._output_directory.mkdir(parents=True, exist_ok=True)
+        rendered: dict[str, str] = self._read_manifest()
+        started: float = time.monotonic()
+        counts: dict[BatchStatus, int] = dict.fromkeys(BatchStatus, 0)
+        characters: int = 0
+        pending: set[Future[BatchResult]] = set()
+        item_iterator: Iterator[BatchItem] = iter(items)
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            while True:
+                for item in item_iterator:
+                    pending.add(executor.submit(self._render_item, item, rendered))
+
+                    if len(pending) >= self._concurrency * 2:
+                        break
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    result: BatchResult = future.result()
+                    counts[result.status] += 1
+
+                    if result.status == BatchStatus.RENDERED:
+                        characters += len(result.item.text)
+
+                    if self._on_progress is not None:
+                        self._on_progress(
+                            BatchProgress(
+                                completed=sum(counts.values()),
+                                rendered=counts[BatchStatus.RENDERED],
+                                skipped=counts[BatchStatus.SKIPPED],
+                                failed=counts[BatchStatus.FAILED],
+                                elapsed=time.monotonic() - started,
+                                characters=characters,
+                            )
+                        )
+
+                    yield result
+
+    def run(self, items: Iterable[BatchItem]) -> list[BatchResult]:
+        """Render the items and wait for the batch to finish.
+
+        Args:
+            items: The items to render.
+
+        Returns:
+            The results in completion order.
+        """
+        return list(self.render(items))
+
+    def _render_item(self, item: BatchItem, rendered: dict[str, str]) -> BatchResult:
+        started: float = time.monotonic()
+        content_hash: str = ""
+        partial_path: Path | None = None
+
+        try:
+            client: TextToSpeechClient = self._get_client(item.voice)
+            content_hash = self._hash(item, client)
+            path = self._output_directory / (
+                output_stem(item.id) + client.audio_extension
+            )
+
+            if rendered.get(item.id) == content_hash and path.exists():
+                return BatchResult(item, BatchStatus.SKIPPED, path, content_hash)
+
+            # Written next to the output and moved into place once complete, so
+            # a failed item never leaves a file that looks rendered.
+            partial_path = path.with_name(f".{path.stem}.partial{path.suffix}")
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            client.convert_text_to_audio(item.text, partial_path)
+            os.replace(partial_path, path)
+            self._record(item, content_hash, path)
+            return BatchResult(
+                item,
+                BatchStatus.RENDERED,
+                path,
+                content_hash,
+                duration=time.monotonic() - started,
+            )
+        except Exception as e:  # noqa: BLE001
+            # Only some clients wrap their SDK errors in TextToSpeechError, and
+            # creating one fails with ValueError without credentials. Either
+            # way only this item fails, the rest of the batch still renders.
+            logger.warning(f"BatchSynthesizer: failed to render '{item.id}': {e}")
+
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+
+            return BatchResult(
+                item,
+                BatchStatus.FAILED,
+                None,
+                content_hash,
+                duration=time.monotonic() - started,
+                error=str(e),
+            )
+
+    def _get_client(self, voice: str | None) -> TextToSpeechClient:
+        with self._lock:
+            if voice not in self._clients:
+                self._clients[voice] = self._client_factory(voice)
+
+            return self._clients[voice]
+
+    def _hash(self, item: BatchItem, client: TextToSpeechClient) -> str:
+        """Hash everything that changes the rendered audio of the item."""
+        settings: dict[str, object] = {
+            "text": item.text,
+            "voice": item.voice,
+            "client": type(client).__name__,
+            "format": client.output_spec.format.value,
+            "sample_rate": client.output_spec.sample_rate,
+            "speaking_rate": client.speaking_rate,
+            "options": self._client_options,
+        }
+        return hashlib.sha256(
+            json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def _read_manifest(self) -> dict[str, str]:
+        """Read the content hash of every rendered item, later entries win."""
+        if not self.manifest_path.exists():
+            return {}
+
+        rendered: dict[str, str] = {}
+
+        with self.manifest_path.open(encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    entry: dict[str, str] = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by an interrupted run.
+                    continue
+
+                rendered[entry["id"]] = entry["hash"]
+
+        return rendered
+
+    def _record(self, item: BatchItem, content_hash: str, path: Path) -> None:
+        entry: str = json.dumps(
+            {"id": item.id, "hash": content_hash, "path": path.name}
+        )
+
+        with self._lock, self.manifest_path.open("a", encoding="utf-8") as manifest:
+            manifest.write(entry + "\n")
@@ -0,0 +1,280 @@
+"""Define the ElevenLabsStreamingClient class.
+
+The ElevenLabs stream-input WebSocket accepts text as it is written and sends
+audio back while more text is arriving. Feeding it the chat completion stream
+directly removes the wait for a full sentence before synthesis starts.
+
+The server starts generating once it has buffered the next length of the chunk
+length schedule, and generates whatever it has buffered when a chunk is sent
+with flush set. Flushing at natural breaks such as line ends gets audio out
+sooner without cutting sentences short.
+
+Example:
+    client = ElevenLabsStreamingClient()
+    for audio in client.stream(llm_client.generate_chat_completion_stream(...)):
+        pcm_player.play(audio)
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.tts.base import StreamingTextToSpeechClient
+from llm_voice.tts.eleven_labs_text_to_speech_client import (
+    DEFAULT_PCM_SAMPLE_RATE,
+    PCM_SAMPLE_RATES,
+)
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from websockets.sync.client import ClientConnection
+
+BASE_URL = "wss://api.elevenlabs.io/v1/text-to-speech"
+DEFAULT_MODEL_ID = "eleven_turbo_v2"
+DEFAULT_CHUNK_LENGTH_SCHEDULE: tuple[int, ...] = (120, 160, 250, 290)
+DEFAULT_FLUSH_PATTERN = r"\n"
+
+
+class ElevenLabsStreamingClient(StreamingTextToSpeechClient):
+    """Eleven Labs client that streams text in and PCM audio out over a WebSocket.
+
+    Requires the websockets package, installed with the elevenlabs-streaming
+    extra.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        *,
+        model_id: str = DEFAULT_MODEL_ID,
+        sample_rate: int = DEFAULT_PCM_SAMPLE_RATE,
+        chunk_length_schedule: Sequence[int] = DEFAULT_CHUNK_LENGTH_SCHEDULE,
+        flush_pattern: str | None = DEFAULT_FLUSH_PATTERN,
+        voice_settings: dict[str, Any] | None = None,
+        base_url: str = BASE_URL,
+        connect_timeout: float = 10.0,
+        receive_timeout: float = 20.0,
+    ) -> None:
+        """Create a new ElevenLabsStreamingClient instance.
+
+        Args:
+            api_key: The API key, defaults to the ELEVEN_LABS_API_KEY env var.
+            voice_id: The voice to speak with.
+            model_id: The model to synthesize with.
+            sample_rate: The sample rate of the PCM audio.
+            chunk_length_schedule: The number of buffered characters the server
+                waits for before generating the first, second and later chunks.
+            flush_pattern: Regular expression matched against every text chunk,
+                a match makes the server generate the buffered text right away.
+                None to only flush at the end of the stream.
+            voice_settings: Optional stability and similarity settings.
+            base_url: The text to speech WebSocket URL, changed to test against
+                a local server.
+            connect_timeout: The maximum seconds to wait for the connection.
+            receive_timeout: The maximum seconds to wait for the next message.
+        """
+        if api_key is None:
+            api_key = os.environ.get("ELEVEN_LABS_API_KEY")
+
+        if api_key is None:
+            raise ValueError(
+                "Expected api_key parameter or ELEVEN_LABS_API_KEY env var to be set.",
+            )
+
+        if sample_rate not in PCM_SAMPLE_RATES:
+            raise ValueError(
+                f"sample_rate must be one of {PCM_SAMPLE_RATES}, got {sample_rate}.",
+            )
+
+        self._api_key: str = api_key
+        self._voice_id: str = voice_id
+        self._model_id: str = model_id
+        self.sample_rate: int = sample_rate
+        self._chunk_length_schedule: list[int] = list(chunk_length_schedule)
+        self._flush_pattern: re.Pattern[str] | None = (
+            None if flush_pattern is None else re.compile(flush_pattern)
+        )
+        self._voice_settings: dict[str, Any] | None = voice_settings
+        self._base_url: str = base_url.rstrip("/")
+        self._connect_timeout: float = connect_timeout
+        self._receive_timeout: float = receive_timeout
+
+    @property
+    def url(self) -> str:
+        """The stream-input URL of the voice."""
+        return (
+            f"{self._base_url}/{self._voice_id}/stream-input"
+            f"?model_id={self._model_id}&output_format=pcm_{self.sample_rate}"
+        )
+
+    def stream(self, text_chunks: Iterable[str]) -> Iterator[PcmAudio]:
+        """Speak text as it is produced and yield the audio as it arrives.
+
+        The text is sent from a background thread, so a slow text stream does
+        not hold up the audio already generated.
+
+        Args:
+            text_chunks: The text to speak, such as a chat completion stream.
+
+        Returns:
+            The PCM audio in the order it is spoken.
+
+        Raises:
+            TextToSpeechTimeoutError: If connecting or the next message took
+                too long.
+            TextToSpeechError: If the connection failed or the server sent an
+                error.
+            Exception: The error raised by text_chunks, unchanged.
+        """
+        from websockets.exceptions import WebSocketException
+
+        connection: ClientConnection = self._connect()
+        sender_errors: list[Exception] = []
+        sender = threading.Thread(
+            target=self._send_text,
+            args=(connection, text_chunks, sender_errors),
+            name="elevenlabs-sender",
+            daemon=True,
+        )
+        sender.start()
+
+        try:
+            while True:
+                try:
+                    message: str | bytes = connection.recv(self._receive_timeout)
+                except TimeoutError as e:
+                    raise TextToSpeechTimeoutError(
+                        "Timed out waiting for ElevenLabs audio."
+                    ) from e
+                except WebSocketException as e:
+                    if sender_errors:
+                        raise sender_errors[0] from e
+
+                    raise TextToSpeechError(
+                        f"ElevenLabs stream failed: {e}",
+                        retryable=True,
+                    ) from e
+
+                response: dict[str, Any] = json.loads(message)
+
+                if response.get("error"):
+                    raise TextToSpeechError(
+                        f"ElevenLabs stream failed: {response.get('message')}",
+                    )
+
+                if response.get("audio"):
+                    yield PcmAudio(
+                        base64.b64decode(response["audio"]), self.sample_rate
+                    )
+
+                if response.get("isFinal"):
+                    break
+        finally:
+            # The sender stops at its next send once the connection is closed.
+            connection.close()
+
+        sender.join()
+
+        if sender_errors:
+            raise sender_errors[0]
+
+    def _connect(self) -> ClientConnection:
+        from websockets.exceptions import WebSocketException
+        from websockets.sync.client import connect
+
+        logger.debug(f"ElevenLabsStreamingClient connecting to {self.url}")
+
+        try:
+            return connect(
+                self.url,
+                additional_headers={"xi-api-key": self._api_key},
+                open_timeout=self._connect_timeout,
+            )
+        except TimeoutError as e:
+            raise TextToSpeechTimeoutError("Timed out connecting to ElevenLabs.") from e
+        except (OSError, WebSocketException) as e:
+            raise TextToSpeechError(
+                f"Unable to connect to ElevenLabs: {e}",
+                retryable=True,
+            ) from e
+
+    def _send_text(
+        self,
+        connection: ClientConnection,
+        text_chunks: Iterable[str],
+        errors: list[Exception],
+    ) -> None:
+        """Send the text chunks followed by the end of stream message.
+
+        An error raised by the text stream is added to errors as it is, an
+        error sending the text is added as a TextToSpeechError.
+        """
+        from websockets.exceptions import ConnectionClosed, WebSocketException
+
+        start: dict[str, Any] = {
+            # The first message must contain a single space.
+            "text": " ",
+            "generation_config": {
+                "chunk_length_schedule": self._chunk_length_schedule,
+            },
+        }
+
+        if self._voice_settings is not None:
+            start["voice_settings"] = self._voice_settings
+
+        try:
+            connection.send(json.dumps(start))
+
+            for text in _read_text(text_chunks, errors):
+                if not text:
+                    continue
+
+                message: dict[str, Any] = {"text": text}
+
+                if self._flush_pattern is not None and self._flush_pattern.search(text):
+                    message["flush"] = True
+
+                connection.send(json.dumps(message))
+
+            if errors:
+                # Closing wakes the receiving side, which raises the error.
+                connection.close()
+                return
+
+            connection.send(json.dumps({"text": ""}))
+        except ConnectionClosed:
+            # The receiving side reports why the connection closed.
+            pass
+        except (OSError, WebSocketException) as e:
+            errors.append(
+                TextToSpeechError(
+                    f"Unable to send text to ElevenLabs: {e}",
+                    retryable=True,
+                )
+            )
+            connection.close()
+
+
+def _read_text(
+    text_chunks: Iterable[str], text_errors: list[Exception]
+) -> Iterator[str]:
+    """Yield the text chunks, an error of the text stream ends the iteration.
+
+    The error is added to text_errors instead of being raised.
+    """
+    try:
+        yield from text_chunks
+    except Exception as e:  # noqa: BLE001
+        # The text stream is the caller's, such as a chat completion stream,
+        # and stream re-raises its error unchanged on the caller's thread.
+        text_errors.append(e)
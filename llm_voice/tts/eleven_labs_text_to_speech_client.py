@@ -1,29 +1,52 @@
 """Define the ElevenLabsTextToSpeechClient class."""
 
+from __future__ import annotations
+
 import json
 import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
-
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.audio_format import AudioFormat
 from llm_voice.tts.base import TextToSpeechClient
+from llm_voice.tts.request_policy import validate_audio_response
 from llm_voice.utils.logger import logger
+from llm_voice.utils.wav_file import write_wav
+
+if TYPE_CHECKING:
+    import requests
 
 # Matilda voice.
 DEFAULT_VOICE_ID = "XrExE9yKIg1WjnnlVkGX"
 
+PCM_SAMPLE_RATES: tuple[int, ...] = (16000, 22050, 24000, 44100)
+DEFAULT_PCM_SAMPLE_RATE = 24000
+MP3_OUTPUT_FORMAT = "mp3_44100_128"
+BASE_URL = "https://api.elevenlabs.io"
+
 
 class ElevenLabsTextToSpeechClient(TextToSpeechClient):
     """Eleven Labs Text to Speech API Client that converts a string to a mp3 file."""
 
     audio_extension = ".mp3"
+    supported_formats = (AudioFormat.PCM16, AudioFormat.MP3)
 
     def __init__(
         self,
         api_key: str | None = None,
         voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        base_url: str = BASE_URL,
     ) -> None:
-        """Create a new ElevenLabsTextToSpeechClient instance."""
+        """Create a new ElevenLabsTextToSpeechClient instance.
+
+        Args:
+            api_key: The API key, defaults to the ELEVEN_LABS_API_KEY env var.
+            voice_id: The voice to speak with.
+            base_url: The URL of the API, changed to test against a local server.
+        """
         if api_key is None:
             api_key = os.environ.get("ELEVEN_LABS_API_KEY")
 
@@ -34,6 +57,9 @@ class ElevenLabsTextToSpeechClient(TextToSpeechClient):
 
         self._api_key: str = api_key
         self._voice_id: str = voice_id
+        self._base_url: str = base_url.rstrip("/")
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
 
     def convert_text_to_audio(
         self,
@@ -59,36 +85,125 @@ class ElevenLabsTextToSpeechClient(TextToSpeechClient):
                 f"The audio file path already exists: {audio_file_path}",
             )
 
-        response: requests.Response = requests.post(
-            url=f"https://api.elevenlabs.io/v1/text-to-speech/{self._voice_id}?optimize_streaming_latency=1",
-            timeout=10,
-            headers={
-                "xi-api-key": self._api_key,
-                "Content-Type": "application/json",
-                "accept": "audio/mpeg",
-            },
-            json={
-                "text": text_to_speak,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0,
-                    "similarity_boost": 0,
+        audio: bytes = self.synthesize(text_to_speak)
+
+        with audio_file_path.open("wb") as out:
+            if self.output_spec.format == AudioFormat.PCM16:
+                assert self.output_spec.sample_rate is not None
+                write_wav(out, audio, self.output_spec.sample_rate)
+            else:
+                # Write the response to the output file.
+                out.write(audio)
+
+            logger.info(f'Audio content written to file "{audio_file_path}"')
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio in the negotiated output format.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            Raw PCM samples for PCM16 and MP3 audio otherwise.
+
+        Raises:
+            TextToSpeechError: If the request failed or did not return audio.
+        """
+        return self.request_policy.call(
+            lambda timeout: self._post_speech(text_to_speak, timeout)
+        )
+
+    def _post_speech(self, text_to_speak: str, timeout: float) -> bytes:
+        if self.output_spec.format == AudioFormat.PCM16:
+            output_format: str = f"pcm_{self.output_spec.sample_rate}"
+            accept = "audio/pcm"
+        else:
+            output_format = MP3_OUTPUT_FORMAT
+            accept = "audio/mpeg"
+
+        import requests
+
+        try:
+            response: requests.Response = self._get_session().post(
+                url=f"{self._base_url}/v1/text-to-speech/{self._voice_id}",
+                params={
+                    "optimize_streaming_latency": 1,
+                    "output_format": output_format,
+                },
+                timeout=timeout,
+                headers={
+                    "xi-api-key": self._api_key,
+                    "Content-Type": "application/json",
+                    "accept": accept,
+                },
+                json={
+                    "text": text_to_speak,
+                    "model_id": "eleven_monolingual_v1",
+                    "voice_settings": {
+                        "stability": 0,
+                        "similarity_boost": 0,
+                    },
                 },
-            },
+            )
+        except requests.Timeout as e:
+            raise TextToSpeechTimeoutError(f"ElevenLabs request timed out: {e}") from e
+        except requests.RequestException as e:
+            raise TextToSpeechError(
+                f"ElevenLabs request failed: {e}",
+                retryable=True,
+            ) from e
+
+        validate_audio_response(
+            response.status_code,
+            response.headers.get("Content-Type"),
+            response.content,
         )
 
         # The response's audio_content is binary.
-        with audio_file_path.open("wb") as out:
-            # Write the response to the output file.
-            out.write(response.content)
-            logger.info(f'Audio content written to file "{audio_file_path}"')
+        return response.content
 
     def get_voices(self) -> dict:
-        response: requests.Response = requests.get(
-            "https://api.elevenlabs.io/v1/voices",
+        response: requests.Response = self._get_session().get(
+            f"{self._base_url}/v1/voices",
             headers={"xi-api-key": self._api_key},
             timeout=5,
         )
 
         response_json: dict = json.loads(response.content)
         return response_json
+
+    def close(self) -> None:
+        """Close the shared session and its connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self) -> requests.Session:
+        import requests
+
+        # Shared by every request, so connections are kept alive between
+        # sentences.
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+
+            return self._session
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        if audio_format != AudioFormat.PCM16:
+            return None
+
+        if sample_rate is None:
+            return DEFAULT_PCM_SAMPLE_RATE
+
+        # Prefer the lowest offered rate that does not down-sample the request.
+        for offered_rate in PCM_SAMPLE_RATES:
+            if offered_rate >= sample_rate:
+                return offered_rate
+
+        return PCM_SAMPLE_RATES[-1]
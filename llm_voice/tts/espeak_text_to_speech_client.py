@@ -0,0 +1,172 @@
+"""Define the EspeakTextToSpeechClient class.
+
+espeak-ng (https://github.com/espeak-ng/espeak-ng) is a small formant speech
+synthesizer available on every Linux distribution (`apt install libespeak-ng1`).
+The shared library is loaded into the current process once and reused for every
+sentence, so synthesis needs neither a network round-trip nor a process spawn.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import threading
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.tts.base import PcmTextToSpeechClient
+
+# Constants from espeak-ng/speak_lib.h.
+AUDIO_OUTPUT_SYNCHRONOUS = 2
+POS_CHARACTER = 1
+ESPEAK_CHARS_UTF8 = 1
+ESPEAK_RATE = 1
+EE_OK = 0
+
+SynthCallback = ctypes.CFUNCTYPE(
+    ctypes.c_int,
+    ctypes.POINTER(ctypes.c_short),
+    ctypes.c_int,
+    ctypes.c_void_p,
+)
+
+
+class _EspeakLibrary:
+    """Process wide handle to libespeak-ng, which keeps global synthesis state."""
+
+    _instance: _EspeakLibrary | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        library_name: str | None = ctypes.util.find_library("espeak-ng")
+
+        try:
+            self._lib = ctypes.CDLL(library_name or "libespeak-ng.so.1")
+        except OSError as e:
+            raise TextToSpeechError(
+                "Unable to load libespeak-ng, install it with "
+                "`apt install libespeak-ng1`.",
+            ) from e
+
+        self._lib.espeak_Initialize.restype = ctypes.c_int
+        self._lib.espeak_Initialize.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+        ]
+        self._lib.espeak_SetSynthCallback.argtypes = [SynthCallback]
+        self._lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        self._lib.espeak_SetParameter.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+        ]
+        self._lib.espeak_Synth.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_uint,
+            ctypes.c_uint,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+
+        self.sample_rate: int = self._lib.espeak_Initialize(
+            AUDIO_OUTPUT_SYNCHRONOUS,
+            0,
+            None,
+            0,
+        )
+
+        if self.sample_rate <= 0:
+            raise TextToSpeechError("Unable to initialize libespeak-ng.")
+
+        self._buffer = bytearray()
+        # Keep a reference to the callback so it is not garbage collected.
+        self._callback = SynthCallback(self._on_samples)
+        self._lib.espeak_SetSynthCallback(self._callback)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> _EspeakLibrary:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+
+            return cls._instance
+
+    def synthesize(
+        self, text_to_speak: str, voice: str, words_per_minute: int
+    ) -> bytes:
+        text: bytes = text_to_speak.encode("utf-8") + b"\0"
+
+        with self.lock:
+            self._buffer = bytearray()
+
+            if self._lib.espeak_SetVoiceByName(voice.encode("utf-8")) != EE_OK:
+                raise TextToSpeechError(f"Unknown espeak-ng voice: {voice}")
+
+            self._lib.espeak_SetParameter(ESPEAK_RATE, words_per_minute, 0)
+            error: int = self._lib.espeak_Synth(
+                text,
+                len(text),
+                0,
+                POS_CHARACTER,
+                0,
+                ESPEAK_CHARS_UTF8,
+                None,
+                None,
+            )
+
+            if error != EE_OK:
+                raise TextToSpeechError(f"espeak-ng synthesis failed with {error}.")
+
+            return bytes(self._buffer)
+
+    def _on_samples(
+        self,
+        wav: ctypes._Pointer[ctypes.c_short],
+        sample_count: int,
+        _events: int | None,
+    ) -> int:
+        if wav and sample_count > 0:
+            self._buffer += ctypes.string_at(wav, sample_count * 2)
+
+        return 0
+
+
+class EspeakTextToSpeechClient(PcmTextToSpeechClient):
+    """espeak-ng TTS client that synthesizes raw PCM through the in-process library."""
+
+    supports_speaking_rate = True
+
+    def __init__(self, voice: str = "en-us", words_per_minute: int = 175) -> None:
+        """Create a new EspeakTextToSpeechClient instance.
+
+        Args:
+            voice: The espeak-ng voice name.
+            words_per_minute: The speaking rate in words per minute.
+
+        Raises:
+            TextToSpeechError: If libespeak-ng can not be loaded.
+        """
+        self._library: _EspeakLibrary = _EspeakLibrary.get()
+        self._voice: str = voice
+        self._words_per_minute: int = words_per_minute
+        self.sample_rate: int = self._library.sample_rate
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        """Convert the given text to mono 16-bit little endian PCM audio.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The PCM samples at the library's sample rate.
+        """
+        return self._library.synthesize(
+            text_to_speak,
+            self._voice,
+            round(self._words_per_minute * self.speaking_rate),
+        )
@@ -0,0 +1,206 @@
+"""Define the GoogleCloudStreamingClient class.
+
+The streaming_synthesize call of Google Cloud Text to Speech keeps one
+bidirectional gRPC stream open for a whole response. Text is sent as the chat
+completion produces it and audio comes back while the rest is still being
+written. The stream runs over the process wide channel of the endpoint shared
+with GoogleCloudTextToSpeechClient.
+
+Only the voices that support streaming, such as the Chirp 3 HD and Journey
+voices, can be used.
+
+Example:
+    client = GoogleCloudStreamingClient(voice_name="en-US-Chirp3-HD-Charon")
+    for audio in client.stream(llm_client.generate_chat_completion_stream(...)):
+        pcm_player.play(audio)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.tts.base import StreamingTextToSpeechClient
+from llm_voice.tts.google_cloud_text_to_speech_client import (
+    DEFAULT_LANGUAGE_CODE,
+    DEFAULT_PCM_SAMPLE_RATE,
+    get_text_to_speech_client,
+)
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from google.cloud import texttospeech
+
+DEFAULT_STREAMING_VOICE_NAME = "en-US-Chirp3-HD-Charon"
+# Text is sent a sentence or clause at a time, which keeps the prosody natural.
+DEFAULT_CHUNK_PATTERN = r"[.!?,;:\n]\s*$"
+
+
+class GoogleCloudStreamingClient(StreamingTextToSpeechClient):
+    """Google Cloud client that streams text in and audio out over gRPC."""
+
+    def __init__(
+        self,
+        voice_name: str = DEFAULT_STREAMING_VOICE_NAME,
+        language_code: str = DEFAULT_LANGUAGE_CODE,
+        *,
+        speaking_rate: float = 1.0,
+        audio_encoding: str = "PCM",
+        sample_rate: int = DEFAULT_PCM_SAMPLE_RATE,
+        chunk_pattern: str | None = DEFAULT_CHUNK_PATTERN,
+        api_endpoint: str | None = None,
+        insecure: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Create a new GoogleCloudStreamingClient instance.
+
+        Args:
+            voice_name: The name of a voice that supports streaming.
+            language_code: The language of the voice.
+            speaking_rate: The speed of speech, from 0.25 to 2.0.
+            audio_encoding: The name of the texttospeech.AudioEncoding of the
+                audio, PCM for raw samples. stream() needs PCM, other encodings
+                are read with stream_audio().
+            sample_rate: The sample rate of the audio.
+            chunk_pattern: Regular expression matched against the buffered
+                text, which is sent once it matches. None sends every chunk as
+                it arrives.
+            api_endpoint: The host and port of the API, None for Google's endpoint.
+            insecure: Whether to connect without TLS or credentials, for a local
+                stand-in server.
+            timeout: The maximum seconds of a whole stream, None for no limit.
+        """
+        self._voice_name: str = voice_name
+        self._language_code: str = language_code
+        self.speaking_rate: float = speaking_rate
+        self._audio_encoding: str = audio_encoding
+        self.sample_rate: int = sample_rate
+        self._chunk_pattern: re.Pattern[str] | None = (
+            None if chunk_pattern is None else re.compile(chunk_pattern)
+        )
+        self._api_endpoint: str | None = api_endpoint
+        self._insecure: bool = insecure
+        self._timeout: float | None = timeout
+
+    def stream(self, text_chunks: Iterable[str]) -> Iterator[PcmAudio]:
+        """Speak text as it is produced and yield the PCM audio as it arrives.
+
+        Args:
+            text_chunks: The text to speak, such as a chat completion stream.
+
+        Returns:
+            The PCM audio in the order it is spoken.
+
+        Raises:
+            ValueError: If the audio encoding is not PCM.
+            TextToSpeechTimeoutError: If the stream took longer than the timeout.
+            TextToSpeechError: If the stream failed.
+        """
+        if self._audio_encoding != "PCM":
+            raise ValueError(
+                f"stream() needs PCM audio, use stream_audio() for "
+                f"{self._audio_encoding}."
+            )
+
+        for audio in self.stream_audio(text_chunks):
+            yield PcmAudio(audio, self.sample_rate)
+
+    def stream_audio(self, text_chunks: Iterable[str]) -> Iterator[bytes]:
+        """Speak text as it is produced and yield the encoded audio as it arrives.
+
+        Args:
+            text_chunks: The text to speak, such as a chat completion stream.
+
+        Returns:
+            The audio chunks in the configured encoding.
+
+        Raises:
+            TextToSpeechTimeoutError: If the stream took longer than the timeout.
+            TextToSpeechError: If the stream failed.
+        """
+        from google.api_core import exceptions
+
+        client: texttospeech.TextToSpeechClient = get_text_to_speech_client(
+            self._api_endpoint,
+            self._insecure,
+        )
+        logger.debug(f"GoogleCloudStreamingClient streaming with {self._voice_name}")
+        text_errors: list[Exception] = []
+
+        try:
+            # gRPC pulls the requests from the iterator on its own thread.
+            for response in client.streaming_synthesize(
+                self._requests(text_chunks, text_errors),
+                timeout=self._timeout,
+                retry=None,
+            ):
+                if response.audio_content:
+                    yield response.audio_content
+        except exceptions.GoogleAPIError as e:
+            # A failing text stream cancels the call, report its error instead.
+            if text_errors:
+                raise text_errors[0] from e
+
+            if isinstance(e, exceptions.DeadlineExceeded):
+                raise TextToSpeechTimeoutError(
+                    f"Google Cloud stream timed out: {e}"
+                ) from e
+
+            if not isinstance(e, exceptions.GoogleAPICallError):
+                raise TextToSpeechError(f"Google Cloud stream failed: {e}") from e
+
+            raise TextToSpeechResponseError(
+                f"Google Cloud stream failed: {e}",
+                status_code=e.code,
+            ) from e
+
+    def _requests(
+        self,
+        text_chunks: Iterable[str],
+        text_errors: list[Exception],
+    ) -> Iterator[texttospeech.StreamingSynthesizeRequest]:
+        """Yield the configuration followed by the text in chunk_pattern pieces.
+
+        An error raised by the text stream is added to text_errors.
+        """
+        from google.cloud import texttospeech
+
+        yield texttospeech.StreamingSynthesizeRequest(
+            streaming_config=texttospeech.StreamingSynthesizeConfig(
+                voice=texttospeech.VoiceSelectionParams(
+                    language_code=self._language_code,
+                    name=self._voice_name,
+                ),
+                streaming_audio_config=texttospeech.StreamingAudioConfig(
+                    audio_encoding=texttospeech.AudioEncoding[self._audio_encoding],
+                    sample_rate_hertz=self.sample_rate,
+                    speaking_rate=self.speaking_rate,
+                ),
+            ),
+        )
+        text: str = ""
+
+        try:
+            for chunk in text_chunks:
+                text += chunk
+
+                if self._chunk_pattern is None or self._chunk_pattern.search(text):
+                    if text.strip():
+                        yield texttospeech.StreamingSynthesizeRequest(
+                            input=texttospeech.StreamingSynthesisInput(text=text),
+                        )
+
+                    text = ""
+        except Exception as e:
+            text_errors.append(e)
+            raise
+
+        if text.strip():
+            yield texttospeech.StreamingSynthesizeRequest(
+                input=texttospeech.StreamingSynthesisInput(text=text),
+            )
@@ -12,23 +12,109 @@ can be seen below:
 5. You might need to set a quota project if you don't have one already.
     * gcloud auth application-default set-quota-project <PROJECT_ID>
 5. Set the env variable GOOGLE_APPLICATION_CREDENTIALS to the path of the JSON file.
+
+All clients of an endpoint share one SDK client, and with it one gRPC channel,
+for the lifetime of the process, so requests after the first skip the
+connection and TLS setup.
 """
 
-from pathlib import Path
+from __future__ import annotations
 
-from google.cloud import texttospeech
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.audio_format import AudioFormat
 from llm_voice.tts.base import TextToSpeechClient
 from llm_voice.utils.logger import logger
+from llm_voice.utils.wav_file import parse_wav
+
+if TYPE_CHECKING:
+    from google.cloud import texttospeech
+
+# Names of texttospeech.AudioEncoding members, the SDK is imported on first use.
+AUDIO_ENCODINGS: dict[AudioFormat, str] = {
+    # LINEAR16 responses are WAV files, the header is removed for raw PCM.
+    AudioFormat.PCM16: "LINEAR16",
+    AudioFormat.WAV: "LINEAR16",
+    AudioFormat.OPUS: "OGG_OPUS",
+    AudioFormat.MP3: "MP3",
+}
+DEFAULT_PCM_SAMPLE_RATE = 24000
+DEFAULT_LANGUAGE_CODE = "en-US"
+DEFAULT_VOICE_NAME = "en-US-Standard-J"
+
+
+@functools.cache
+def get_text_to_speech_client(
+    api_endpoint: str | None = None,
+    insecure: bool = False,
+) -> texttospeech.TextToSpeechClient:
+    """Get the process wide SDK client of an endpoint.
+
+    Args:
+        api_endpoint: The host and port of the API, None for Google's endpoint.
+        insecure: Whether to connect without TLS or credentials, for a local
+            stand-in server.
+
+    Returns:
+        The client, created on first use.
+    """
+    from google.cloud import texttospeech
+
+    if not insecure:
+        client_options: dict[str, str] = (
+            {} if api_endpoint is None else {"api_endpoint": api_endpoint}
+        )
+        return texttospeech.TextToSpeechClient(client_options=client_options)
+
+    import grpc
+    from google.cloud.texttospeech_v1.services.text_to_speech.transports import (
+        TextToSpeechGrpcTransport,
+    )
+
+    if api_endpoint is None:
+        raise ValueError("An insecure connection needs an api_endpoint.")
+
+    return texttospeech.TextToSpeechClient(
+        transport=TextToSpeechGrpcTransport(
+            channel=grpc.insecure_channel(api_endpoint),
+        ),
+    )
 
 
 class GoogleCloudTextToSpeechClient(TextToSpeechClient):
     """Google Text to Speech API Client that converts a string to a mp3 file."""
 
     audio_extension = ".mp3"
+    supported_formats = tuple(AUDIO_ENCODINGS)
+    supports_speaking_rate = True
+
+    def __init__(
+        self,
+        speaking_rate: float = 1.2,
+        voice_name: str = DEFAULT_VOICE_NAME,
+        language_code: str = DEFAULT_LANGUAGE_CODE,
+        api_endpoint: str | None = None,
+        insecure: bool = False,
+    ) -> None:
+        """Create a new GoogleTextToSpeechClient instance.
 
-    def __init__(self) -> None:
-        """Create a new GoogleTextToSpeechClient instance."""
+        Args:
+            speaking_rate: The speed of speech, from 0.25 to 4.0.
+            voice_name: The name of the voice.
+            language_code: The language of the voice.
+            api_endpoint: The host and port of the API, None for Google's endpoint.
+            insecure: Whether to connect without TLS or credentials, for a local
+                stand-in server.
+        """
+        self.speaking_rate: float = speaking_rate
+        self._voice_name: str = voice_name
+        self._language_code: str = language_code
+        self._api_endpoint: str | None = api_endpoint
+        self._insecure: bool = insecure
 
     def convert_text_to_audio(
         self,
@@ -54,29 +140,89 @@ class GoogleCloudTextToSpeechClient(TextToSpeechClient):
                 f"The audio file path already exists: {audio_file_path}",
             )
 
-        client = texttospeech.TextToSpeechClient()
+        # LINEAR16 responses keep their WAV header in files so they stay playable.
+        audio: bytes = self._synthesize_speech(text_to_speak)
+
+        # The response's audio_content is binary.
+        with audio_file_path.open("wb") as out:
+            # Write the response to the output file.
+            out.write(audio)
+            logger.info(f'Audio content written to file "{audio_file_path}"')
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio in the negotiated output format.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            Raw PCM samples for PCM16 and the encoded audio otherwise.
+        """
+        audio: bytes = self._synthesize_speech(text_to_speak)
+
+        if self.output_spec.format == AudioFormat.PCM16:
+            return parse_wav(audio)[0]
+
+        return audio
+
+    def _synthesize_speech(self, text_to_speak: str) -> bytes:
+        return self.request_policy.call(
+            lambda timeout: self._request_speech(text_to_speak, timeout)
+        )
+
+    def _request_speech(self, text_to_speak: str, timeout: float) -> bytes:
+        from google.api_core import exceptions
+        from google.cloud import texttospeech
+
+        client = get_text_to_speech_client(self._api_endpoint, self._insecure)
         synthesis_input = texttospeech.SynthesisInput(text=text_to_speak)
+        # The name picks the voice, including its gender.
         voice = texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            name="en-US-Standard-J",
-            ssml_gender=texttospeech.SsmlVoiceGender.MALE,
+            language_code=self._language_code,
+            name=self._voice_name,
         )
         audio_config = texttospeech.AudioConfig(
-            speaking_rate=1.2,
-            audio_encoding=texttospeech.AudioEncoding.MP3,
+            speaking_rate=self.speaking_rate,
+            audio_encoding=texttospeech.AudioEncoding[
+                AUDIO_ENCODINGS[self.output_spec.format]
+            ],
+            # Zero lets the API pick the voice's native rate.
+            sample_rate_hertz=self.output_spec.sample_rate or 0,
             effects_profile_id=["small-bluetooth-speaker-class-device"],
         )
 
         # Perform the text-to-speech request on the text input with the selected
         # voice parameters and audio file type
-        response: texttospeech.SynthesizeSpeechResponse = client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config,
-        )
+        try:
+            # Retries are left to the request policy, which knows the deadline.
+            response: texttospeech.SynthesizeSpeechResponse = client.synthesize_speech(
+                input=synthesis_input,
+                voice=voice,
+                audio_config=audio_config,
+                timeout=timeout,
+                retry=None,
+            )
+        except exceptions.DeadlineExceeded as e:
+            raise TextToSpeechTimeoutError(
+                f"Google Cloud request timed out: {e}"
+            ) from e
+        except exceptions.GoogleAPICallError as e:
+            raise TextToSpeechResponseError(
+                f"Google Cloud request failed: {e}",
+                status_code=e.code,
+            ) from e
+
+        if not response.audio_content:
+            raise TextToSpeechResponseError("Google Cloud response contains no audio.")
+
+        return response.audio_content
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        if audio_format == AudioFormat.PCM16:
+            return sample_rate or DEFAULT_PCM_SAMPLE_RATE
 
-        # The response's audio_content is binary.
-        with audio_file_path.open("wb") as out:
-            # Write the response to the output file.
-            out.write(response.audio_content)
-            logger.info(f'Audio content written to file "{audio_file_path}"')
+        return sample_rate
@@ -1,12 +1,38 @@
-"""Define the GoogleTextToSpeechClient class."""
+"""Define the GoogleTextToSpeechClient class.
 
-from pathlib import Path
+gTTS splits text into pieces of about 100 characters and requests them one after
+another. This client sends the requests of all pieces at once over a shared
+keep-alive session and hands back their MP3 audio in order, so a long sentence
+takes about as long as its slowest piece instead of the sum of all of them.
+
+The responders play MP3 audio as whole files, so synthesize waits for every
+piece. Playback does not start any earlier than with a single request.
+"""
 
-import gtts
+from __future__ import annotations
+
+import base64
+import contextvars
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
 from llm_voice.tts.base import TextToSpeechClient
 from llm_voice.utils.logger import logger
 
+if TYPE_CHECKING:
+    import gtts
+    import requests
+
+# The audio of a piece is a base64 MP3 inside the batchexecute response.
+AUDIO_PATTERN: re.Pattern[str] = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
 
 class GoogleTextToSpeechClient(TextToSpeechClient):
     """Google Text to Speech API Client that converts a string to a mp3 file."""
@@ -17,10 +43,24 @@ class GoogleTextToSpeechClient(TextToSpeechClient):
         self,
         output_language: str = "en",
         output_top_level_domain: str = "com",
+        max_concurrent_requests: int = 4,
     ) -> None:
-        """Create a new GoogleTextToSpeechClient instance."""
+        """Create a new GoogleTextToSpeechClient instance.
+
+        Args:
+            output_language: The language to speak in.
+            output_top_level_domain: The Google Translate domain to use.
+            max_concurrent_requests: The number of pieces requested at once.
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1.")
+
         self._output_language: str = output_language
         self._output_top_level_domain: str = output_top_level_domain
+        self._max_concurrent_requests: int = max_concurrent_requests
+        self._session: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
 
     def convert_text_to_audio(
         self,
@@ -46,8 +86,132 @@ class GoogleTextToSpeechClient(TextToSpeechClient):
                 f"The audio file path already exists: {audio_file_path}",
             )
 
-        tts: gtts.gTTS = self._get_gtts(text_to_speak)
-        tts.save(audio_file_path)
+        audio_file_path.write_bytes(self.synthesize(text_to_speak))
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to MP3 audio in memory.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The MP3 audio of all pieces of the text.
+        """
+        return b"".join(self.stream_segments(text_to_speak))
+
+    def stream_segments(self, text_to_speak: str) -> Iterator[bytes]:
+        """Request all pieces of the text at once and yield their audio in order.
+
+        MP3 frames are self-contained, so the pieces can be joined as they
+        come. Every piece runs through the request policy under the caller's
+        deadline.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The MP3 audio of each piece, once it and every earlier piece arrived.
+
+        Raises:
+            TextToSpeechError: If a piece failed, the remaining requests are
+                cancelled.
+        """
+        # gTTS has no public API for the requests of the pieces.
+        requests_to_send: list[requests.PreparedRequest] = self._get_gtts(
+            text_to_speak
+        )._prepare_requests()
+        logger.debug(f"GTTS requesting {len(requests_to_send)} pieces")
+        executor: ThreadPoolExecutor = self._get_executor()
+        # Each request gets its own copy of the context to see the deadline.
+        futures: list[Future[bytes]] = [
+            executor.submit(
+                contextvars.copy_context().run,
+                self.request_policy.call,
+                lambda timeout, request=request: self._request_segment(
+                    request, timeout
+                ),
+            )
+            for request in requests_to_send
+        ]
+
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        """Close the shared session and stop the request threads."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrent_requests,
+                    thread_name_prefix="gtts",
+                )
+
+            return self._executor
+
+    def _get_session(self) -> requests.Session:
+        import requests
+
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_maxsize=self._max_concurrent_requests,
+                )
+                self._session.mount("https://", adapter)
+
+            return self._session
+
+    def _request_segment(
+        self,
+        request: requests.PreparedRequest,
+        timeout: float,
+    ) -> bytes:
+        import urllib.request
+
+        import requests
+
+        try:
+            response: requests.Response = self._get_session().send(
+                request,
+                proxies=urllib.request.getproxies(),
+                timeout=timeout,
+            )
+        except requests.Timeout as e:
+            raise TextToSpeechTimeoutError(f"gTTS request timed out: {e}") from e
+        except requests.RequestException as e:
+            raise TextToSpeechError(f"gTTS request failed: {e}", retryable=True) from e
+
+        if not response.ok:
+            raise TextToSpeechResponseError(
+                f"gTTS request failed with status {response.status_code}",
+                status_code=response.status_code,
+                content_type=response.headers.get("Content-Type"),
+            )
+
+        match: re.Match[str] | None = AUDIO_PATTERN.search(response.text)
+
+        if match is None:
+            raise TextToSpeechResponseError(
+                "gTTS response contains no audio.",
+                status_code=response.status_code,
+                content_type=response.headers.get("Content-Type"),
+            )
+
+        return base64.b64decode(match.group(1))
 
     def _get_gtts(self, text_to_speak: str) -> gtts.gTTS:
         """Return a gtts.gTTS object that generates speech from the given text.
@@ -58,6 +222,8 @@ class GoogleTextToSpeechClient(TextToSpeechClient):
         Returns:
             gtts.gTTS: The gtts.gTTS object that generates speech from the text.
         """
+        import gtts
+
         if (
             self._output_language is not None
             and self._output_top_level_domain is not None
@@ -86,6 +252,8 @@ class GoogleTextToSpeechClient(TextToSpeechClient):
             RuntimeError: If the language dictionaries for the specified language cannot
                 be loaded.
         """
+        import gtts
+
         try:
             lang_gtts = gtts.gTTS(
                 text_to_speak,
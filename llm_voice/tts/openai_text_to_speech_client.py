@@ -1,39 +1,77 @@
 """Define the ElevenLabsTextToSpeechClient class."""
 
-import os
-from pathlib import Path
-from typing import Literal
+from __future__ import annotations
 
-from openai import OpenAI
-from openai._legacy_response import HttpxBinaryResponseContent
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
+from llm_voice.env import get_openai_api_key
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.audio_format import AudioFormat
 from llm_voice.tts.base import TextToSpeechClient
+from llm_voice.tts.request_policy import validate_audio_response
+from llm_voice.utils.wav_file import write_wav
+
+if TYPE_CHECKING:
+    import openai
+    from openai._legacy_response import HttpxBinaryResponseContent
 
 DEFAULT_MODEL = "tts-1"
 
+# OpenAI always returns PCM and WAV audio at 24kHz.
+PCM_SAMPLE_RATE = 24000
+
+RESPONSE_FORMATS: dict[AudioFormat, Literal["pcm", "wav", "opus", "mp3"]] = {
+    AudioFormat.PCM16: "pcm",
+    AudioFormat.WAV: "wav",
+    AudioFormat.OPUS: "opus",
+    AudioFormat.MP3: "mp3",
+}
+
 
 class OpenAITextToSpeechClient(TextToSpeechClient):
     """Eleven Labs Text to Speech API Client that converts a string to a mp3 file."""
 
     audio_extension = ".mp3"
+    supported_formats = tuple(RESPONSE_FORMATS)
+    supports_speaking_rate = True
 
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         voice: Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"] = "nova",
         api_key: str | None = None,
+        base_url: str | None = None,
     ) -> None:
-        """Create a new OpenAITextToSpeechClient instance."""
+        """Create a new OpenAITextToSpeechClient instance.
+
+        Args:
+            model: The text to speech model.
+            voice: The voice to speak with.
+            api_key: The OpenAI API key, read from OPENAI_API_KEY when None.
+            base_url: The URL of an OpenAI compatible API, defaults to OpenAI's.
+        """
         if api_key is None:
-            api_key = os.environ.get("OPENAI_API_KEY")
+            api_key = get_openai_api_key()
 
         if api_key is None:
             raise ValueError(
                 "Expected api_key parameter or OPENAI_API_KEY env var to be set.",
             )
 
-        self._api_key: str = api_key
+        import openai
+
         self._model: str = model
+        # Shared by every request, so connections are kept alive between
+        # sentences. Retries are left to the request policy, which knows the
+        # deadline.
+        self._client: openai.OpenAI = openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+        )
         self._voice: Literal[
             "alloy",
             "echo",
@@ -67,12 +105,68 @@ class OpenAITextToSpeechClient(TextToSpeechClient):
                 f"The audio file path already exists: {audio_file_path}",
             )
 
-        client = OpenAI(api_key=self._api_key)
+        if self.output_spec.format == AudioFormat.PCM16:
+            write_wav(audio_file_path, self.synthesize(text_to_speak), PCM_SAMPLE_RATE)
+            return
+
+        audio_file_path.write_bytes(self.synthesize(text_to_speak))
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio in the negotiated output format.
 
-        response: HttpxBinaryResponseContent = client.audio.speech.create(
-            model=self._model,
-            voice=self._voice,
-            input=text_to_speak,
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            Raw 24kHz PCM samples for PCM16 and the encoded audio otherwise.
+
+        Raises:
+            TextToSpeechError: If the request failed or did not return audio.
+        """
+        return self.request_policy.call(
+            lambda timeout: self._create_speech(text_to_speak, timeout)
         )
 
-        response.stream_to_file(audio_file_path)
+    def _create_speech(self, text_to_speak: str, timeout: float) -> bytes:
+        import openai
+
+        try:
+            response: HttpxBinaryResponseContent = self._client.with_options(
+                timeout=timeout,
+                max_retries=0,
+            ).audio.speech.create(
+                model=self._model,
+                voice=self._voice,
+                input=text_to_speak,
+                response_format=RESPONSE_FORMATS[self.output_spec.format],
+                speed=self.speaking_rate,
+            )
+        except openai.APITimeoutError as e:
+            raise TextToSpeechTimeoutError(f"OpenAI request timed out: {e}") from e
+        except openai.APIStatusError as e:
+            raise TextToSpeechResponseError(
+                f"OpenAI request failed: {e}",
+                status_code=e.status_code,
+            ) from e
+        except openai.APIConnectionError as e:
+            raise TextToSpeechError(
+                f"OpenAI request failed: {e}",
+                retryable=True,
+            ) from e
+
+        validate_audio_response(
+            response.response.status_code,
+            response.response.headers.get("Content-Type"),
+            response.content,
+        )
+        return response.content
+
+    def _select_sample_rate(
+        self,
+        audio_format: AudioFormat,
+        sample_rate: int | None,
+    ) -> int | None:
+        if audio_format in {AudioFormat.PCM16, AudioFormat.WAV}:
+            return PCM_SAMPLE_RATE
+
+        return None
@@ -0,0 +1,85 @@
+"""Define the PiperTextToSpeechClient class.
+
+Piper (https://github.com/rhasspy/piper) is a local neural TTS engine that runs
+ONNX voice models on the CPU. The voice model is loaded once when the client is
+created and kept in memory, so each sentence is synthesized in-process without
+any network round-trip or process spawn.
+
+Install the optional dependency with `pip install llm-voice[piper]` and download
+a voice model (`.onnx` with its `.onnx.json` config) from
+https://huggingface.co/rhasspy/piper-voices.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llm_voice.tts.base import PcmTextToSpeechClient
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from piper.voice import PiperVoice
+
+
+class PiperTextToSpeechClient(PcmTextToSpeechClient):
+    """Piper TTS client that synthesizes raw PCM with an in-process voice model."""
+
+    supports_speaking_rate = True
+
+    def __init__(
+        self,
+        model_path: str | Path,
+        config_path: str | Path | None = None,
+        speaker_id: int | None = None,
+        use_cuda: bool = False,
+    ) -> None:
+        """Create a new PiperTextToSpeechClient instance and load the voice model.
+
+        Args:
+            model_path: The path to the `.onnx` voice model.
+            config_path: The path to the voice config, defaults to the model path
+                with a `.json` suffix appended.
+            speaker_id: The speaker to use for multi-speaker voice models.
+            use_cuda: Whether to run the model on the GPU.
+
+        Raises:
+            ImportError: If the piper-tts package is not installed.
+        """
+        try:
+            from piper.voice import PiperVoice
+        except ImportError as e:
+            raise ImportError(
+                "PiperTextToSpeechClient requires the piper-tts package. "
+                "Install it with `pip install llm-voice[piper]`.",
+            ) from e
+
+        logger.debug(f"Loading Piper voice model: {model_path}")
+        self._voice: PiperVoice = PiperVoice.load(
+            str(model_path),
+            config_path=str(config_path) if config_path else None,
+            use_cuda=use_cuda,
+        )
+        self._speaker_id: int | None = speaker_id
+        self.sample_rate: int = self._voice.config.sample_rate
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        """Convert the given text to mono 16-bit little endian PCM audio.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The PCM samples at the voice model's sample rate.
+        """
+        # Piper controls speed through phoneme lengths, so scale them inversely.
+        length_scale: float = self._voice.config.length_scale / self.speaking_rate
+
+        return b"".join(
+            self._voice.synthesize_stream_raw(
+                text_to_speak,
+                speaker_id=self._speaker_id,
+                length_scale=length_scale,
+                sentence_silence=0.0,
+            )
+        )
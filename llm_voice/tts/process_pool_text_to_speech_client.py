@@ -0,0 +1,299 @@
+"""Define the ProcessPoolTextToSpeechClient class.
+
+Local neural TTS engines are CPU bound and hold the GIL while synthesizing, so a
+single process can only use one core no matter how many threads submit work.
+This client runs a pool of worker processes that each create their own PCM
+client once (keeping the voice model loaded) and synthesize jobs tagged with a
+sequence number. The resulting PCM is handed back through a shared memory block
+instead of being pickled through the result pipe, and the parent copies it out
+and frees the block.
+
+The client factory is sent to the workers, so it must be picklable, for example
+`functools.partial(PiperTextToSpeechClient, model_path="voice.onnx")`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Self
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.tts.base import PcmTextToSpeechClient
+from llm_voice.utils.audio import Int16Array, as_int16
+from llm_voice.utils.logger import logger
+from llm_voice.utils.time_stretch import time_stretch
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+
+READY_SEQUENCE = -1
+RESULT_POLL_INTERVAL = 0.5
+
+
+def _synthesis_worker(
+    client_factory: Callable[[], PcmTextToSpeechClient],
+    job_queue: multiprocessing.Queue[tuple[int, str, float] | None],
+    result_queue: multiprocessing.Queue[tuple[int, str | None, int, str | None]],
+) -> None:
+    """Synthesize jobs until a None job is received.
+
+    Results are (sequence, shared memory name, byte length, error) tuples. The
+    ready message uses READY_SEQUENCE and carries the sample rate as the length.
+    """
+    try:
+        client: PcmTextToSpeechClient = client_factory()
+    except Exception as e:  # noqa: BLE001
+        # Any error is reported to the parent, which raises it on start.
+        result_queue.put((READY_SEQUENCE, None, 0, f"{type(e).__name__}: {e}"))
+        return
+
+    result_queue.put((READY_SEQUENCE, None, client.sample_rate, None))
+
+    while True:
+        job: tuple[int, str, float] | None = job_queue.get()
+
+        if job is None:
+            break
+
+        sequence, text_to_speak, speaking_rate = job
+
+        try:
+            if client.supports_speaking_rate:
+                client.speaking_rate = speaking_rate
+                pcm: bytes = client.synthesize_pcm(text_to_speak)
+            else:
+                # Stretch in the worker to keep the CPU work off the caller.
+                samples: Int16Array = time_stretch(
+                    as_int16(client.synthesize_pcm(text_to_speak)),
+                    client.sample_rate,
+                    speaking_rate,
+                )
+                pcm = samples.tobytes()
+
+            # Shared memory blocks can not be empty.
+            block = shared_memory.SharedMemory(create=True, size=max(len(pcm), 1))
+            block.buf[: len(pcm)] = pcm
+            block.close()
+        except Exception as e:  # noqa: BLE001
+            # Any error fails this job only, the worker keeps serving others.
+            result_queue.put((sequence, None, 0, f"{type(e).__name__}: {e}"))
+            continue
+
+        result_queue.put((sequence, block.name, len(pcm), None))
+
+
+class ProcessPoolTextToSpeechClient(PcmTextToSpeechClient):
+    """TTS client that spreads PCM synthesis over a pool of worker processes.
+
+    The speaking rate is applied in the workers, natively when their client
+    supports it and with a time-stretch otherwise.
+    """
+
+    supports_speaking_rate = True
+
+    def __init__(
+        self,
+        client_factory: Callable[[], PcmTextToSpeechClient],
+        workers: int | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        """Create a new ProcessPoolTextToSpeechClient and start its workers.
+
+        Args:
+            client_factory: Picklable callable creating the PCM client in a worker.
+            workers: The number of worker processes, defaults to the CPU count.
+            start_method: The multiprocessing start method, defaults to the
+                platform default.
+
+        Raises:
+            TextToSpeechError: If a worker fails to create its client.
+        """
+        context: BaseContext = multiprocessing.get_context(start_method)
+        worker_count: int = workers or os.cpu_count() or 1
+
+        # Share one resource tracker with the workers so shared memory blocks
+        # created by a worker and unlinked here are tracked consistently.
+        resource_tracker.ensure_running()
+
+        self._job_queue: multiprocessing.Queue[tuple[int, str, float] | None] = (
+            context.Queue()
+        )
+        self._result_queue: multiprocessing.Queue[
+            tuple[int, str | None, int, str | None]
+        ] = context.Queue()
+        self._sequence = itertools.count()
+        self._pending: dict[int, Future[bytes]] = {}
+        self._pending_lock = threading.Lock()
+        self._closed = False
+        self._processes: list[BaseProcess] = [
+            context.Process(
+                target=_synthesis_worker,
+                args=(client_factory, self._job_queue, self._result_queue),
+                daemon=True,
+            )
+            for _ in range(worker_count)
+        ]
+
+        for process in self._processes:
+            process.start()
+
+        sample_rates: set[int] = set()
+
+        for _ in self._processes:
+            _, _, sample_rate, error = self._result_queue.get()
+
+            if error is not None:
+                self.close()
+                raise TextToSpeechError(f"TTS worker failed to start: {error}")
+
+            sample_rates.add(sample_rate)
+
+        if len(sample_rates) != 1:
+            self.close()
+            raise TextToSpeechError(
+                f"TTS workers reported different sample rates: {sample_rates}",
+            )
+
+        self.sample_rate: int = sample_rates.pop()
+        self._dispatcher = threading.Thread(target=self._dispatch_results, daemon=True)
+        self._dispatcher.start()
+        logger.debug(f"Started {worker_count} TTS worker processes")
+
+    def submit(self, text_to_speak: str) -> Future[bytes]:
+        """Queue the given text for synthesis on the next free worker.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            A future resolving to mono 16-bit little endian PCM audio.
+        """
+        future: Future[bytes] = Future()
+        # The job can not be taken back once queued, and the dispatcher can only
+        # resolve a future that was not cancelled.
+        future.set_running_or_notify_cancel()
+        sequence: int = next(self._sequence)
+
+        # Checked under the lock, so a closing pool fails every future it let in.
+        with self._pending_lock:
+            if self._closed:
+                raise TextToSpeechError("The TTS process pool is closed.")
+
+            self._pending[sequence] = future
+
+        self._job_queue.put((sequence, text_to_speak, self.speaking_rate))
+        return future
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        """Convert the given text to mono 16-bit little endian PCM audio.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The PCM samples at the workers' sample rate.
+        """
+        return self.submit(text_to_speak).result()
+
+    def close(self) -> None:
+        """Stop the worker processes and fail any job still pending."""
+        if self._closed:
+            return
+
+        self._closed = True
+
+        for _ in self._processes:
+            self._job_queue.put(None)
+
+        for process in self._processes:
+            process.join(timeout=5)
+
+            if process.is_alive():
+                process.terminate()
+
+        self._fail_pending("The TTS process pool was closed.")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _dispatch_results(self) -> None:
+        """Resolve pending futures as results arrive, in any order."""
+        try:
+            while not self._closed:
+                try:
+                    sequence, block_name, length, error = self._result_queue.get(
+                        timeout=RESULT_POLL_INTERVAL,
+                    )
+                except queue.Empty:
+                    if not all(process.is_alive() for process in self._processes):
+                        self._closed = True
+                        self._fail_pending("A TTS worker process exited unexpectedly.")
+
+                    continue
+
+                self._dispatch_result(sequence, block_name, length, error)
+        finally:
+            if not self._closed:
+                # Nothing would resolve the pending futures anymore.
+                self._closed = True
+                self._fail_pending("The TTS result dispatcher stopped.")
+
+    def _dispatch_result(
+        self,
+        sequence: int,
+        block_name: str | None,
+        length: int,
+        error: str | None,
+    ) -> None:
+        with self._pending_lock:
+            future: Future[bytes] | None = self._pending.pop(sequence, None)
+
+        if block_name is None:
+            if future is not None:
+                future.set_exception(TextToSpeechError(f"TTS worker failed: {error}"))
+
+            return
+
+        try:
+            pcm: bytes = self._take_block(block_name, length)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read TTS result {sequence}: {e}")
+
+            if future is not None:
+                future.set_exception(
+                    TextToSpeechError(f"Unable to read the TTS result: {e}")
+                )
+
+            return
+
+        if future is not None:
+            future.set_result(pcm)
+
+    def _take_block(self, block_name: str, length: int) -> bytes:
+        block = shared_memory.SharedMemory(name=block_name)
+
+        try:
+            return bytes(block.buf[:length])
+        finally:
+            block.close()
+            block.unlink()
+
+    def _fail_pending(self, message: str) -> None:
+        with self._pending_lock:
+            pending: list[Future[bytes]] = list(self._pending.values())
+            self._pending.clear()
+
+        for future in pending:
+            if not future.done():
+                future.set_exception(TextToSpeechError(message))
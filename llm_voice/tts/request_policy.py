@@ -0,0 +1,185 @@
+"""Define the request policy shared by the network text to speech clients.
+
+A sentence is only useful if its audio arrives before playback reaches it. The
+responder sets a deadline for each sentence with request_deadline, and clients
+run their provider requests through RequestPolicy.call, which caps the timeout of
+every attempt at the time left, retries transient failures with jittered
+exponential backoff while the deadline allows and otherwise fails fast with a
+TextToSpeechError subclass so the caller can skip or substitute the sentence.
+
+Example:
+    with request_deadline(time.monotonic() + 2.0):
+        audio = text_to_speech_client.synthesize("Hello there.")
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.utils.logger import logger
+
+T = TypeVar("T")
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(deadline: float | None) -> Iterator[None]:
+    """Set the time.monotonic() deadline of the requests made in the block.
+
+    The deadline applies to the current thread or task only.
+
+    Args:
+        deadline: The deadline, None for no deadline.
+    """
+    token = _deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_request_deadline() -> float | None:
+    """Get the deadline set with request_deadline.
+
+    Returns:
+        The time.monotonic() deadline, None when there is none.
+    """
+    return _deadline.get()
+
+
+def validate_audio_response(
+    status_code: int,
+    content_type: str | None,
+    body: bytes,
+) -> None:
+    """Check that an HTTP response contains audio.
+
+    Args:
+        status_code: The HTTP status code.
+        content_type: The Content-Type header, None when missing.
+        body: The response body.
+
+    Raises:
+        TextToSpeechResponseError: If the status is not 2xx, the content type
+            is not audio or the body is empty.
+    """
+    if not 200 <= status_code < 300:
+        raise TextToSpeechResponseError(
+            f"TTS request failed with status {status_code}: "
+            f"{body[:200].decode('utf-8', 'replace')}",
+            status_code=status_code,
+            content_type=content_type,
+        )
+
+    media_type: str = (content_type or "").split(";")[0].strip().lower()
+
+    if media_type and not (
+        media_type.startswith("audio/") or media_type == "application/octet-stream"
+    ):
+        raise TextToSpeechResponseError(
+            f"TTS response is {media_type} instead of audio: "
+            f"{body[:200].decode('utf-8', 'replace')}",
+            status_code=status_code,
+            content_type=content_type,
+        )
+
+    if not body:
+        raise TextToSpeechResponseError(
+            "TTS response contains no audio.",
+            status_code=status_code,
+            content_type=content_type,
+        )
+
+
+@dataclass(frozen=True)
+class RequestPolicy:
+    """Timeout and retry policy of text to speech requests.
+
+    Attributes:
+        request_timeout: The maximum seconds of a single attempt.
+        max_attempts: The maximum number of attempts, including the first.
+        initial_backoff: The backoff ceiling before the second attempt in seconds.
+        max_backoff: The largest backoff ceiling in seconds.
+    """
+
+    request_timeout: float = 10.0
+    max_attempts: int = 3
+    initial_backoff: float = 0.2
+    max_backoff: float = 2.0
+
+    def call(self, request: Callable[[float], T]) -> T:
+        """Run a request under the policy and the current deadline.
+
+        Args:
+            request: Function making one attempt, called with its timeout in
+                seconds. It raises a TextToSpeechError with retryable set for
+                failures that are worth another attempt.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            TextToSpeechTimeoutError: If the deadline passed, not retryable,
+                also when an attempt that was cut short by it timed out.
+            TextToSpeechError: If an attempt failed and no retry is possible.
+        """
+        deadline: float | None = get_request_deadline()
+        attempt: int = 0
+
+        while True:
+            timeout: float = self.request_timeout
+
+            if deadline is not None:
+                remaining: float = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    raise TextToSpeechTimeoutError(
+                        "The deadline of the TTS request passed.",
+                        retryable=False,
+                    )
+
+                timeout = min(timeout, remaining)
+
+            attempt += 1
+
+            try:
+                return request(timeout)
+            except TextToSpeechError as e:
+                if (
+                    isinstance(e, TextToSpeechTimeoutError)
+                    and e.retryable
+                    and timeout < self.request_timeout
+                ):
+                    # The deadline cut the attempt short, the provider may
+                    # well have answered within its own timeout.
+                    raise TextToSpeechTimeoutError(
+                        "The deadline of the TTS request passed.",
+                        retryable=False,
+                    ) from e
+
+                if not e.retryable or attempt >= self.max_attempts:
+                    raise
+
+                backoff: float = random.uniform(
+                    0,
+                    min(self.max_backoff, self.initial_backoff * 2 ** (attempt - 1)),
+                )
+
+                if deadline is not None and time.monotonic() + backoff >= deadline:
+                    raise
+
+                logger.debug(
+                    f"TTS attempt {attempt} failed ({e}), retrying in {backoff:.2f}s"
+                )
+                time.sleep(backoff)
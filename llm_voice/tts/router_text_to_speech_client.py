@@ -0,0 +1,503 @@
+"""Define the RouterTextToSpeechClient class.
+
+The router wraps several TTS providers and sends each request to the fastest
+healthy one. Every provider has its own latency and error rate tracked as an
+exponentially weighted moving average (EWMA) along with a circuit breaker that
+opens after repeated failures, so a degraded provider stops being tried until
+its reset timeout has passed. When no provider succeeds the optional local
+fallback client is used.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from enum import Enum
+from pathlib import Path
+from typing import TypeVar
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.audio_format import AudioFormat, AudioSpec
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.tts.base import TextToSpeechClient
+from llm_voice.tts.request_policy import get_request_deadline
+from llm_voice.utils.audio import convert_pcm
+from llm_voice.utils.logger import logger
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """State of the circuit breaker of a single provider."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProviderHealth:
+    """Health state of a single provider.
+
+    Attributes:
+        name: The name of the provider.
+        latency_ewma: The EWMA of successful request latencies in seconds.
+        error_rate_ewma: The EWMA of the request error rate (0 to 1).
+        consecutive_failures: The number of failures since the last success.
+        circuit_state: The state of the circuit breaker.
+        opened_at: The monotonic time the circuit was last opened.
+        requests: The total number of requests sent to the provider.
+        failures: The total number of failed requests.
+    """
+
+    name: str
+    latency_ewma: float | None = None
+    error_rate_ewma: float = 0.0
+    consecutive_failures: int = 0
+    circuit_state: CircuitState = CircuitState.CLOSED
+    opened_at: float | None = None
+    requests: int = 0
+    failures: int = 0
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Record of how a single request was routed.
+
+    Attributes:
+        text: The text that was converted.
+        provider: The name of the provider that served the request, if any.
+        attempted: The names of the providers tried, in order.
+        latency: The total time spent on the request in seconds.
+        fallback_used: Whether the local fallback served the request.
+        timestamp: The wall clock time the request finished.
+    """
+
+    text: str
+    provider: str | None
+    attempted: tuple[str, ...]
+    latency: float
+    fallback_used: bool
+    timestamp: float
+
+
+FALLBACK_NAME = "fallback"
+
+
+class RouterTextToSpeechClient(TextToSpeechClient):
+    """TTS client that routes each request to the fastest healthy provider."""
+
+    def __init__(
+        self,
+        providers: Sequence[TextToSpeechClient] | Mapping[str, TextToSpeechClient],
+        fallback: TextToSpeechClient | None = None,
+        *,
+        smoothing: float = 0.3,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        max_error_rate: float = 0.5,
+        decision_history: int = 100,
+    ) -> None:
+        """Create a new RouterTextToSpeechClient instance.
+
+        Args:
+            providers: The providers to route between, either as a list (named by
+                class name) or a mapping of name to client. Order breaks ties.
+            fallback: The local client to use when every provider fails.
+            smoothing: The EWMA weight given to the newest observation.
+            failure_threshold: Consecutive failures before the circuit opens.
+            reset_timeout: Seconds an open circuit waits before a trial request.
+            max_error_rate: Error rate EWMA above which a provider is only used
+                after the healthy ones.
+            decision_history: The number of routing decisions to keep.
+        """
+        if isinstance(providers, Mapping):
+            named_providers = dict(providers)
+        else:
+            named_providers = {}
+            for provider in providers:
+                name: str = type(provider).__name__
+                suffix = 2
+                while name in named_providers:
+                    name = f"{type(provider).__name__}-{suffix}"
+                    suffix += 1
+                named_providers[name] = provider
+
+        if not named_providers:
+            raise ValueError("Expected at least one TTS provider.")
+
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing must be in (0, 1], got {smoothing}.")
+
+        self._providers: dict[str, TextToSpeechClient] = named_providers
+        self._fallback: TextToSpeechClient | None = fallback
+        # Cleared while the fallback can't produce the negotiated format.
+        self._fallback_enabled: bool = fallback is not None
+        self._smoothing: float = smoothing
+        self._failure_threshold: int = failure_threshold
+        self._reset_timeout: float = reset_timeout
+        self._max_error_rate: float = max_error_rate
+        self._health: dict[str, ProviderHealth] = {
+            name: ProviderHealth(name=name) for name in named_providers
+        }
+        self._decisions: deque[RoutingDecision] = deque(maxlen=decision_history)
+        self._lock = threading.Lock()
+        self._speaking_rate: float = 1.0
+        first_provider: TextToSpeechClient = next(iter(named_providers.values()))
+        self.audio_extension = first_provider.audio_extension
+        self.output_spec = first_provider.output_spec
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: str | Path,
+        force: bool = True,
+    ) -> None:
+        """Convert the given text to audio using the best available provider.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+            audio_file_path: The path to save the audio file.
+            force: Whether to overwrite the file if it already exists.
+
+        Raises:
+            FileExistsError: If the audio file path already exists and force is false.
+            TextToSpeechError: If every provider and the fallback failed.
+        """
+        if isinstance(audio_file_path, str):
+            audio_file_path = Path(audio_file_path)
+
+        if audio_file_path.exists() and not force:
+            raise FileExistsError(
+                f"The audio file path already exists: {audio_file_path}",
+            )
+
+        def convert(client: TextToSpeechClient) -> None:
+            try:
+                client.convert_text_to_audio(text_to_speak, audio_file_path, force=True)
+            except Exception:
+                audio_file_path.unlink(missing_ok=True)
+                raise
+
+        self._route(text_to_speak, convert)
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        """Convert the given text to audio using the best available provider.
+
+        PCM16 audio from providers with a different sample rate is resampled to
+        the negotiated rate, since raw samples do not carry their rate.
+
+        Args:
+            text_to_speak: The text to convert to audio.
+
+        Returns:
+            The encoded audio in the negotiated output format.
+
+        Raises:
+            TextToSpeechError: If every provider and the fallback failed.
+        """
+
+        def synthesize(client: TextToSpeechClient) -> bytes:
+            audio: bytes = client.synthesize(text_to_speak)
+            sample_rate: int | None = client.output_spec.sample_rate
+
+            if (
+                self.output_spec.format != AudioFormat.PCM16
+                or sample_rate is None
+                or self.output_spec.sample_rate is None
+                or sample_rate == self.output_spec.sample_rate
+            ):
+                return audio
+
+            resampled: PcmAudio = convert_pcm(
+                PcmAudio(data=audio, sample_rate=sample_rate),
+                sample_rate=self.output_spec.sample_rate,
+            )
+            return bytes(resampled.data)
+
+        return self._route(text_to_speak, synthesize)
+
+    @property
+    def supports_speaking_rate(self) -> bool:  # type: ignore[override]
+        """Whether every provider can change the speed of speech itself."""
+        return all(
+            provider.supports_speaking_rate for provider in self._providers.values()
+        )
+
+    @property
+    def speaking_rate(self) -> float:  # type: ignore[override]
+        """The speed of speech applied by the providers."""
+        return self._speaking_rate
+
+    @speaking_rate.setter
+    def speaking_rate(self, speaking_rate: float) -> None:
+        self._speaking_rate = speaking_rate
+
+        for client in [*self._providers.values(), self._fallback]:
+            if client is not None and client.supports_speaking_rate:
+                client.speaking_rate = speaking_rate
+
+    @property
+    def supported_formats(self) -> tuple[AudioFormat, ...]:  # type: ignore[override]
+        """The formats every provider supports."""
+        return tuple(
+            audio_format
+            for audio_format in AudioFormat
+            if all(
+                audio_format in provider.supported_formats
+                for provider in self._providers.values()
+            )
+        )
+
+    def negotiate_format(
+        self,
+        preferred_formats: Sequence[AudioFormat],
+        sample_rate: int | None = None,
+    ) -> AudioSpec:
+        """Switch every provider to the first preferred format they all support.
+
+        The fallback is switched too when it supports the format. Its audio is
+        resampled to the negotiated sample rate like the providers' audio.
+        Otherwise it is left out of routing until a format it supports is
+        negotiated, since its audio would not match the negotiated spec.
+
+        Args:
+            preferred_formats: The acceptable formats, most preferred first.
+            sample_rate: The preferred sample rate in Hz, None for the default.
+
+        Returns:
+            The output spec the router will produce from now on.
+
+        Raises:
+            ValueError: If none of the preferred formats are supported by all
+                providers.
+        """
+        spec: AudioSpec = super().negotiate_format(preferred_formats, sample_rate)
+        provider_specs: list[AudioSpec] = [
+            provider.negotiate_format([spec.format], sample_rate)
+            for provider in self._providers.values()
+        ]
+
+        if self._fallback is not None:
+            self._fallback_enabled = spec.format in self._fallback.supported_formats
+
+            if self._fallback_enabled:
+                self._fallback.negotiate_format([spec.format], sample_rate)
+            else:
+                logger.warning(
+                    f"RouterTextToSpeechClient: fallback does not support "
+                    f"{spec.format}, it will not be used"
+                )
+
+        if spec.sample_rate is None:
+            self.output_spec = replace(spec, sample_rate=provider_specs[0].sample_rate)
+
+        return self.output_spec
+
+    def _route(
+        self,
+        text_to_speak: str,
+        request: Callable[[TextToSpeechClient], T],
+    ) -> T:
+        """Run the request on providers in rank order until one succeeds.
+
+        Once the request deadline has passed no further provider is tried, and
+        the timeout is not held against the provider that was running, nor is
+        a timeout of an attempt that the deadline cut short.
+        """
+        started_at: float = time.monotonic()
+        attempted: list[str] = []
+        errors: list[str] = []
+
+        for name in self._rank_providers():
+            self._check_deadline(text_to_speak, attempted, started_at)
+            attempted.append(name)
+            self._begin_attempt(name)
+            request_started_at: float = time.monotonic()
+
+            try:
+                result: T = request(self._providers[name])
+            except TextToSpeechTimeoutError as e:
+                if not e.retryable or _deadline_passed():
+                    self._record_decision(text_to_speak, None, attempted, started_at)
+                    raise
+
+                error: Exception = e
+            except Exception as e:  # noqa: BLE001
+                # Whatever a provider raises, the next one may still succeed.
+                error = e
+            else:
+                self._record_success(name, time.monotonic() - request_started_at)
+                self._record_decision(text_to_speak, name, attempted, started_at)
+                return result
+
+            logger.warning(f"RouterTextToSpeechClient: {name} failed: {error}")
+            errors.append(f"{name}: {error}")
+            self._record_failure(name)
+
+        if self._fallback is not None and self._fallback_enabled:
+            self._check_deadline(text_to_speak, attempted, started_at)
+            attempted.append(FALLBACK_NAME)
+
+            try:
+                result = request(self._fallback)
+            except TextToSpeechTimeoutError as e:
+                if not e.retryable or _deadline_passed():
+                    self._record_decision(text_to_speak, None, attempted, started_at)
+                    raise
+
+                errors.append(f"{FALLBACK_NAME}: {e}")
+            except Exception as e:  # noqa: BLE001
+                # Reported with the providers' errors below.
+                errors.append(f"{FALLBACK_NAME}: {e}")
+            else:
+                self._record_decision(
+                    text_to_speak,
+                    FALLBACK_NAME,
+                    attempted,
+                    started_at,
+                )
+                return result
+
+        self._record_decision(text_to_speak, None, attempted, started_at)
+        raise TextToSpeechError(
+            f"All TTS providers failed: {'; '.join(errors) or 'none available'}",
+        )
+
+    def _check_deadline(
+        self,
+        text_to_speak: str,
+        attempted: list[str],
+        started_at: float,
+    ) -> None:
+        """Stop routing once the deadline of the request has passed.
+
+        Raises:
+            TextToSpeechTimeoutError: If the deadline has passed.
+        """
+        if _deadline_passed():
+            self._record_decision(text_to_speak, None, attempted, started_at)
+            raise TextToSpeechTimeoutError(
+                "The deadline of the TTS request passed.",
+                retryable=False,
+            )
+
+    def get_health(self) -> dict[str, ProviderHealth]:
+        """Get a snapshot of the health state of every provider.
+
+        Returns:
+            Mapping of provider name to a copy of its health state.
+        """
+        with self._lock:
+            return {name: replace(health) for name, health in self._health.items()}
+
+    def get_decisions(self) -> list[RoutingDecision]:
+        """Get the most recent routing decisions, oldest first.
+
+        Returns:
+            The list of routing decisions.
+        """
+        with self._lock:
+            return list(self._decisions)
+
+    def _rank_providers(self) -> list[str]:
+        """Order the providers that may currently receive a request.
+
+        Providers with a closed circuit come first, ordered by latency EWMA with
+        untried providers treated as the fastest so that they get probed. Open
+        circuits are skipped until their reset timeout has passed, after which
+        they are offered as a trial behind the healthy providers along with any
+        provider whose error rate is too high.
+        """
+        now: float = time.monotonic()
+        healthy: list[tuple[float, int, str]] = []
+        degraded: list[tuple[float, int, str]] = []
+
+        with self._lock:
+            for position, (name, health) in enumerate(self._health.items()):
+                key = (health.latency_ewma or 0.0, position, name)
+
+                if health.circuit_state != CircuitState.CLOSED:
+                    assert health.opened_at is not None
+
+                    if now - health.opened_at >= self._reset_timeout:
+                        degraded.append(key)
+                elif health.error_rate_ewma > self._max_error_rate:
+                    degraded.append(key)
+                else:
+                    healthy.append(key)
+
+        return [name for *_, name in sorted(healthy) + sorted(degraded)]
+
+    def _begin_attempt(self, name: str) -> None:
+        with self._lock:
+            health: ProviderHealth = self._health[name]
+
+            if health.circuit_state == CircuitState.OPEN:
+                health.circuit_state = CircuitState.HALF_OPEN
+
+    def _record_success(self, name: str, latency: float) -> None:
+        with self._lock:
+            health: ProviderHealth = self._health[name]
+            health.requests += 1
+            health.consecutive_failures = 0
+            health.circuit_state = CircuitState.CLOSED
+            health.opened_at = None
+            health.error_rate_ewma = self._ewma(health.error_rate_ewma, 0.0)
+            health.latency_ewma = (
+                latency
+                if health.latency_ewma is None
+                else self._ewma(health.latency_ewma, latency)
+            )
+
+    def _record_failure(self, name: str) -> None:
+        with self._lock:
+            health: ProviderHealth = self._health[name]
+            health.requests += 1
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.error_rate_ewma = self._ewma(health.error_rate_ewma, 1.0)
+
+            if (
+                health.circuit_state == CircuitState.HALF_OPEN
+                or health.consecutive_failures >= self._failure_threshold
+            ):
+                if health.circuit_state != CircuitState.OPEN:
+                    logger.warning(
+                        f"RouterTextToSpeechClient: opening circuit for {name}"
+                    )
+
+                health.circuit_state = CircuitState.OPEN
+                health.opened_at = time.monotonic()
+
+    def _record_decision(
+        self,
+        text: str,
+        provider: str | None,
+        attempted: list[str],
+        started_at: float,
+    ) -> None:
+        decision = RoutingDecision(
+            text=text,
+            provider=provider,
+            attempted=tuple(attempted),
+            latency=time.monotonic() - started_at,
+            fallback_used=provider == FALLBACK_NAME,
+            timestamp=time.time(),
+        )
+        logger.debug(f"RouterTextToSpeechClient: {decision}")
+
+        with self._lock:
+            self._decisions.append(decision)
+
+    def _ewma(self, current: float, observation: float) -> float:
+        return self._smoothing * observation + (1 - self._smoothing) * current
+
+
+def _deadline_passed() -> bool:
+    deadline: float | None = get_request_deadline()
+    return deadline is not None and time.monotonic() >= deadline
@@ -0,0 +1,233 @@
+"""Define vectorized helpers to convert PCM audio buffers.
+
+Samples are handled as NumPy arrays shaped (frames,) for mono audio or
+(frames, channels) for interleaved audio. Conversions from bytes, bytearrays and
+memoryviews use np.frombuffer so they return views of the original buffer
+instead of copies, and the conversions back to bytes expose the array memory
+through a memoryview.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from llm_voice.interfaces.pcm_audio import PcmAudio
+
+INT16_SCALE = 32768.0
+
+Int16Array = npt.NDArray[np.int16]
+Float32Array = npt.NDArray[np.float32]
+
+
+def as_int16(
+    pcm: bytes | bytearray | memoryview,
+    channels: int = 1,
+) -> Int16Array:
+    """View 16-bit little endian PCM bytes as an int16 array without copying.
+
+    Args:
+        pcm: The interleaved PCM samples.
+        channels: The number of interleaved channels.
+
+    Returns:
+        The samples shaped (frames,) for mono or (frames, channels) otherwise.
+        The array is read-only when the buffer is immutable.
+    """
+    samples: Int16Array = np.frombuffer(pcm, dtype="<i2")
+
+    if channels == 1:
+        return samples
+
+    return samples.reshape(-1, channels)
+
+
+def as_bytes(samples: Int16Array) -> memoryview:
+    """Expose int16 samples as a byte memoryview without copying when contiguous.
+
+    Args:
+        samples: The samples to expose.
+
+    Returns:
+        A memoryview of the interleaved little endian sample bytes.
+    """
+    contiguous: Int16Array = np.ascontiguousarray(samples, dtype="<i2")
+    return memoryview(contiguous).cast("B")
+
+
+def int16_to_float32(
+    samples: Int16Array,
+    out: Float32Array | None = None,
+) -> Float32Array:
+    """Convert int16 samples to float32 samples in [-1, 1).
+
+    Args:
+        samples: The int16 samples.
+        out: Optional preallocated array of the same shape to write into.
+
+    Returns:
+        The float32 samples.
+    """
+    if out is None:
+        out = np.empty(samples.shape, dtype=np.float32)
+
+    np.multiply(samples, np.float32(1.0 / INT16_SCALE), out=out, casting="unsafe")
+    return out
+
+
+def float32_to_int16(
+    samples: Float32Array,
+    out: Int16Array | None = None,
+) -> Int16Array:
+    """Convert float32 samples in [-1, 1] to int16 samples, clipping overflow.
+
+    Args:
+        samples: The float32 samples.
+        out: Optional preallocated array of the same shape to write into.
+
+    Returns:
+        The int16 samples.
+    """
+    if out is None:
+        out = np.empty(samples.shape, dtype=np.int16)
+
+    scaled: Float32Array = samples * np.float32(INT16_SCALE)
+    np.clip(scaled, -INT16_SCALE, INT16_SCALE - 1, out=scaled)
+    np.rint(scaled, out=scaled)
+    out[...] = scaled
+    return out
+
+
+def convert_channels(samples: npt.NDArray, channels: int) -> npt.NDArray:
+    """Convert audio to the given number of channels.
+
+    Down-mixing averages the channels, up-mixing from mono duplicates the
+    signal and any other conversion keeps or pads the leading channels.
+
+    Args:
+        samples: The samples shaped (frames,) or (frames, channels).
+        channels: The number of channels to convert to.
+
+    Returns:
+        The samples shaped (frames,) for mono or (frames, channels) otherwise.
+        The input is returned unchanged when it already has the channel count.
+    """
+    current_channels: int = 1 if samples.ndim == 1 else samples.shape[1]
+
+    if current_channels == channels:
+        return samples
+
+    if channels == 1:
+        return samples.mean(axis=1).astype(samples.dtype)
+
+    if current_channels == 1:
+        return np.repeat(samples[:, np.newaxis], channels, axis=1)
+
+    converted = np.zeros((samples.shape[0], channels), dtype=samples.dtype)
+    shared_channels: int = min(current_channels, channels)
+    converted[:, :shared_channels] = samples[:, :shared_channels]
+    return converted
+
+
+def resample(
+    samples: npt.NDArray,
+    from_rate: int,
+    to_rate: int,
+) -> npt.NDArray:
+    """Resample audio with linear interpolation.
+
+    Linear interpolation is cheap enough to run on every clip before playback
+    and is transparent for speech, which has little energy near the Nyquist
+    frequency of common output rates.
+
+    Args:
+        samples: The samples shaped (frames,) or (frames, channels).
+        from_rate: The current sample rate in Hz.
+        to_rate: The sample rate to convert to in Hz.
+
+    Returns:
+        The resampled audio with the same dtype and channel layout. The input is
+        returned unchanged when the rates match.
+    """
+    if from_rate == to_rate or samples.shape[0] == 0:
+        return samples
+
+    frame_count: int = samples.shape[0]
+    output_frame_count: int = max(1, round(frame_count * to_rate / from_rate))
+    positions = np.arange(output_frame_count, dtype=np.float64) * (from_rate / to_rate)
+    source_positions = np.arange(frame_count, dtype=np.float64)
+
+    if samples.ndim == 1:
+        resampled = np.interp(positions, source_positions, samples)
+    else:
+        resampled = np.stack(
+            [
+                np.interp(positions, source_positions, samples[:, channel])
+                for channel in range(samples.shape[1])
+            ],
+            axis=1,
+        )
+
+    if np.issubdtype(samples.dtype, np.integer):
+        np.rint(resampled, out=resampled)
+
+    return resampled.astype(samples.dtype)
+
+
+def concatenate(
+    chunks: Sequence[npt.NDArray],
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Concatenate audio chunks along the frame axis with a single allocation.
+
+    Args:
+        chunks: The chunks with matching dtype and channel layout.
+        out: Optional preallocated array large enough to hold every frame.
+
+    Returns:
+        The concatenated audio, a view of out when it was given.
+    """
+    frame_count: int = sum(chunk.shape[0] for chunk in chunks)
+
+    if out is None:
+        if not chunks:
+            return np.empty(0, dtype=np.int16)
+
+        return np.concatenate(chunks, axis=0)
+
+    target: npt.NDArray = out[:frame_count]
+    np.concatenate(chunks, axis=0, out=target)
+    return target
+
+
+def convert_pcm(
+    audio: PcmAudio,
+    sample_rate: int | None = None,
+    channels: int | None = None,
+) -> PcmAudio:
+    """Convert PCM audio to the given sample rate and channel count.
+
+    Args:
+        audio: The audio to convert.
+        sample_rate: The sample rate to convert to, None to keep it.
+        channels: The channel count to convert to, None to keep it.
+
+    Returns:
+        The converted audio, or the given audio when nothing needs to change.
+    """
+    sample_rate = sample_rate or audio.sample_rate
+    channels = channels or audio.channels
+
+    if sample_rate == audio.sample_rate and channels == audio.channels:
+        return audio
+
+    samples: Int16Array = as_int16(audio.data, audio.channels)
+    samples = convert_channels(samples, channels)
+    samples = resample(samples, audio.sample_rate, sample_rate)
+    return PcmAudio(
+        data=as_bytes(samples),
+        sample_rate=sample_rate,
+        channels=channels,
+    )
@@ -1,17 +1,42 @@
-"""Define the audio device objects."""
+"""Define the audio device objects.
 
-from typing import cast
+Devices are listed once through the shared PortAudio context and cached in a
+table indexed by PortAudio index, name, type and host API. The table is only
+rebuilt by refresh, which can also run periodically on a monitor thread to
+detect devices being plugged in or removed and notify listeners.
+"""
 
-from pyaudio import PyAudio
+from __future__ import annotations
 
-from llm_voice.interfaces.audio_device import AudioDevice, AudioDeviceType
+import threading
+from collections.abc import Callable
+from typing import ClassVar, cast
+
+from llm_voice.interfaces.audio_device import (
+    AudioDevice,
+    AudioDeviceChanges,
+    AudioDeviceType,
+)
 from llm_voice.interfaces.pyaudio_device_info import PyAudioDeviceInfo
 from llm_voice.utils.logger import logger
+from llm_voice.utils.port_audio import PortAudioContext
+
+DEFAULT_MONITOR_INTERVAL = 2.0
 
 
 class AudioDevices:
     """Class to interact with the current machines audio devices."""
 
+    _devices: ClassVar[list[AudioDevice] | None] = None
+    _by_index: ClassVar[dict[int, AudioDevice]] = {}
+    _by_name: ClassVar[dict[str, AudioDevice]] = {}
+    _by_type: ClassVar[dict[AudioDeviceType, list[AudioDevice]]] = {}
+    _by_host_api: ClassVar[dict[str, list[AudioDevice]]] = {}
+    _listeners: ClassVar[list[Callable[[AudioDeviceChanges], None]]] = []
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    _monitor_thread: ClassVar[threading.Thread | None] = None
+    _monitor_stop: ClassVar[threading.Event] = threading.Event()
+
     @staticmethod
     def get_list_of_devices(
         device_type: AudioDeviceType | None = None,
@@ -24,37 +49,12 @@ class AudioDevices:
         Returns:
             List of audio device objects on the current machine.
         """
-        logger.debug("AudioDevices.get_list_of_devices called")
-
-        raw_audio_devices: list[PyAudioDeviceInfo] = AudioDevices._get_all_devices()
-        audio_devices: list[AudioDevice] = []
-
-        for raw_device in raw_audio_devices:
-            current_device_type = AudioDeviceType.UNKNOWN
-
-            if raw_device["maxInputChannels"] > 0:
-                current_device_type = AudioDeviceType.INPUT
-
-            if raw_device["maxOutputChannels"] > 0:
-                if current_device_type == AudioDeviceType.INPUT:
-                    current_device_type = AudioDeviceType.INPUT_OUTPUT
-                else:
-                    current_device_type = AudioDeviceType.OUTPUT
+        devices: list[AudioDevice] = AudioDevices._get_devices()
 
-            if device_type is not None and current_device_type != device_type:
-                continue
-
-            device_index: int = cast(int, raw_device["index"])
-            device_name: str = cast(str, raw_device["name"])
-            audio_device = AudioDevice(
-                index=device_index,
-                name=device_name,
-                device_type=current_device_type,
-            )
-            audio_devices.append(audio_device)
+        if device_type is None:
+            return list(devices)
 
-        logger.debug(f"Found {len(audio_devices)} devices.")
-        return audio_devices
+        return list(AudioDevices._by_type.get(device_type, []))
 
     @staticmethod
     def get_device_by_name(name: str) -> AudioDevice:
@@ -64,14 +64,15 @@ class AudioDevices:
             name: The name of the audio device.
 
         Returns:
-            The audio device object.
+            The audio device object, the one with the lowest index when several
+            host APIs expose a device with the same name.
         """
-        devices: list[AudioDevice] = AudioDevices.get_list_of_devices()
-        for device in devices:
-            if device.name == name:
-                return device
+        AudioDevices._get_devices()
+
+        if name not in AudioDevices._by_name:
+            raise ValueError(f"Device {name} not found.")
 
-        raise ValueError(f"Device {name} not found.")
+        return AudioDevices._by_name[name]
 
     @staticmethod
     def get_device_by_index(index: int) -> AudioDevice:
@@ -83,7 +84,12 @@ class AudioDevices:
         Returns:
             The audio device object.
         """
-        return AudioDevices.get_list_of_devices()[index]
+        AudioDevices._get_devices()
+
+        if index not in AudioDevices._by_index:
+            raise ValueError(f"Device with index {index} not found.")
+
+        return AudioDevices._by_index[index]
 
     @staticmethod
     def get_first_of_type(device_type: AudioDeviceType) -> AudioDevice:
@@ -95,7 +101,240 @@ class AudioDevices:
         Returns:
             The audio device object.
         """
-        return AudioDevices.get_list_of_devices(device_type)[0]
+        devices: list[AudioDevice] = AudioDevices.get_list_of_devices(device_type)
+
+        if not devices:
+            raise ValueError(f"No {device_type.name} device found.")
+
+        return devices[0]
+
+    @staticmethod
+    def get_devices_by_host_api(host_api: str) -> list[AudioDevice]:
+        """Get the audio devices of a host API.
+
+        Args:
+            host_api: The name of the host API, for example "ALSA" or "Core Audio".
+
+        Returns:
+            The audio devices of the host API.
+        """
+        AudioDevices._get_devices()
+        return list(AudioDevices._by_host_api.get(host_api, []))
+
+    @staticmethod
+    def refresh() -> AudioDeviceChanges:
+        """Rescan the devices and notify the listeners of any change.
+
+        PortAudio has to be restarted to see new devices, which is not possible
+        while audio is playing. The scan is skipped in that case and picked up
+        by a later refresh.
+
+        Returns:
+            The devices that were added or removed since the previous scan.
+        """
+        with AudioDevices._lock:
+            if not PortAudioContext.get().reinitialize():
+                return AudioDeviceChanges()
+
+            previous: list[AudioDevice] | None = AudioDevices._devices
+            AudioDevices._index_devices(AudioDevices._scan_devices())
+            assert AudioDevices._devices is not None
+
+            if previous is None:
+                return AudioDeviceChanges()
+
+            changes: AudioDeviceChanges = AudioDevices._diff(
+                previous,
+                AudioDevices._devices,
+            )
+            listeners = list(AudioDevices._listeners)
+
+        if changes:
+            logger.info(
+                f"Audio devices changed: {len(changes.added)} added, "
+                f"{len(changes.removed)} removed"
+            )
+
+            for listener in listeners:
+                try:
+                    listener(changes)
+                except Exception as e:  # noqa: BLE001
+                    # Listeners are caller code, one failing must not keep the
+                    # others from hearing about the change.
+                    logger.warning(f"Audio device listener failed: {e}")
+
+        return changes
+
+    @staticmethod
+    def add_listener(listener: Callable[[AudioDeviceChanges], None]) -> None:
+        """Register a function called with the changes found by refresh.
+
+        Args:
+            listener: The function to call, on the thread that ran refresh.
+        """
+        with AudioDevices._lock:
+            AudioDevices._listeners.append(listener)
+
+    @staticmethod
+    def remove_listener(listener: Callable[[AudioDeviceChanges], None]) -> None:
+        """Unregister a listener added with add_listener.
+
+        Args:
+            listener: The function to remove.
+        """
+        with AudioDevices._lock:
+            if listener in AudioDevices._listeners:
+                AudioDevices._listeners.remove(listener)
+
+    @staticmethod
+    def start_monitoring(interval: float = DEFAULT_MONITOR_INTERVAL) -> None:
+        """Refresh the devices periodically on a background thread.
+
+        Args:
+            interval: The number of seconds between refreshes.
+        """
+        with AudioDevices._lock:
+            if (
+                AudioDevices._monitor_thread is not None
+                and AudioDevices._monitor_thread.is_alive()
+            ):
+                return
+
+            AudioDevices._monitor_stop.clear()
+            AudioDevices._monitor_thread = threading.Thread(
+                target=AudioDevices._monitor,
+                args=(interval,),
+                daemon=True,
+            )
+            AudioDevices._monitor_thread.start()
+
+    @staticmethod
+    def stop_monitoring() -> None:
+        """Stop the monitor thread started with start_monitoring."""
+        AudioDevices._monitor_stop.set()
+        monitor_thread: threading.Thread | None = AudioDevices._monitor_thread
+
+        if (
+            monitor_thread is not None
+            and monitor_thread is not threading.current_thread()
+        ):
+            monitor_thread.join()
+
+        AudioDevices._monitor_thread = None
+
+    @staticmethod
+    def shutdown() -> None:
+        """Stop monitoring, clear the cache and terminate PortAudio."""
+        AudioDevices.stop_monitoring()
+
+        with AudioDevices._lock:
+            AudioDevices._devices = None
+            PortAudioContext.get().terminate()
+
+    @staticmethod
+    def _monitor(interval: float) -> None:
+        while not AudioDevices._monitor_stop.wait(interval):
+            try:
+                AudioDevices.refresh()
+            except OSError as e:
+                # PyAudio reports PortAudio errors as OSError, the next
+                # refresh tries again.
+                logger.warning(f"Unable to refresh audio devices: {e}")
+
+    @staticmethod
+    def _get_devices() -> list[AudioDevice]:
+        with AudioDevices._lock:
+            if AudioDevices._devices is None:
+                AudioDevices._index_devices(AudioDevices._scan_devices())
+
+            assert AudioDevices._devices is not None
+            return AudioDevices._devices
+
+    @staticmethod
+    def _index_devices(devices: list[AudioDevice]) -> None:
+        by_name: dict[str, AudioDevice] = {}
+        by_type: dict[AudioDeviceType, list[AudioDevice]] = {}
+        by_host_api: dict[str, list[AudioDevice]] = {}
+
+        for device in devices:
+            by_name.setdefault(device.name, device)
+            by_type.setdefault(device.device_type, []).append(device)
+
+            if device.host_api is not None:
+                by_host_api.setdefault(device.host_api, []).append(device)
+
+        AudioDevices._by_index = {device.index: device for device in devices}
+        AudioDevices._by_name = by_name
+        AudioDevices._by_type = by_type
+        AudioDevices._by_host_api = by_host_api
+        AudioDevices._devices = devices
+
+    @staticmethod
+    def _diff(
+        previous: list[AudioDevice],
+        current: list[AudioDevice],
+    ) -> AudioDeviceChanges:
+        """Compare two scans by device identity, indexes shift when devices change."""
+
+        def key(device: AudioDevice) -> tuple[str, str | None, AudioDeviceType]:
+            return (device.name, device.host_api, device.device_type)
+
+        previous_keys: set[tuple[str, str | None, AudioDeviceType]] = {
+            key(device) for device in previous
+        }
+        current_keys: set[tuple[str, str | None, AudioDeviceType]] = {
+            key(device) for device in current
+        }
+        return AudioDeviceChanges(
+            added=[device for device in current if key(device) not in previous_keys],
+            removed=[device for device in previous if key(device) not in current_keys],
+        )
+
+    @staticmethod
+    def _scan_devices() -> list[AudioDevice]:
+        logger.debug("AudioDevices scanning devices")
+
+        raw_audio_devices: list[PyAudioDeviceInfo] = AudioDevices._get_all_devices()
+        host_api_names: dict[int, str] = AudioDevices._get_host_api_names()
+        audio_devices: list[AudioDevice] = []
+
+        for raw_device in raw_audio_devices:
+            current_device_type = AudioDeviceType.UNKNOWN
+
+            if raw_device["maxInputChannels"] > 0:
+                current_device_type = AudioDeviceType.INPUT
+
+            if raw_device["maxOutputChannels"] > 0:
+                if current_device_type == AudioDeviceType.INPUT:
+                    current_device_type = AudioDeviceType.INPUT_OUTPUT
+                else:
+                    current_device_type = AudioDeviceType.OUTPUT
+
+            device_index: int = cast(int, raw_device["index"])
+            device_name: str = cast(str, raw_device["name"])
+            audio_device = AudioDevice(
+                index=device_index,
+                name=device_name,
+                device_type=current_device_type,
+                default_sample_rate=int(raw_device["defaultSampleRate"]),
+                host_api=host_api_names.get(raw_device["hostApi"]),
+            )
+            audio_devices.append(audio_device)
+
+        logger.debug(f"Found {len(audio_devices)} devices.")
+        return audio_devices
+
+    @staticmethod
+    def _get_host_api_names() -> dict[int, str]:
+        """Get the names of the host APIs by index."""
+        py_audio = PortAudioContext.get().py_audio
+        return {
+            host_api_index: cast(
+                str,
+                py_audio.get_host_api_info_by_index(host_api_index)["name"],
+            )
+            for host_api_index in range(py_audio.get_host_api_count())
+        }
 
     @staticmethod
     def _get_all_devices() -> list[PyAudioDeviceInfo]:
@@ -104,7 +343,7 @@ class AudioDevices:
         Returns:
             A list of audio device objects.
         """
-        py_audio = PyAudio()
+        py_audio = PortAudioContext.get().py_audio
         count_of_input_devices: int = py_audio.get_device_count()
 
         return [
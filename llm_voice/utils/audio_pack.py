@@ -0,0 +1,296 @@
+"""Define the AudioPack and AudioPackBuilder classes.
+
+An audio pack stores a library of pre-rendered clips in a single file. A header
+index maps the hash of each clip's text and voice to the offset, length, format
+and duration of its audio, followed by the audio of all clips:
+
+    header  magic, version, clip count
+    index   one fixed size record per clip
+    audio   the clips, each aligned to 16 bytes
+
+AudioPack memory-maps the file read-only. Looking up a clip is a dictionary
+lookup and its audio is a memoryview of the mapping, so no file is opened and
+nothing is copied per clip. The operating system shares the mapped pages
+between all processes that open the same pack.
+
+Example:
+    pack = AudioPack("prompts.lvpack")
+    clip = pack.get("Welcome back!")
+    if clip is not None:
+        pcm_player.play(clip.as_pcm())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import wave
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Self
+
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.interfaces.packed_clip import PackedClip
+from llm_voice.interfaces.pcm_audio import PCM16_SAMPLE_WIDTH
+from llm_voice.utils.logger import logger
+
+MAGIC = b"LVAPACK\x00"
+VERSION = 1
+# Magic, version and clip count.
+HEADER = struct.Struct("<8sII")
+# Key, offset, length, format, sample rate (0 if unknown), channels, duration.
+RECORD = struct.Struct("<32sQQ8sIHd")
+ALIGNMENT = 16
+# Offset, length, format, sample rate, channels and duration of a clip.
+IndexEntry = tuple[int, int, AudioFormat, int | None, int, float]
+
+FORMATS_BY_SUFFIX: dict[str, AudioFormat] = {
+    ".wav": AudioFormat.WAV,
+    ".mp3": AudioFormat.MP3,
+    ".ogg": AudioFormat.OPUS,
+    ".aiff": AudioFormat.AIFF,
+}
+
+
+def pack_key(text: str, voice: str | None = None) -> bytes:
+    """Hash the text and voice of a clip into its key in the index.
+
+    Args:
+        text: The text of the clip, surrounding whitespace is ignored.
+        voice: The voice of the clip, None for the default voice.
+
+    Returns:
+        The SHA-256 digest.
+    """
+    return hashlib.sha256(f"{voice or ''}\x00{text.strip()}".encode()).digest()
+
+
+class AudioPackBuilder:
+    """Collects clips and writes them to an audio pack."""
+
+    def __init__(self) -> None:
+        """Create a new AudioPackBuilder instance."""
+        self._files: dict[bytes, Path] = {}
+
+    def __len__(self) -> int:
+        """The number of clips added."""
+        return len(self._files)
+
+    def add_file(self, text: str, path: str | Path, voice: str | None = None) -> None:
+        """Add an audio file, which is read when the pack is written.
+
+        Args:
+            text: The text spoken in the file.
+            path: The WAV, MP3, Ogg or AIFF file.
+            voice: The voice of the file, None for the default voice.
+
+        Raises:
+            ValueError: If the file type is not supported.
+        """
+        path = Path(path)
+
+        if path.suffix.lower() not in FORMATS_BY_SUFFIX:
+            raise ValueError(f"Unsupported audio file: {path}")
+
+        self._files[pack_key(text, voice)] = path
+
+    def add_directory(
+        self,
+        directory: str | Path,
+        texts: Mapping[str, str] | None = None,
+        voices: Mapping[str, str | None] | None = None,
+    ) -> None:
+        """Add the audio files of a directory.
+
+        Args:
+            directory: The directory holding the files.
+            texts: The text of each file by file stem. Without it the stem is
+                used as the text. Files missing from it are skipped.
+            voices: The voice of each file by file stem.
+        """
+        for path in sorted(Path(directory).iterdir()):
+            # Hidden files include the partial files of interrupted batches.
+            if path.name.startswith(".") or path.suffix.lower() not in (
+                FORMATS_BY_SUFFIX
+            ):
+                continue
+
+            if texts is not None and path.stem not in texts:
+                continue
+
+            text: str = path.stem if texts is None else texts[path.stem]
+            self.add_file(text, path, None if voices is None else voices[path.stem])
+
+    def write(self, path: str | Path) -> None:
+        """Write the pack, replacing an existing file only once it is complete.
+
+        Args:
+            path: The pack file to write.
+        """
+        path = Path(path)
+        partial_path: Path = path.with_name(f".{path.name}.partial")
+        records: list[bytes] = []
+        offset: int = _align(HEADER.size + RECORD.size * len(self._files))
+
+        with partial_path.open("wb") as pack:
+            pack.seek(offset)
+
+            for key, file_path in self._files.items():
+                audio_format, data, sample_rate, channels, duration = _read_clip(
+                    file_path
+                )
+                pack.write(data)
+                records.append(
+                    RECORD.pack(
+                        key,
+                        offset,
+                        len(data),
+                        audio_format.value.encode("ascii"),
+                        sample_rate or 0,
+                        channels,
+                        duration,
+                    )
+                )
+                offset += len(data)
+                padding: int = _align(offset) - offset
+                pack.write(bytes(padding))
+                offset += padding
+
+            pack.seek(0)
+            pack.write(HEADER.pack(MAGIC, VERSION, len(records)))
+            pack.writelines(records)
+
+        os.replace(partial_path, path)
+        logger.debug(f"Packed {len(records)} clips into {path}")
+
+
+class AudioPack:
+    """Read-only memory-mapped audio pack with constant time clip lookup."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open an audio pack.
+
+        Args:
+            path: The pack file.
+
+        Raises:
+            ValueError: If the file is not an audio pack of a supported version.
+        """
+        self._path = Path(path)
+
+        with self._path.open("rb") as pack:
+            self._mmap = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+        magic, version, count = HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self._path} is not a version {VERSION} audio pack.")
+
+        self._index: dict[bytes, IndexEntry] = {}
+
+        index_records: bytes = self._mmap[
+            HEADER.size : HEADER.size + RECORD.size * count
+        ]
+
+        for record in RECORD.iter_unpack(index_records):
+            key, offset, length, audio_format, sample_rate, channels, duration = record
+            self._index[key] = (
+                offset,
+                length,
+                AudioFormat(audio_format.rstrip(b"\x00").decode("ascii")),
+                sample_rate or None,
+                channels,
+                duration,
+            )
+
+    @property
+    def path(self) -> Path:
+        """The pack file."""
+        return self._path
+
+    def get(self, text: str, voice: str | None = None) -> PackedClip | None:
+        """Get the clip of a text.
+
+        Args:
+            text: The text of the clip.
+            voice: The voice of the clip, None for the default voice.
+
+        Returns:
+            The clip viewing the mapped audio, None when it is not in the pack.
+        """
+        entry: IndexEntry | None = self._index.get(pack_key(text, voice))
+
+        if entry is None:
+            return None
+
+        offset, length, audio_format, sample_rate, channels, duration = entry
+        return PackedClip(
+            format=audio_format,
+            data=self._view[offset : offset + length],
+            sample_rate=sample_rate,
+            channels=channels,
+            duration=duration,
+        )
+
+    def __contains__(self, text: object) -> bool:
+        """Whether the pack has a clip of the text in the default voice."""
+        return isinstance(text, str) and pack_key(text) in self._index
+
+    def __len__(self) -> int:
+        """The number of clips."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the keys of the clips."""
+        return iter(self._index)
+
+    def __reduce__(self) -> tuple[type[AudioPack], tuple[Path]]:
+        """Pickle by path, so worker processes map the same file themselves."""
+        return (AudioPack, (self._path,))
+
+    def close(self) -> None:
+        """Unmap the pack.
+
+        Raises:
+            BufferError: If clips handed out by get are still referenced.
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Use the pack as a context manager that closes it."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the pack."""
+        self.close()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _read_clip(path: Path) -> tuple[AudioFormat, bytes, int | None, int, float]:
+    """Read a file's audio, WAV files are stored as their raw PCM."""
+    audio_format: AudioFormat = FORMATS_BY_SUFFIX[path.suffix.lower()]
+
+    if audio_format != AudioFormat.WAV:
+        return audio_format, path.read_bytes(), None, 1, 0.0
+
+    with wave.open(str(path), "rb") as wav_file:
+        if wav_file.getsampwidth() != PCM16_SAMPLE_WIDTH:
+            raise ValueError(f"Expected 16-bit PCM WAV audio: {path}")
+
+        frame_count: int = wav_file.getnframes()
+        sample_rate: int = wav_file.getframerate()
+        return (
+            AudioFormat.PCM16,
+            wav_file.readframes(frame_count),
+            sample_rate,
+            wav_file.getnchannels(),
+            frame_count / sample_rate,
+        )
@@ -0,0 +1,210 @@
+"""Define the AudioPostProcessor class.
+
+TTS providers pad every clip with leading and trailing silence, which adds up to
+dead air when sentences are played back to back. The post processor trims that
+silence with a vectorized frame energy threshold, replaces it with a pause that
+depends on how the sentence ended and fades clip boundaries into each other so
+the trimmed edges do not click.
+
+Clips are processed in playback order. The last few milliseconds of each clip
+are held back until the next clip (or flush) arrives so they can be blended.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.utils.audio import (
+    Float32Array,
+    Int16Array,
+    as_bytes,
+    as_int16,
+    float32_to_int16,
+    int16_to_float32,
+)
+
+DEFAULT_PAUSES: dict[str, float] = {
+    ".": 0.25,
+    "!": 0.25,
+    "?": 0.3,
+    ",": 0.12,
+    ";": 0.18,
+    ":": 0.18,
+}
+
+
+@dataclass(frozen=True)
+class PostProcessingOptions:
+    """Options of the audio post processor.
+
+    Attributes:
+        silence_threshold_db: Frames quieter than this level in dBFS are silence.
+        frame_duration: The length of the frames analyzed for silence in seconds.
+        keep_silence: Silence kept around the speech when trimming in seconds.
+        crossfade_duration: The length of the fade between clips in seconds.
+        pauses: Pause inserted after a clip by its final punctuation in seconds.
+        default_pause: Pause inserted after a clip without known punctuation.
+    """
+
+    silence_threshold_db: float = -45.0
+    frame_duration: float = 0.01
+    keep_silence: float = 0.02
+    crossfade_duration: float = 0.015
+    pauses: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_PAUSES))
+    default_pause: float = 0.2
+
+
+def trim_silence(
+    samples: Int16Array,
+    sample_rate: int,
+    threshold_db: float = -45.0,
+    frame_duration: float = 0.01,
+    keep_silence: float = 0.02,
+) -> Int16Array:
+    """Remove leading and trailing silence from mono int16 audio.
+
+    Args:
+        samples: The mono int16 samples.
+        sample_rate: The sample rate of the audio in Hz.
+        threshold_db: Frames with an RMS level below this in dBFS are silence.
+        frame_duration: The length of the analyzed frames in seconds.
+        keep_silence: Silence to keep before and after the speech in seconds.
+
+    Returns:
+        A view of the samples without the silence, empty if everything is silent.
+    """
+    frame_length: int = max(1, round(sample_rate * frame_duration))
+    frame_count: int = samples.shape[0] // frame_length
+
+    if frame_count == 0:
+        return samples
+
+    frames: Float32Array = int16_to_float32(
+        samples[: frame_count * frame_length]
+    ).reshape(frame_count, frame_length)
+    rms: Float32Array = np.sqrt(np.mean(np.square(frames), axis=1))
+    threshold: float = 10 ** (threshold_db / 20)
+    loud_frames = np.flatnonzero(rms >= threshold)
+
+    if loud_frames.size == 0:
+        return samples[:0]
+
+    keep: int = round(sample_rate * keep_silence)
+    start: int = max(0, int(loud_frames[0]) * frame_length - keep)
+    end: int = min(samples.shape[0], (int(loud_frames[-1]) + 1) * frame_length + keep)
+    return samples[start:end]
+
+
+class AudioPostProcessor:
+    """Trims, spaces and crossfades consecutive mono PCM clips."""
+
+    def __init__(self, options: PostProcessingOptions | None = None) -> None:
+        """Initialize the AudioPostProcessor instance.
+
+        Args:
+            options: The post processing options, defaults when None.
+        """
+        self._options: PostProcessingOptions = options or PostProcessingOptions()
+        self._tail: Float32Array | None = None
+        self._pause: float = 0.0
+
+    def pause_after(self, text: str) -> float:
+        """Get the pause to insert after the clip of the given text.
+
+        Args:
+            text: The text of the clip.
+
+        Returns:
+            The pause in seconds.
+        """
+        stripped: str = text.rstrip(" \t\n\"')]")
+
+        if not stripped:
+            return self._options.default_pause
+
+        return self._options.pauses.get(stripped[-1], self._options.default_pause)
+
+    def process(self, audio: PcmAudio, text: str = "") -> PcmAudio:
+        """Post process the next clip.
+
+        Args:
+            audio: The mono clip to process.
+            text: The text of the clip, used to pick the pause that follows it.
+
+        Returns:
+            The audio that is ready to play, which ends shortly before the clip
+            ends since the end is held back for the next crossfade.
+        """
+        options: PostProcessingOptions = self._options
+        sample_rate: int = audio.sample_rate
+        trimmed: Int16Array = trim_silence(
+            as_int16(audio.data),
+            sample_rate,
+            threshold_db=options.silence_threshold_db,
+            frame_duration=options.frame_duration,
+            keep_silence=options.keep_silence,
+        )
+        clip: Float32Array = int16_to_float32(trimmed)
+        fade_length: int = min(
+            round(sample_rate * options.crossfade_duration),
+            clip.shape[0] // 2,
+        )
+
+        if fade_length > 0:
+            clip[:fade_length] *= np.linspace(0, 1, fade_length, dtype=np.float32)
+
+        if self._tail is None:
+            joined: Float32Array = clip
+        else:
+            joined = self._join(self._tail, clip, round(sample_rate * self._pause))
+
+        self._pause = self.pause_after(text)
+        split: int = joined.shape[0] - fade_length
+        self._tail = joined[split:].copy()
+        return self._to_pcm(joined[:split], sample_rate)
+
+    def flush(self, sample_rate: int) -> PcmAudio:
+        """Return the held back end of the last clip and reset for a new response.
+
+        Args:
+            sample_rate: The sample rate of the processed clips in Hz.
+
+        Returns:
+            The faded out end of the last clip.
+        """
+        tail: Float32Array = (
+            np.zeros(0, dtype=np.float32) if self._tail is None else self._tail
+        )
+        tail *= np.linspace(1, 0, tail.shape[0], dtype=np.float32)
+        self._tail = None
+        self._pause = 0.0
+        return self._to_pcm(tail, sample_rate)
+
+    def _join(
+        self,
+        tail: Float32Array,
+        clip: Float32Array,
+        pause_length: int,
+    ) -> Float32Array:
+        """Fade the tail out and place the clip after the pause.
+
+        Without a pause the fade out and the clip's fade in overlap, producing a
+        crossfade.
+        """
+        tail = tail * np.linspace(1, 0, tail.shape[0], dtype=np.float32)
+        overlap: int = max(0, min(tail.shape[0], clip.shape[0]) - pause_length)
+        clip_start: int = tail.shape[0] + pause_length - overlap
+        joined = np.zeros(clip_start + clip.shape[0], dtype=np.float32)
+        joined[: tail.shape[0]] = tail
+        joined[clip_start:] += clip
+        return joined
+
+    def _to_pcm(self, samples: Float32Array, sample_rate: int) -> PcmAudio:
+        return PcmAudio(
+            data=as_bytes(float32_to_int16(samples)),
+            sample_rate=sample_rate,
+        )
@@ -0,0 +1,117 @@
+"""Define the CancelScope class.
+
+Closing an HTTP response from another thread does not wake the thread that is
+blocked reading it, the read only returns once the server sends more data. A
+cancel scope collects the httpx responses opened on its thread through the
+track_response event hook, and cancel shuts their sockets down, which makes the
+blocked read fail right away.
+
+Example:
+    client = httpx.Client(event_hooks={"response": [track_response]})
+
+    with scope:
+        # scope.cancel() on another thread ends the read immediately.
+        for line in client.stream("GET", url).iter_lines():
+            ...
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    import httpx
+
+_scope: ContextVar[CancelScope | None] = ContextVar("cancel_scope", default=None)
+
+
+def track_response(response: httpx.Response) -> None:
+    """Add a response to the cancel scope of the current thread, if any.
+
+    Meant to be registered as a "response" event hook of an httpx client, which
+    runs once the headers have arrived and before the body is read.
+
+    Args:
+        response: The response that was opened.
+    """
+    scope: CancelScope | None = _scope.get()
+
+    if scope is not None:
+        scope._add(response)
+
+
+class CancelScope:
+    """Aborts the HTTP responses opened in a block from another thread."""
+
+    def __init__(self) -> None:
+        """Create a new CancelScope instance."""
+        self._responses: list[httpx.Response] = []
+        self._cancelled: bool = False
+        self._exited: bool = False
+        self._token: Token[CancelScope | None] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel was called."""
+        return self._cancelled
+
+    def __enter__(self) -> Self:
+        """Track the responses opened on the current thread."""
+        self._token = _scope.set(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop tracking responses, later cancels have no effect."""
+        assert self._token is not None
+        _scope.reset(self._token)
+
+        with self._lock:
+            self._exited = True
+            self._responses.clear()
+
+    def cancel(self) -> None:
+        """Abort the open responses and any response opened later in the block.
+
+        Safe to call from any thread, the reads of the responses fail with a
+        connection error.
+        """
+        with self._lock:
+            self._cancelled = True
+
+            if self._exited:
+                return
+
+            for response in self._responses:
+                _abort(response)
+
+    def _add(self, response: httpx.Response) -> None:
+        with self._lock:
+            if self._cancelled:
+                _abort(response)
+            else:
+                self._responses.append(response)
+
+
+def _abort(response: httpx.Response) -> None:
+    """Shut down the socket of a response that is still being read."""
+    if response.is_closed:
+        # Its connection may already serve another request.
+        return
+
+    network_stream = response.extensions.get("network_stream")
+    sock: socket.socket | None = (
+        None if network_stream is None else network_stream.get_extra_info("socket")
+    )
+
+    if sock is None:
+        return
+
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # Already closed by the reading thread.
+        pass
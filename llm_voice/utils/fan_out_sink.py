@@ -0,0 +1,194 @@
+"""Define the FanOutSink class.
+
+The fan-out sink hands the PCM audio of a response to several sinks, for
+example the speakers of several rooms and a recording, so the audio is only
+synthesized and decoded once however many outputs there are.
+
+The first sink is played on the caller's thread and paces synthesis like a
+single player would. Every other sink has its own thread and queue, so a slow
+or stalled sink never holds up the others: once a sink falls more than max_lag
+seconds behind, new audio is dropped for that sink until it catches up, and a
+sink that fails is detached with a warning. Closing waits for a sink at most
+max_lag plus CLOSE_GRACE_SECONDS, a sink that takes longer is detached as well.
+
+Example:
+    def player_factory(output_device: AudioDevice) -> PcmSink:
+        return FanOutSink(
+            [PcmPlayer(output_device), PcmPlayer(kitchen), WavFileSink("answer.wav")]
+        )
+
+    VoiceResponderFast(client, output_device, player_factory=player_factory)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from llm_voice.utils.logger import logger
+from llm_voice.utils.pcm_sink import PcmSink
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+
+DEFAULT_MAX_LAG = 2.0
+
+# Time a sink gets to close on top of playing its queued audio.
+CLOSE_GRACE_SECONDS = 2.0
+
+
+class FanOutSink(PcmSink):
+    """Sink that distributes the same audio to several sinks."""
+
+    def __init__(
+        self,
+        sinks: Sequence[PcmSink],
+        max_lag: float | None = DEFAULT_MAX_LAG,
+    ) -> None:
+        """Create a new FanOutSink instance.
+
+        Args:
+            sinks: The sinks to distribute to. The first one paces the caller
+                and should play in real time.
+            max_lag: The seconds of audio queued for each of the other sinks
+                before audio is dropped for it. None never drops audio, and
+                closing then waits for the other sinks however long they take.
+        """
+        if not sinks:
+            raise ValueError("Expected at least one sink.")
+
+        self._primary: PcmSink = sinks[0]
+        self._followers: list[_Follower] = [
+            _Follower(sink, max_lag) for sink in sinks[1:]
+        ]
+
+    @property
+    def dropped_seconds(self) -> list[float]:
+        """The seconds of audio dropped for each sink after the first."""
+        return [follower.dropped_seconds for follower in self._followers]
+
+    def play(self, audio: PcmAudio) -> None:
+        """Queue the audio on every sink.
+
+        Blocks like the first sink does, the other sinks never block.
+
+        Args:
+            audio: The audio to play.
+        """
+        for follower in self._followers:
+            follower.put(audio)
+
+        self._primary.play(audio)
+
+    def close(self) -> None:
+        """Close every sink once it has finished its queued audio.
+
+        Sinks after the first that do not finish in time are detached.
+        """
+        try:
+            self._primary.close()
+        finally:
+            for follower in self._followers:
+                follower.close()
+
+
+class _Follower:
+    """Feeds one sink from its own queue on its own thread."""
+
+    def __init__(self, sink: PcmSink, max_lag: float | None) -> None:
+        self.dropped_seconds: float = 0.0
+        self._sink: PcmSink = sink
+        self._max_lag: float | None = max_lag
+        self._queue: deque[PcmAudio] = deque()
+        self._queued_seconds: float = 0.0
+        self._condition = threading.Condition()
+        self._closed: bool = False
+        self._failed: bool = False
+        self._thread: threading.Thread | None = None
+
+    def put(self, audio: PcmAudio) -> None:
+        with self._condition:
+            if self._failed:
+                return
+
+            if (
+                self._max_lag is not None
+                and self._queued_seconds + audio.duration > self._max_lag
+            ):
+                if not self.dropped_seconds:
+                    logger.warning(
+                        f"FanOutSink: {self._sink} is lagging, dropping audio"
+                    )
+
+                self.dropped_seconds += audio.duration
+                return
+
+            # The thread only starts once there is audio, and restarts after close.
+            if self._thread is None:
+                self._closed = False
+                self._thread = threading.Thread(
+                    target=self._run, name="fan-out-sink", daemon=True
+                )
+                self._thread.start()
+
+            self._queue.append(audio)
+            self._queued_seconds += audio.duration
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            thread: threading.Thread | None = self._thread
+            self._closed = True
+            self._condition.notify()
+
+        if thread is None:
+            return
+
+        thread.join(
+            None if self._max_lag is None else self._max_lag + CLOSE_GRACE_SECONDS
+        )
+
+        with self._condition:
+            self._thread = None
+
+            if thread.is_alive():
+                # The thread stays blocked in the sink, which gets no more audio.
+                logger.warning(
+                    f"FanOutSink: detaching {self._sink}, it did not finish in time"
+                )
+                self._failed = True
+                self._queue.clear()
+                self._queued_seconds = 0.0
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while not self._queue and not self._closed:
+                        self._condition.wait()
+
+                    if not self._queue:
+                        break
+
+                    audio: PcmAudio = self._queue[0]
+
+                self._sink.play(audio)
+
+                with self._condition:
+                    if self._failed:
+                        # Detached by close while the sink was blocked.
+                        return
+
+                    self._queue.popleft()
+                    self._queued_seconds -= audio.duration
+
+            self._sink.close()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"FanOutSink: detaching {self._sink} after error: {e}")
+
+            with self._condition:
+                self._failed = True
+                self._queue.clear()
+                self._queued_seconds = 0.0
@@ -0,0 +1,157 @@
+"""Define the FillerClips class.
+
+A filler clip is a short acknowledgement such as "Let me check", a breath or a
+chime that is played when the first token of a response is slow to arrive. The
+clips are rendered once ahead of time and loaded from a directory of WAV files,
+so playing one costs no synthesis. An optional keywords.json in the directory
+maps clip names to the words of a request that the clip fits:
+
+    {"let_me_check": ["what", "when", "how", "?"], "sure": ["can you", "please"]}
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.interfaces.filler_clip import FillerClip
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.utils.logger import logger
+from llm_voice.utils.wav_file import read_wav, write_wav
+
+if TYPE_CHECKING:
+    from llm_voice.tts.base import TextToSpeechClient
+
+KEYWORDS_FILE_NAME = "keywords.json"
+
+
+class FillerClips:
+    """Set of filler clips that picks the clip fitting a request."""
+
+    def __init__(self, clips: Iterable[FillerClip]) -> None:
+        """Create a new FillerClips instance.
+
+        Args:
+            clips: The clips to choose from.
+        """
+        self._clips: list[FillerClip] = list(clips)
+        self._uses = itertools.count(1)
+        self._last_used: dict[str, int] = {}
+
+    @classmethod
+    def from_directory(cls, directory: str | Path) -> FillerClips:
+        """Load the WAV files of a directory and their keywords.
+
+        Args:
+            directory: The directory holding the clips and keywords.json.
+
+        Returns:
+            The clips, named after their file stems.
+        """
+        directory = Path(directory)
+        keywords_path: Path = directory / KEYWORDS_FILE_NAME
+        keywords: dict[str, list[str]] = (
+            json.loads(keywords_path.read_text(encoding="utf-8"))
+            if keywords_path.exists()
+            else {}
+        )
+        clips: list[FillerClip] = []
+
+        for path in sorted(directory.glob("*.wav")):
+            pcm, sample_rate, channels = read_wav(path)
+            clips.append(
+                FillerClip(
+                    name=path.stem,
+                    audio=PcmAudio(pcm, sample_rate, channels),
+                    keywords=tuple(
+                        keyword.lower() for keyword in keywords.get(path.stem, [])
+                    ),
+                )
+            )
+
+        logger.debug(f"Loaded {len(clips)} filler clips from {directory}")
+        return cls(clips)
+
+    @classmethod
+    def render(
+        cls,
+        text_to_speech_client: TextToSpeechClient,
+        phrases: Mapping[str, str],
+        directory: str | Path,
+        keywords: Mapping[str, Iterable[str]] | None = None,
+    ) -> FillerClips:
+        """Synthesize phrases into a clip directory that from_directory loads.
+
+        Args:
+            text_to_speech_client: A client that can synthesize PCM audio.
+            phrases: The text of each clip by clip name.
+            directory: The directory to write the clips to.
+            keywords: The keywords of each clip by clip name.
+
+        Returns:
+            The rendered clips.
+
+        Raises:
+            ValueError: If the client cannot synthesize PCM audio.
+        """
+        if AudioFormat.PCM16 not in text_to_speech_client.supported_formats:
+            raise ValueError(
+                f"{type(text_to_speech_client).__name__} cannot synthesize PCM audio."
+            )
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        spec = text_to_speech_client.negotiate_format([AudioFormat.PCM16])
+        assert spec.sample_rate is not None
+
+        for name, phrase in phrases.items():
+            write_wav(
+                directory / f"{name}.wav",
+                text_to_speech_client.synthesize(phrase),
+                spec.sample_rate,
+            )
+
+        if keywords is not None:
+            (directory / KEYWORDS_FILE_NAME).write_text(
+                json.dumps({name: list(words) for name, words in keywords.items()}),
+                encoding="utf-8",
+            )
+
+        return cls.from_directory(directory)
+
+    def __len__(self) -> int:
+        """The number of clips."""
+        return len(self._clips)
+
+    def choose(self, context: str | None = None) -> FillerClip | None:
+        """Pick the clip for a request, rotating through equally good clips.
+
+        Clips with a keyword found in the context are preferred, then clips
+        without keywords. Among them the one played longest ago is picked so
+        the same acknowledgement is not heard twice in a row.
+
+        Args:
+            context: The user's request, None when unknown.
+
+        Returns:
+            The clip to play, None when there are no clips.
+        """
+        lowered: str = (context or "").lower()
+        candidates: list[FillerClip] = [
+            clip
+            for clip in self._clips
+            if any(keyword in lowered for keyword in clip.keywords)
+        ] or [clip for clip in self._clips if not clip.keywords]
+
+        if not candidates:
+            return None
+
+        clip: FillerClip = min(
+            candidates, key=lambda clip: self._last_used.get(clip.name, 0)
+        )
+        self._last_used[clip.name] = next(self._uses)
+        return clip
@@ -0,0 +1,130 @@
+"""Define the LookaheadBudget class.
+
+The budget limits how much audio, in seconds, is synthesized ahead of playback.
+A sentence reserves its estimated duration before it is sent to the text to
+speech client, the reservation is corrected to the real duration once the audio
+is available and released after it has played. When the horizon is used up the
+next reservation blocks, which stops the responder from reading further tokens
+from the LLM stream until playback catches up.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+
+# Typical speaking rate of TTS voices, used until the real duration is known.
+WORDS_PER_SECOND = 2.5
+
+
+def estimate_speech_duration(text: str, speech_rate: float = 1.0) -> float:
+    """Estimate how long speaking the given text takes.
+
+    Args:
+        text: The text to speak.
+        speech_rate: The speed of speech.
+
+    Returns:
+        The estimated duration in seconds.
+    """
+    return max(1, len(text.split())) / (WORDS_PER_SECOND * speech_rate)
+
+
+class Reservation:
+    """Seconds of audio reserved from a LookaheadBudget."""
+
+    def __init__(self, budget: LookaheadBudget, seconds: float) -> None:
+        """Create a new Reservation instance, use LookaheadBudget.reserve instead.
+
+        Args:
+            budget: The budget the seconds are reserved from.
+            seconds: The reserved seconds.
+        """
+        self._budget: LookaheadBudget = budget
+        self.seconds: float = seconds
+        self.released: bool = False
+
+    def resize(self, seconds: float) -> None:
+        """Change the reserved seconds, for example to the real audio duration.
+
+        Args:
+            seconds: The new number of reserved seconds.
+        """
+        self._budget._update(self, seconds)
+
+    def release(self) -> None:
+        """Return the reserved seconds to the budget, only the first call counts."""
+        self._budget._update(self, 0.0, release=True)
+
+
+class LookaheadBudget:
+    """Blocking budget of seconds of audio synthesized ahead of playback."""
+
+    def __init__(self, horizon: float | None) -> None:
+        """Create a new LookaheadBudget instance.
+
+        Args:
+            horizon: The maximum seconds of audio reserved at once, None for no
+                limit.
+        """
+        if horizon is not None and horizon <= 0:
+            raise ValueError("horizon must be positive.")
+
+        self._horizon: float = math.inf if horizon is None else horizon
+        self._reserved: float = 0.0
+        self._reservation_count: int = 0
+        self._condition = threading.Condition()
+
+    @property
+    def reserved(self) -> float:
+        """The seconds of audio currently reserved."""
+        with self._condition:
+            return self._reserved
+
+    def reserve(self, seconds: float) -> Reservation:
+        """Reserve seconds of audio, blocking while the horizon is used up.
+
+        A reservation is always granted when nothing else is reserved, so a
+        single sentence longer than the horizon does not block forever.
+
+        Args:
+            seconds: The seconds to reserve.
+
+        Returns:
+            The reservation, to be released once the audio has played.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self._reservation_count == 0
+                    or self._reserved + seconds <= self._horizon
+                )
+            )
+            self._reserved += seconds
+            self._reservation_count += 1
+            return Reservation(self, seconds)
+
+    def close(self) -> None:
+        """Lift the limit and wake blocked reservations, for example on shutdown."""
+        with self._condition:
+            self._horizon = math.inf
+            self._condition.notify_all()
+
+    def _update(
+        self,
+        reservation: Reservation,
+        seconds: float,
+        release: bool = False,
+    ) -> None:
+        with self._condition:
+            if reservation.released:
+                return
+
+            self._reserved += seconds - reservation.seconds
+            reservation.seconds = seconds
+
+            if release:
+                reservation.released = True
+                self._reservation_count -= 1
+
+            self._condition.notify_all()
@@ -25,8 +25,12 @@ class Mp3File:
         """
         self._audio_filename: Path = audio_filename
 
-    def play(self) -> None:
-        """Speak the referenced text on the machine speakers."""
+    def play(self, speed: float = 1.0) -> None:
+        """Speak the referenced text on the machine speakers.
+
+        Args:
+            speed: The playback speed, changed without changing the pitch.
+        """
         try:
             platform_name: str = platform.system().lower()
             logger.debug(f"Platform name: {platform_name}")
@@ -42,6 +46,9 @@ class Mp3File:
                     str(self._audio_filename),
                 ]
 
+                if speed != 1.0:
+                    cmd += ["--rate", str(speed)]
+
                 logger.debug(f"Running command: {cmd}")
                 subprocess.call(cmd)
             elif platform_name == "win32" or platform_name == "cygwin":
@@ -49,6 +56,9 @@ class Mp3File:
 
                 # TODO @JakeCyr: Test on Windows
                 # https://gitlab.com/gpt-home-assistant/home-assistant-core/-/issues/29
+                if speed != 1.0:
+                    logger.warning("Playback speed is not supported on Windows.")
+
                 os.system(f"start {self._audio_filename}")  # noqa: S605
             else:
                 # TODO @JakeCyr: Test on Windows
@@ -62,6 +72,10 @@ class Mp3File:
                     "-autoexit",
                     str(self._audio_filename),
                 ]
+
+                if speed != 1.0:
+                    cmd += ["-af", _atempo_filter(speed)]
+
                 subprocess.call(cmd)
 
         except Exception as e:
@@ -70,3 +84,19 @@ class Mp3File:
     def remove(self) -> None:
         """Remove the file."""
         self._audio_filename.unlink(missing_ok=True)
+
+
+def _atempo_filter(speed: float) -> str:
+    """Build an ffmpeg atempo filter chain, each stage limited to 0.5 to 2.0."""
+    stages: list[str] = []
+
+    while speed > 2.0:
+        stages.append("atempo=2.0")
+        speed /= 2.0
+
+    while speed < 0.5:
+        stages.append("atempo=0.5")
+        speed /= 0.5
+
+    stages.append(f"atempo={speed}")
+    return ",".join(stages)
@@ -0,0 +1,148 @@
+"""Define the PcmPlayer class."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from llm_voice.errors.respond_error import RespondError
+from llm_voice.interfaces.pcm_audio import PCM16_SAMPLE_WIDTH
+from llm_voice.utils.logger import logger
+from llm_voice.utils.pcm_ring_buffer import PcmRingBuffer
+from llm_voice.utils.pcm_sink import PcmSink
+from llm_voice.utils.port_audio import PortAudioContext
+
+if TYPE_CHECKING:
+    from pyaudio import PyAudio
+
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+
+DEFAULT_BUFFER_DURATION = 0.5
+DEFAULT_PERIOD_DURATION = 0.02
+
+
+class PcmPlayer(PcmSink):
+    """Player that streams in-memory PCM audio to an output device.
+
+    Audio is copied into a preallocated ring buffer that the PortAudio callback
+    reads from, so playback continues smoothly while the next clip is prepared
+    and no per-chunk buffers are allocated on the real-time path.
+    """
+
+    def __init__(
+        self,
+        output_device: AudioDevice,
+        buffer_duration: float = DEFAULT_BUFFER_DURATION,
+        period_duration: float = DEFAULT_PERIOD_DURATION,
+    ) -> None:
+        """Initialize the PcmPlayer instance.
+
+        Args:
+            output_device: The output device to play audio on.
+            buffer_duration: The seconds of audio the ring buffer holds.
+            period_duration: The seconds of audio requested by each callback.
+        """
+        self._output_device: AudioDevice = output_device
+        self._buffer_duration: float = buffer_duration
+        self._period_duration: float = period_duration
+        self._context: PortAudioContext = PortAudioContext.get()
+        self._stream: PyAudio.Stream | None = None
+        self._stream_format: tuple[int, int] | None = None
+        self._ring_buffer: PcmRingBuffer | None = None
+        self._continue_flag: int = 0
+        self._underruns: int = 0
+        self._overruns: int = 0
+
+    @property
+    def underruns(self) -> int:
+        """The number of callbacks that found less audio buffered than needed."""
+        ring_buffer: PcmRingBuffer | None = self._ring_buffer
+        return self._underruns + (0 if ring_buffer is None else ring_buffer.underruns)
+
+    @property
+    def overruns(self) -> int:
+        """The number of clips that had to wait for room in the buffer."""
+        ring_buffer: PcmRingBuffer | None = self._ring_buffer
+        return self._overruns + (0 if ring_buffer is None else ring_buffer.overruns)
+
+    def play(self, audio: PcmAudio) -> None:
+        """Queue the audio, blocking until it fits into the ring buffer.
+
+        The output stream is kept open between calls and only reopened when the
+        sample rate or channel count changes.
+
+        Args:
+            audio: The audio to play.
+        """
+        try:
+            self._get_stream(audio.sample_rate, audio.channels)
+            assert self._ring_buffer is not None
+            self._ring_buffer.write(audio.data)
+        except Exception as e:
+            raise RespondError(f"Error playing PCM audio: {e}") from e
+
+    def close(self) -> None:
+        """Close the output stream after the queued audio has played.
+
+        The shared PortAudio context stays initialized for the next player.
+        """
+        if self._stream is None or self._ring_buffer is None:
+            return
+
+        self._ring_buffer.close()
+        self._ring_buffer.wait_until_empty()
+        # Stopping waits for the buffers already handed to the device to play.
+        self._context.close_stream(self._stream)
+        self._underruns += self._ring_buffer.underruns
+        self._overruns += self._ring_buffer.overruns
+        self._stream = None
+        self._ring_buffer = None
+        logger.debug(
+            f"PcmPlayer closed with {self.underruns} underruns and "
+            f"{self.overruns} overruns"
+        )
+
+    def _get_stream(self, sample_rate: int, channels: int) -> PyAudio.Stream:
+        if self._stream is not None and self._stream_format == (sample_rate, channels):
+            return self._stream
+
+        self.close()
+
+        from pyaudio import paContinue, paInt16
+
+        logger.debug(
+            f"Opening {sample_rate}Hz {channels} channel output stream on "
+            f"{self._output_device.name}"
+        )
+        frame_size: int = PCM16_SAMPLE_WIDTH * channels
+        self._continue_flag = paContinue
+        self._ring_buffer = PcmRingBuffer(
+            capacity=round(sample_rate * self._buffer_duration) * frame_size,
+            frame_size=frame_size,
+        )
+        # The callback can run as soon as the stream opens.
+        self._stream_format = (sample_rate, channels)
+        self._stream = self._context.open_stream(
+            format=paInt16,
+            channels=channels,
+            rate=sample_rate,
+            output=True,
+            output_device_index=self._output_device.index,
+            frames_per_buffer=max(1, round(sample_rate * self._period_duration)),
+            stream_callback=self._callback,
+        )
+        return self._stream
+
+    def _callback(
+        self,
+        _in_data: bytes | None,
+        frame_count: int,
+        _time_info: Mapping[str, float],
+        _status: int,
+    ) -> tuple[bytes, int]:
+        """Hand the next period of audio to PortAudio, padded with silence."""
+        ring_buffer: PcmRingBuffer | None = self._ring_buffer
+        assert ring_buffer is not None and self._stream_format is not None
+        frame_size: int = PCM16_SAMPLE_WIDTH * self._stream_format[1]
+        return ring_buffer.read(frame_count * frame_size), self._continue_flag
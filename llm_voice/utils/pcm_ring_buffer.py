@@ -0,0 +1,258 @@
+"""Define the PcmRingBuffer class.
+
+The ring buffer hands PCM audio from the synthesis side to the audio output
+callback. Its storage is a single bytearray allocated up front, writes copy the
+producer's buffer straight into it through memoryview slices and reads copy out
+of it into the consumer's buffer, so no intermediate chunks are allocated on the
+way to the device.
+
+It is built for one producer thread and one consumer thread. Positions only
+grow and each is only advanced by its own side, so copies happen outside of any
+lock and the condition variable is only used to wake a side that is waiting.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class PcmRingBuffer:
+    """Fixed capacity single-producer single-consumer byte ring buffer for PCM."""
+
+    def __init__(self, capacity: int, frame_size: int = 2) -> None:
+        """Create a new PcmRingBuffer instance.
+
+        Args:
+            capacity: The capacity in bytes, rounded down to whole frames.
+            frame_size: The bytes per frame, reads and writes keep frames whole.
+        """
+        if capacity < frame_size:
+            raise ValueError("capacity must hold at least one frame.")
+
+        self._capacity: int = capacity - capacity % frame_size
+        self._frame_size: int = frame_size
+        self._storage = bytearray(self._capacity)
+        self._view = memoryview(self._storage)
+        self._silence = bytes(self._capacity)
+        self._silence_blocks: dict[int, bytes] = {}
+        self._write_position: int = 0
+        self._read_position: int = 0
+        self._closed: bool = False
+        self._condition = threading.Condition()
+        self.underruns: int = 0
+        self.overruns: int = 0
+        self.dropped_bytes: int = 0
+
+    @property
+    def capacity(self) -> int:
+        """The capacity in bytes."""
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """The number of bytes that can be read."""
+        return self._write_position - self._read_position
+
+    @property
+    def free(self) -> int:
+        """The number of bytes that can be written without waiting."""
+        return self._capacity - self.available
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer closed the buffer."""
+        return self._closed
+
+    def write(
+        self,
+        data: bytes | bytearray | memoryview,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> int:
+        """Copy PCM into the buffer.
+
+        Each time the buffer is too full to take the data at once an overrun is
+        counted. A blocking write then waits for the consumer, a non-blocking
+        write drops what does not fit.
+
+        Args:
+            data: The PCM bytes, a whole number of frames.
+            block: Whether to wait for free space.
+            timeout: The maximum seconds to wait, None to wait indefinitely.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            ValueError: If the buffer is closed.
+        """
+        if self._closed:
+            raise ValueError("The ring buffer is closed.")
+
+        source = memoryview(data).cast("B")
+        written: int = 0
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+
+        if source.nbytes > self.free:
+            self.overruns += 1
+
+        while written < source.nbytes:
+            free: int = self.free
+            free -= free % self._frame_size
+
+            if free == 0:
+                remaining: float | None = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+
+                if not block or (remaining is not None and remaining <= 0):
+                    self.dropped_bytes += source.nbytes - written
+                    break
+
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: self.free >= self._frame_size or self._closed,
+                        remaining,
+                    )
+
+                if self._closed:
+                    raise ValueError("The ring buffer is closed.")
+
+                continue
+
+            length: int = min(free, source.nbytes - written)
+            self._copy_in(source[written : written + length])
+            written += length
+
+        return written
+
+    def read_into(self, out: bytearray | memoryview, fill_silence: bool = True) -> int:
+        """Copy buffered PCM into the consumer's buffer without blocking.
+
+        Args:
+            out: The buffer to fill, a whole number of frames long.
+            fill_silence: Whether to pad a short read with silence and count it
+                as an underrun.
+
+        Returns:
+            The number of bytes of audio copied, the rest of out is silence
+            when fill_silence is set.
+        """
+        target = memoryview(out).cast("B")
+        length: int = min(target.nbytes, self.available)
+        length -= length % self._frame_size
+        self._copy_out(target[:length])
+
+        if length < target.nbytes and fill_silence:
+            target[length:] = self._silence[: target.nbytes - length]
+
+            if not self._closed:
+                self.underruns += 1
+
+        return length
+
+    def read(self, size: int) -> bytes:
+        """Read up to size bytes, padded with silence to size.
+
+        For consumers such as PyAudio callbacks that must return bytes, the
+        bytes object is the only allocation.
+
+        Args:
+            size: The number of bytes to return, a whole number of frames.
+
+        Returns:
+            The audio, padded with silence when not enough is buffered.
+        """
+        length: int = min(size, self.available)
+        length -= length % self._frame_size
+
+        if length == 0:
+            if not self._closed:
+                self.underruns += 1
+
+            return self._silence_block(size)
+
+        start: int = self._read_position % self._capacity
+        end: int = start + length
+
+        if end <= self._capacity:
+            chunk: bytes = self._view[start:end].tobytes()
+        else:
+            chunk = (
+                self._view[start:].tobytes()
+                + self._view[: end - self._capacity].tobytes()
+            )
+
+        self._advance_read(length)
+
+        if length < size:
+            if not self._closed:
+                self.underruns += 1
+
+            return chunk + self._silence_block(size - length)
+
+        return chunk
+
+    def wait_until_empty(self, timeout: float | None = None) -> bool:
+        """Wait until the consumer has read everything that was written.
+
+        Args:
+            timeout: The maximum seconds to wait, None to wait indefinitely.
+
+        Returns:
+            Whether the buffer is empty.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.available == 0, timeout)
+
+    def close(self) -> None:
+        """Mark the end of the audio and wake a waiting producer.
+
+        Reads still return the remaining audio, after which empty reads are no
+        longer counted as underruns.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reset(self) -> None:
+        """Discard buffered audio and reopen the buffer, with no thread active."""
+        with self._condition:
+            self._write_position = 0
+            self._read_position = 0
+            self._closed = False
+            self._condition.notify_all()
+
+    def _silence_block(self, size: int) -> bytes:
+        """Get silence of the given size, cached since callbacks repeat sizes."""
+        if size not in self._silence_blocks:
+            self._silence_blocks[size] = bytes(size)
+
+        return self._silence_blocks[size]
+
+    def _copy_in(self, source: memoryview) -> None:
+        start: int = self._write_position % self._capacity
+        first: int = min(source.nbytes, self._capacity - start)
+        self._view[start : start + first] = source[:first]
+        self._view[: source.nbytes - first] = source[first:]
+        self._write_position += source.nbytes
+
+        with self._condition:
+            self._condition.notify_all()
+
+    def _copy_out(self, target: memoryview) -> None:
+        if target.nbytes == 0:
+            return
+
+        start: int = self._read_position % self._capacity
+        first: int = min(target.nbytes, self._capacity - start)
+        target[:first] = self._view[start : start + first]
+        target[first:] = self._view[: target.nbytes - first]
+        self._advance_read(target.nbytes)
+
+    def _advance_read(self, length: int) -> None:
+        self._read_position += length
+
+        with self._condition:
+            self._condition.notify_all()
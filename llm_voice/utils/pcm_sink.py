@@ -0,0 +1,29 @@
+"""Define the interface for PCM audio sinks."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+
+
+class PcmSink(ABC):
+    """Destination of the PCM audio of a response.
+
+    Sinks that play in real time block in play while enough audio is queued,
+    which paces synthesis to playback.
+    """
+
+    @abstractmethod
+    def play(self, audio: PcmAudio) -> None:
+        """Queue the audio.
+
+        Args:
+            audio: The audio to play.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the queued audio and release the sink's resources."""
@@ -0,0 +1,129 @@
+"""Define the PortAudioContext class.
+
+Creating a PyAudio instance initializes PortAudio, which probes every host API
+(ALSA, PulseAudio, JACK, CoreAudio, ...) and can take hundreds of milliseconds.
+The context keeps one initialized instance for the whole process, shared by the
+device listing and every output stream, and terminates it at exit.
+
+PortAudio only scans for devices when it is initialized, so picking up devices
+that were plugged in later requires a reinitialization, which is only possible
+while no stream is open.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import TYPE_CHECKING, Any
+
+from llm_voice.utils.logger import logger
+
+if TYPE_CHECKING:
+    from pyaudio import PyAudio
+
+
+class PortAudioContext:
+    """Process wide PortAudio context shared by device listing and playback."""
+
+    _instance: PortAudioContext | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Create a new PortAudioContext instance, PortAudio starts on first use."""
+        self._py_audio: PyAudio | None = None
+        self._open_streams: set[PyAudio.Stream] = set()
+        self._lock = threading.RLock()
+        atexit.register(self.terminate)
+
+    @classmethod
+    def get(cls) -> PortAudioContext:
+        """Get the shared context of the process.
+
+        Returns:
+            The shared PortAudioContext.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+
+            return cls._instance
+
+    @property
+    def py_audio(self) -> PyAudio:
+        """The initialized PyAudio instance."""
+        with self._lock:
+            if self._py_audio is None:
+                from pyaudio import PyAudio
+
+                logger.debug("Initializing PortAudio")
+                self._py_audio = PyAudio()
+
+            return self._py_audio
+
+    @property
+    def open_stream_count(self) -> int:
+        """The number of streams opened through the context that are still open."""
+        with self._lock:
+            return len(self._open_streams)
+
+    def open_stream(self, **kwargs: Any) -> PyAudio.Stream:
+        """Open a stream that is tracked by the context.
+
+        Args:
+            **kwargs: The arguments of PyAudio.open.
+
+        Returns:
+            The opened stream, to be closed with close_stream.
+        """
+        with self._lock:
+            stream: PyAudio.Stream = self.py_audio.open(**kwargs)
+            self._open_streams.add(stream)
+            return stream
+
+    def close_stream(self, stream: PyAudio.Stream) -> None:
+        """Stop and close a stream opened with open_stream.
+
+        Args:
+            stream: The stream to close.
+        """
+        with self._lock:
+            self._open_streams.discard(stream)
+
+        stream.stop_stream()
+        stream.close()
+
+    def reinitialize(self) -> bool:
+        """Restart PortAudio so that it rescans the devices.
+
+        Returns:
+            Whether PortAudio was restarted, False while streams are open.
+        """
+        with self._lock:
+            if self._open_streams:
+                logger.debug(
+                    f"PortAudio rescan deferred, {len(self._open_streams)} "
+                    "streams are open"
+                )
+                return False
+
+            if self._py_audio is not None:
+                self._py_audio.terminate()
+                self._py_audio = None
+
+            return True
+
+    def terminate(self) -> None:
+        """Close the open streams and shut PortAudio down."""
+        with self._lock:
+            for stream in list(self._open_streams):
+                try:
+                    self.close_stream(stream)
+                except OSError as e:
+                    # PyAudio reports PortAudio errors as OSError, the other
+                    # streams still have to be closed.
+                    logger.warning(f"Unable to close audio stream: {e}")
+
+            if self._py_audio is not None:
+                logger.debug("Terminating PortAudio")
+                self._py_audio.terminate()
+                self._py_audio = None
@@ -0,0 +1,48 @@
+"""Define the RateLimiter class."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread safe token bucket limiting the rate of requests to a provider."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1) -> None:
+        """Create a new RateLimiter instance.
+
+        Args:
+            requests_per_second: The sustained number of requests per second.
+            burst: The number of requests that may be made at once after idling.
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive.")
+
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+
+        self._interval: float = 1.0 / requests_per_second
+        self._burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request may be made."""
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                self._tokens = min(
+                    self._burst,
+                    self._tokens + (now - self._updated) / self._interval,
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait: float = (1 - self._tokens) * self._interval
+
+            time.sleep(wait)
@@ -0,0 +1,190 @@
+"""Define a pitch preserving time-stretch for PCM audio.
+
+The stretch uses waveform similarity overlap-add (WSOLA). Output is built from
+Hann windowed frames placed at a fixed synthesis hop, while the matching input
+frames advance by the synthesis hop multiplied by the rate. Each input frame is
+shifted within a small tolerance to the position that best continues the
+previous frame, which keeps the waveform periodic across frame boundaries and
+avoids the phasiness of a plain overlap-add.
+
+TimeStretcher processes audio incrementally so it can run on PCM blocks as they
+arrive, the time_stretch function is a shortcut for a whole clip.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from llm_voice.utils.audio import (
+    Float32Array,
+    Int16Array,
+    float32_to_int16,
+    int16_to_float32,
+)
+
+MIN_RATE = 0.25
+MAX_RATE = 4.0
+DEFAULT_FRAME_DURATION = 0.03
+DEFAULT_TOLERANCE_DURATION = 0.008
+
+
+class TimeStretcher:
+    """Streaming WSOLA time-stretch for mono int16 PCM audio."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        rate: float,
+        frame_duration: float = DEFAULT_FRAME_DURATION,
+        tolerance_duration: float = DEFAULT_TOLERANCE_DURATION,
+    ) -> None:
+        """Initialize the TimeStretcher instance.
+
+        Args:
+            sample_rate: The sample rate of the audio in Hz.
+            rate: The speed factor, 2.0 plays twice as fast and 0.5 half as fast.
+            frame_duration: The length of each overlap-add frame in seconds.
+            tolerance_duration: How far an input frame may be shifted from its
+                nominal position in seconds.
+        """
+        if not MIN_RATE <= rate <= MAX_RATE:
+            raise ValueError(f"rate must be between {MIN_RATE} and {MAX_RATE}.")
+
+        # Even frame length so that a 50% overlap hop is exact.
+        self._frame_length: int = max(2, round(sample_rate * frame_duration) // 2 * 2)
+        self._synthesis_hop: int = self._frame_length // 2
+        self._analysis_hop: float = self._synthesis_hop * rate
+        self._tolerance: int = round(sample_rate * tolerance_duration)
+        self._rate: float = rate
+        # A periodic Hann window sums to one at a 50% overlap.
+        self._window: Float32Array = np.hanning(self._frame_length + 1)[:-1].astype(
+            np.float32
+        )
+        self._input: Float32Array = np.zeros(0, dtype=np.float32)
+        self._input_offset: int = 0
+        self._input_length: int = 0
+        self._frame_index: int = 0
+        self._previous_position: int | None = None
+        self._overlap: Float32Array = np.zeros(self._synthesis_hop, dtype=np.float32)
+        self._output_length: int = 0
+
+    def process(self, samples: Int16Array) -> Int16Array:
+        """Stretch the next block of audio.
+
+        Args:
+            samples: The next mono int16 samples.
+
+        Returns:
+            The stretched samples that are complete so far, which lag the input
+            by about one frame.
+        """
+        self._input = np.concatenate((self._input, int16_to_float32(samples)))
+        self._input_length += samples.shape[0]
+        return float32_to_int16(self._process_frames())
+
+    def flush(self) -> Int16Array:
+        """Stretch the remaining buffered audio and reset for the next stream.
+
+        Returns:
+            The remaining stretched samples.
+        """
+        remaining_length: int = (
+            round(self._input_length / self._rate) - self._output_length
+        )
+        padding: int = self._frame_length + 2 * self._tolerance + self._synthesis_hop
+        self._input = np.concatenate((self._input, np.zeros(padding, dtype=np.float32)))
+        output: Float32Array = np.concatenate((self._process_frames(), self._overlap))
+        output = output[: max(0, remaining_length)]
+        self._reset()
+        return float32_to_int16(output)
+
+    def _reset(self) -> None:
+        self._input = np.zeros(0, dtype=np.float32)
+        self._input_offset = 0
+        self._input_length = 0
+        self._frame_index = 0
+        self._previous_position = None
+        self._overlap = np.zeros(self._synthesis_hop, dtype=np.float32)
+        self._output_length = 0
+
+    def _process_frames(self) -> Float32Array:
+        frame_length: int = self._frame_length
+        hop: int = self._synthesis_hop
+        input_end: int = self._input_offset + self._input.shape[0]
+        output_blocks: list[Float32Array] = []
+
+        while True:
+            nominal: int = round(self._frame_index * self._analysis_hop)
+
+            if self._previous_position is None:
+                if input_end < frame_length:
+                    break
+
+                position: int = 0
+            else:
+                natural: int = self._previous_position + hop
+                search_start: int = max(0, nominal - self._tolerance)
+                search_end: int = nominal + self._tolerance
+
+                if max(natural, search_end) + frame_length > input_end:
+                    break
+
+                template: Float32Array = self._segment(natural, frame_length)
+                candidates: Float32Array = sliding_window_view(
+                    self._segment(
+                        search_start, search_end - search_start + frame_length
+                    ),
+                    frame_length,
+                )
+                position = search_start + int(np.argmax(candidates @ template))
+
+            frame: Float32Array = self._segment(position, frame_length) * self._window
+            output_blocks.append(self._overlap + frame[:hop])
+            self._overlap = frame[hop:].copy()
+            self._previous_position = position
+            self._frame_index += 1
+            self._discard_consumed_input()
+
+        if not output_blocks:
+            return np.zeros(0, dtype=np.float32)
+
+        output: Float32Array = np.concatenate(output_blocks)
+        self._output_length += output.shape[0]
+        return output
+
+    def _segment(self, start: int, length: int) -> Float32Array:
+        relative_start: int = start - self._input_offset
+        return self._input[relative_start : relative_start + length]
+
+    def _discard_consumed_input(self) -> None:
+        assert self._previous_position is not None
+
+        next_nominal: int = round(self._frame_index * self._analysis_hop)
+        keep_from: int = min(
+            self._previous_position + self._synthesis_hop,
+            max(0, next_nominal - self._tolerance),
+        )
+        discard: int = keep_from - self._input_offset
+
+        if discard > 0:
+            self._input = self._input[discard:]
+            self._input_offset = keep_from
+
+
+def time_stretch(samples: Int16Array, sample_rate: int, rate: float) -> Int16Array:
+    """Change the speed of mono int16 audio without changing its pitch.
+
+    Args:
+        samples: The mono int16 samples.
+        sample_rate: The sample rate of the audio in Hz.
+        rate: The speed factor, 2.0 plays twice as fast and 0.5 half as fast.
+
+    Returns:
+        The stretched samples.
+    """
+    if rate == 1.0:
+        return samples
+
+    stretcher = TimeStretcher(sample_rate=sample_rate, rate=rate)
+    return np.concatenate((stretcher.process(samples), stretcher.flush()))
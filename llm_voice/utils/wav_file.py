@@ -0,0 +1,94 @@
+"""Define helpers to read and write WAV files holding raw PCM audio."""
+
+from __future__ import annotations
+
+import io
+import wave
+from pathlib import Path
+from typing import BinaryIO
+
+from llm_voice.interfaces.pcm_audio import PCM16_SAMPLE_WIDTH
+
+
+def write_wav(
+    audio_file_path: Path | BinaryIO,
+    pcm: bytes | bytearray | memoryview,
+    sample_rate: int,
+    channels: int = 1,
+) -> None:
+    """Write 16-bit PCM audio to a WAV file.
+
+    Args:
+        audio_file_path: The path or binary file object to save the WAV file to.
+        pcm: The interleaved 16-bit little endian PCM samples.
+        sample_rate: The sample rate of the audio in Hz.
+        channels: The number of interleaved channels.
+    """
+    target: str | BinaryIO = (
+        str(audio_file_path) if isinstance(audio_file_path, Path) else audio_file_path
+    )
+
+    with wave.open(target, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(PCM16_SAMPLE_WIDTH)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+
+
+def read_wav(audio_file_path: Path | BinaryIO) -> tuple[bytes, int, int]:
+    """Read 16-bit PCM audio from a WAV file.
+
+    Args:
+        audio_file_path: The path or binary file object of the WAV file.
+
+    Returns:
+        The PCM samples, the sample rate in Hz and the number of channels.
+
+    Raises:
+        ValueError: If the WAV file does not hold 16-bit samples.
+    """
+    source: str | BinaryIO = (
+        str(audio_file_path) if isinstance(audio_file_path, Path) else audio_file_path
+    )
+
+    with wave.open(source, "rb") as wav_file:
+        if wav_file.getsampwidth() != PCM16_SAMPLE_WIDTH:
+            raise ValueError(f"Expected 16-bit PCM WAV audio: {audio_file_path}")
+
+        return (
+            wav_file.readframes(wav_file.getnframes()),
+            wav_file.getframerate(),
+            wav_file.getnchannels(),
+        )
+
+
+def parse_wav(wav_bytes: bytes) -> tuple[bytes, int, int]:
+    """Read 16-bit PCM audio from the bytes of a WAV file.
+
+    Args:
+        wav_bytes: The contents of the WAV file.
+
+    Returns:
+        The PCM samples, the sample rate in Hz and the number of channels.
+    """
+    return read_wav(io.BytesIO(wav_bytes))
+
+
+def to_wav_bytes(
+    pcm: bytes | bytearray | memoryview,
+    sample_rate: int,
+    channels: int = 1,
+) -> bytes:
+    """Wrap 16-bit PCM audio in a WAV header.
+
+    Args:
+        pcm: The interleaved 16-bit little endian PCM samples.
+        sample_rate: The sample rate of the audio in Hz.
+        channels: The number of interleaved channels.
+
+    Returns:
+        The contents of the WAV file.
+    """
+    buffer = io.BytesIO()
+    write_wav(buffer, pcm, sample_rate, channels)
+    return buffer.getvalue()
@@ -0,0 +1,71 @@
+"""Define the WavFileSink class."""
+
+from __future__ import annotations
+
+import threading
+import wave
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llm_voice.errors.respond_error import RespondError
+from llm_voice.interfaces.pcm_audio import PCM16_SAMPLE_WIDTH
+from llm_voice.utils.audio import convert_pcm
+from llm_voice.utils.logger import logger
+from llm_voice.utils.pcm_sink import PcmSink
+
+if TYPE_CHECKING:
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+
+
+class WavFileSink(PcmSink):
+    """Sink that records the audio of a response to a WAV file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a new WavFileSink instance.
+
+        The file is created on the first audio, in its sample rate and channel
+        count. Later audio in another format is converted to it.
+
+        Args:
+            path: The WAV file to write, replaced if it exists.
+        """
+        self._path = Path(path)
+        self._wav_file: wave.Wave_write | None = None
+        self._format: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def play(self, audio: PcmAudio) -> None:
+        """Append the audio to the file.
+
+        Args:
+            audio: The audio to record.
+        """
+        try:
+            with self._lock:
+                if self._wav_file is None:
+                    self._open(audio.sample_rate, audio.channels)
+
+                assert self._format is not None
+                sample_rate, channels = self._format
+                audio = convert_pcm(audio, sample_rate=sample_rate, channels=channels)
+                assert self._wav_file is not None
+                self._wav_file.writeframes(audio.data)
+        except Exception as e:
+            raise RespondError(f"Error writing {self._path}: {e}") from e
+
+    def close(self) -> None:
+        """Finish the file, the next audio starts a new one."""
+        with self._lock:
+            if self._wav_file is None:
+                return
+
+            self._wav_file.close()
+            self._wav_file = None
+            logger.debug(f"WavFileSink wrote {self._path}")
+
+    def _open(self, sample_rate: int, channels: int) -> None:
+        self._wav_file = wave.open(str(self._path), "wb")  # noqa: SIM115
+        self._wav_file.setnchannels(channels)
+        self._wav_file.setsampwidth(PCM16_SAMPLE_WIDTH)
+        self._wav_file.setframerate(sample_rate)
+        self._format = (sample_rate, channels)
@@ -0,0 +1,163 @@
+"""Tests for the AudioPack and AudioPackBuilder classes and the pack command."""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.cli.main import build_parser
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.utils.audio_pack import (
+    ALIGNMENT,
+    HEADER,
+    MAGIC,
+    RECORD,
+    VERSION,
+    AudioPack,
+    AudioPackBuilder,
+)
+from llm_voice.utils.wav_file import write_wav
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from llm_voice.interfaces.packed_clip import PackedClip
+
+SAMPLE_RATE = 16000
+
+
+def write_clip(path: Path, sample_count: int, first_sample: int = 0) -> bytes:
+    """Write a WAV file with increasing samples and return its PCM."""
+    pcm: bytes = b"".join(
+        struct.pack("<h", first_sample + sample % 1000)
+        for sample in range(sample_count)
+    )
+    write_wav(path, pcm, SAMPLE_RATE)
+    return pcm
+
+
+def test_pack_round_trips_the_clips(tmp_path: Path) -> None:
+    hello: bytes = write_clip(tmp_path / "hello.wav", 8000)
+    bye: bytes = write_clip(tmp_path / "bye.wav", 3)
+    (tmp_path / "jingle.mp3").write_bytes(b"ID3 not really an mp3")
+    builder = AudioPackBuilder()
+    builder.add_file("Hello there!", tmp_path / "hello.wav")
+    builder.add_file("Goodbye.", tmp_path / "bye.wav", voice="alloy")
+    builder.add_file("Jingle", tmp_path / "jingle.mp3")
+    builder.write(tmp_path / "clips.lvpack")
+
+    with AudioPack(tmp_path / "clips.lvpack") as pack:
+        assert len(pack) == 3
+        # Surrounding whitespace is ignored, the voice is part of the key.
+        assert " Hello there! " in pack
+        assert "Goodbye." not in pack
+        assert pack.get("Missing") is None
+
+        clip: PackedClip | None = pack.get("Hello there!")
+        assert clip is not None
+        assert clip.format == AudioFormat.PCM16
+        assert bytes(clip.data) == hello
+        assert clip.as_pcm().sample_rate == SAMPLE_RATE
+        assert clip.duration == pytest.approx(0.5)
+
+        clip = pack.get("Goodbye.", voice="alloy")
+        assert clip is not None
+        assert bytes(clip.data) == bye
+
+        clip = pack.get("Jingle")
+        assert clip is not None
+        assert clip.format == AudioFormat.MP3
+        assert clip.sample_rate is None
+        assert bytes(clip.data) == b"ID3 not really an mp3"
+
+        with pytest.raises(ValueError, match="PCM16"):
+            clip.as_pcm()
+
+        del clip
+
+
+def test_pack_aligns_the_audio_of_every_clip(tmp_path: Path) -> None:
+    builder = AudioPackBuilder()
+
+    for sample_count in (1, 3, 7, 8, 13):
+        # Distinct samples, so each clip's audio is found only at its offset.
+        write_clip(tmp_path / f"{sample_count}.wav", sample_count, -1000 * sample_count)
+        builder.add_file(str(sample_count), tmp_path / f"{sample_count}.wav")
+
+    builder.write(tmp_path / "clips.lvpack")
+    data: bytes = (tmp_path / "clips.lvpack").read_bytes()
+
+    with AudioPack(tmp_path / "clips.lvpack") as pack:
+        for sample_count in (1, 3, 7, 8, 13):
+            clip: PackedClip | None = pack.get(str(sample_count))
+            assert clip is not None
+            audio: bytes = bytes(clip.data)
+            del clip
+
+            assert data.index(audio, HEADER.size + RECORD.size * 5) % ALIGNMENT == 0
+            assert len(audio) == sample_count * 2
+
+
+def test_pack_pickles_by_path(tmp_path: Path) -> None:
+    write_clip(tmp_path / "hello.wav", 10)
+    builder = AudioPackBuilder()
+    builder.add_directory(tmp_path)
+    builder.write(tmp_path / "clips.lvpack")
+
+    with AudioPack(tmp_path / "clips.lvpack") as pack:
+        data: bytes = pickle.dumps(pack)
+
+        # The mapped audio is not part of the pickle.
+        assert len(data) < 200
+
+        with pickle.loads(data) as copy:
+            assert copy.path == pack.path
+            assert "hello" in copy
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        HEADER.pack(b"NOTAPACK", VERSION, 0),
+        HEADER.pack(MAGIC, VERSION + 1, 0),
+    ],
+)
+def test_pack_rejects_a_bad_magic_or_version(tmp_path: Path, header: bytes) -> None:
+    (tmp_path / "clips.lvpack").write_bytes(header)
+
+    with pytest.raises(ValueError, match="audio pack"):
+        AudioPack(tmp_path / "clips.lvpack")
+
+
+def test_pack_command_keys_clips_by_the_batch_items(tmp_path: Path) -> None:
+    audio_directory: Path = tmp_path / "audio"
+    audio_directory.mkdir()
+    greeting: bytes = write_clip(audio_directory / "greeting_1.wav", 4)
+    write_clip(audio_directory / "unlisted.wav", 4)
+    (tmp_path / "items.csv").write_text(
+        "id,text,voice\ngreeting/1,Welcome back!,alloy\n", encoding="utf-8"
+    )
+    args = build_parser().parse_args(
+        [
+            "pack",
+            str(audio_directory),
+            str(tmp_path / "clips.lvpack"),
+            "--items",
+            str(tmp_path / "items.csv"),
+        ]
+    )
+
+    assert args.run(args) == 0
+
+    with AudioPack(tmp_path / "clips.lvpack") as pack:
+        assert len(pack) == 1
+        assert "greeting_1" not in pack
+
+        clip: PackedClip | None = pack.get("Welcome back!", voice="alloy")
+        assert clip is not None
+        assert bytes(clip.data) == greeting
+
+        del clip
@@ -0,0 +1,63 @@
+"""Tests for the BatchSynthesizer class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.interfaces.batch_item import BatchItem, BatchStatus
+from llm_voice.tts.base import TextToSpeechClient
+from llm_voice.tts.batch_synthesizer import BatchSynthesizer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ITEMS: list[BatchItem] = [BatchItem("greeting", "Hello."), BatchItem("bye", "Bye.")]
+
+
+class FakeTextToSpeechClient(TextToSpeechClient):
+    """Client that writes the text and model as audio, or fails half way."""
+
+    audio_extension = ".mp3"
+
+    def __init__(self, model: str = "tts-1", fail: bool = False) -> None:
+        self._model: str = model
+        self._fail: bool = fail
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: Path,
+        force: bool = True,
+    ) -> None:
+        audio_file_path.write_bytes(f"{self._model}: {text_to_speak}".encode())
+
+        if self._fail:
+            raise TextToSpeechError("Connection reset.")
+
+
+def render(tmp_path: Path, **options: object) -> list[BatchStatus]:
+    synthesizer = BatchSynthesizer(
+        lambda _voice: FakeTextToSpeechClient(**options),  # type: ignore[arg-type]
+        tmp_path,
+        client_options=options,
+    )
+    return [result.status for result in synthesizer.run(ITEMS)]
+
+
+def test_unchanged_items_are_skipped(tmp_path: Path) -> None:
+    assert render(tmp_path, model="tts-1") == [BatchStatus.RENDERED] * 2
+    assert render(tmp_path, model="tts-1") == [BatchStatus.SKIPPED] * 2
+
+
+def test_changed_client_options_render_again(tmp_path: Path) -> None:
+    render(tmp_path, model="tts-1")
+
+    assert render(tmp_path, model="tts-1-hd") == [BatchStatus.RENDERED] * 2
+    assert (tmp_path / "greeting.mp3").read_text() == "tts-1-hd: Hello."
+
+
+def test_failed_item_leaves_no_file(tmp_path: Path) -> None:
+    assert render(tmp_path, fail=True) == [BatchStatus.FAILED] * 2
+    assert [path.name for path in tmp_path.iterdir()] == []
+    assert render(tmp_path) == [BatchStatus.RENDERED] * 2
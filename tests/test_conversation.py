@@ -0,0 +1,60 @@
+"""Tests for the Conversation class."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from llm_voice.llm.base import ChatMessage, LLMClient
+from llm_voice.llm.conversation import Conversation
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TIMEOUT = 10.0
+
+
+class RecordingSummarizer(LLMClient):
+    """Summarizer that records the transcripts it is asked to summarize."""
+
+    def __init__(self) -> None:
+        self.transcripts: list[str] = []
+        self._lock = threading.Lock()
+
+    def generate_chat_completion(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> str | None:
+        assert isinstance(messages, list)
+
+        with self._lock:
+            self.transcripts.append(messages[-1].content)
+
+        return "summary"
+
+    def generate_chat_completion_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[str]:
+        raise NotImplementedError
+
+
+def test_every_dropped_turn_is_summarized() -> None:
+    summarizer = RecordingSummarizer()
+    conversation = Conversation(token_budget=1, summarizer=summarizer)
+
+    for index in range(500):
+        conversation.add_user_message(f"question {index}")
+
+    conversation.wait_for_summary(TIMEOUT)
+
+    transcript: str = "\n".join(summarizer.transcripts)
+    # Only the newest turn is kept, every older one reaches the summarizer.
+    missing: list[int] = [
+        index for index in range(499) if f"question {index}\n" not in transcript + "\n"
+    ]
+    assert missing == []
@@ -0,0 +1,72 @@
+"""Tests for the ElevenLabsStreamingClient class."""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from websockets.sync.server import ServerConnection, serve
+
+from llm_voice.tts.eleven_labs_streaming_client import ElevenLabsStreamingClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+AUDIO = b"\x00\x01" * 10
+
+
+def handle(connection: ServerConnection) -> None:
+    """Answer every text message with audio, and the end of stream with isFinal."""
+    for message in connection:
+        text: str = json.loads(message)["text"]
+
+        if text == "":
+            connection.send(json.dumps({"isFinal": True}))
+            return
+
+        if text.strip():
+            connection.send(json.dumps({"audio": base64.b64encode(AUDIO).decode()}))
+
+
+@pytest.fixture
+def client() -> Iterator[ElevenLabsStreamingClient]:
+    with serve(handle, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.socket.getsockname()[:2]
+
+        yield ElevenLabsStreamingClient(
+            api_key="test",
+            base_url=f"ws://{host}:{port}",
+            receive_timeout=5.0,
+        )
+
+        server.shutdown()
+        thread.join()
+
+
+def test_stream_yields_audio_for_the_text(client: ElevenLabsStreamingClient) -> None:
+    audio = list(client.stream(["Hello ", "there."]))
+
+    assert [bytes(chunk.data) for chunk in audio] == [AUDIO, AUDIO]
+
+
+def test_stream_raises_the_text_stream_error_unchanged(
+    client: ElevenLabsStreamingClient,
+) -> None:
+    error = RuntimeError("the LLM failed")
+
+    def text_chunks() -> Iterator[str]:
+        yield "Hello "
+        raise error
+
+    with pytest.raises(RuntimeError) as exc_info:
+        list(client.stream(text_chunks()))
+
+    assert exc_info.value is error
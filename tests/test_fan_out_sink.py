@@ -0,0 +1,97 @@
+"""Tests for the FanOutSink class."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.utils import fan_out_sink
+from llm_voice.utils.fan_out_sink import FanOutSink
+from llm_voice.utils.pcm_sink import PcmSink
+
+SAMPLE_RATE = 16000
+
+
+def silence(seconds: float) -> PcmAudio:
+    return PcmAudio(bytes(int(SAMPLE_RATE * seconds) * 2), SAMPLE_RATE)
+
+
+class ListSink(PcmSink):
+    """Sink that keeps the audio it is given."""
+
+    def __init__(self) -> None:
+        self.played: list[PcmAudio] = []
+        self.closed: bool = False
+
+    def play(self, audio: PcmAudio) -> None:
+        self.played.append(audio)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StalledSink(ListSink):
+    """Sink whose play blocks until it is released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = threading.Event()
+
+    def play(self, audio: PcmAudio) -> None:
+        self.released.wait()
+        super().play(audio)
+
+
+def test_every_sink_gets_the_audio() -> None:
+    sinks: list[ListSink] = [ListSink(), ListSink(), ListSink()]
+    sink = FanOutSink(sinks)
+    audio: list[PcmAudio] = [silence(0.1), silence(0.2)]
+
+    for chunk in audio:
+        sink.play(chunk)
+
+    sink.close()
+
+    assert all(each.played == audio and each.closed for each in sinks)
+
+
+def test_lagging_sink_drops_audio_past_max_lag() -> None:
+    primary = ListSink()
+    stalled = StalledSink()
+    sink = FanOutSink([primary, stalled], max_lag=0.5)
+
+    for _ in range(10):
+        sink.play(silence(0.1))
+
+    stalled.released.set()
+    sink.close()
+
+    assert len(primary.played) == 10
+    assert len(stalled.played) == 5
+    assert sink.dropped_seconds == [pytest.approx(0.5)]
+
+
+def test_close_detaches_a_stalled_sink(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fan_out_sink, "CLOSE_GRACE_SECONDS", 0.1)
+    primary = ListSink()
+    stalled = StalledSink()
+    sink = FanOutSink([primary, stalled], max_lag=0.2)
+
+    sink.play(silence(0.1))
+    started: float = time.monotonic()
+    sink.close()
+
+    try:
+        assert time.monotonic() - started < 1.0
+        assert primary.closed
+
+        # The detached sink gets no more audio.
+        sink.play(silence(0.1))
+        assert len(primary.played) == 2
+    finally:
+        stalled.released.set()
+
+    assert not stalled.closed
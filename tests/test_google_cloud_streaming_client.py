@@ -0,0 +1,132 @@
+"""Tests for the GoogleCloudStreamingClient class against a local gRPC server."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Self
+
+import pytest
+
+grpc = pytest.importorskip("grpc")
+texttospeech = pytest.importorskip("google.cloud.texttospeech")
+
+from llm_voice.errors.text_to_speech_response_error import TextToSpeechResponseError
+from llm_voice.tts.google_cloud_streaming_client import GoogleCloudStreamingClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+SERVICE = "google.cloud.texttospeech.v1.TextToSpeech"
+REJECTED_TEXT = "Reject this."
+
+
+class StandInServer:
+    """Local stand-in for the streaming_synthesize call of Google Cloud.
+
+    The audio of every text request is the encoded text.
+    """
+
+    def __init__(self) -> None:
+        self.configs: list[texttospeech.StreamingSynthesizeConfig] = []
+        self.texts: list[str] = []
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=2))
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    SERVICE,
+                    {
+                        "StreamingSynthesize": grpc.stream_stream_rpc_method_handler(
+                            self._streaming_synthesize,
+                            request_deserializer=(
+                                texttospeech.StreamingSynthesizeRequest.deserialize
+                            ),
+                            response_serializer=(
+                                texttospeech.StreamingSynthesizeResponse.serialize
+                            ),
+                        ),
+                    },
+                ),
+            )
+        )
+        self.port: int = self._server.add_insecure_port("127.0.0.1:0")
+
+    def __enter__(self) -> Self:
+        self._server.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._server.stop(grace=None)
+
+    def _streaming_synthesize(
+        self,
+        requests: Iterator[texttospeech.StreamingSynthesizeRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[texttospeech.StreamingSynthesizeResponse]:
+        for request in requests:
+            if "streaming_config" in request:
+                self.configs.append(request.streaming_config)
+                continue
+
+            text: str = request.input.text
+
+            if text.strip() == REJECTED_TEXT:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Rejected text.")
+
+            self.texts.append(text)
+            yield texttospeech.StreamingSynthesizeResponse(audio_content=text.encode())
+
+
+@pytest.fixture
+def server() -> Iterator[StandInServer]:
+    with StandInServer() as server:
+        yield server
+
+
+def create_client(server: StandInServer) -> GoogleCloudStreamingClient:
+    return GoogleCloudStreamingClient(
+        sample_rate=16000,
+        api_endpoint=f"127.0.0.1:{server.port}",
+        insecure=True,
+        timeout=10.0,
+    )
+
+
+def test_stream_sends_the_text_a_clause_at_a_time(server: StandInServer) -> None:
+    client: GoogleCloudStreamingClient = create_client(server)
+
+    audio: list[bytes] = [
+        bytes(chunk.data)
+        for chunk in client.stream(["Hello", " there,", " how are", " you?", " Bye"])
+    ]
+
+    assert server.texts == ["Hello there,", " how are you?", " Bye"]
+    assert audio == [text.encode() for text in server.texts]
+    assert len(server.configs) == 1
+    assert server.configs[0].voice.name == "en-US-Chirp3-HD-Charon"
+    assert server.configs[0].streaming_audio_config.sample_rate_hertz == 16000
+
+
+def test_stream_raises_the_status_of_a_failed_call(server: StandInServer) -> None:
+    client: GoogleCloudStreamingClient = create_client(server)
+
+    with pytest.raises(TextToSpeechResponseError) as exc_info:
+        list(client.stream(["Hello.", " ", REJECTED_TEXT]))
+
+    assert server.texts == ["Hello."]
+    # The status is reported as its HTTP equivalent.
+    assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_stream_raises_the_text_stream_error(server: StandInServer) -> None:
+    client: GoogleCloudStreamingClient = create_client(server)
+    error = RuntimeError("the LLM failed")
+
+    def text_chunks() -> Iterator[str]:
+        yield "Hello."
+        raise error
+
+    with pytest.raises(RuntimeError) as exc_info:
+        list(client.stream(text_chunks()))
+
+    assert exc_info.value is error
@@ -0,0 +1,80 @@
+"""Tests that importing llm_voice does not load the provider SDKs."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SDK_MODULES: tuple[str, ...] = (
+    "openai",
+    "ollama",
+    "gtts",
+    "elevenlabs",
+    "requests",
+    "google.cloud.texttospeech",
+    "pyaudio",
+)
+
+MODULES: list[str] = [
+    "llm_voice",
+    "llm_voice.registry",
+    "llm_voice.llm.openai_client",
+    "llm_voice.llm.ollama_client",
+    "llm_voice.tts.openai_text_to_speech_client",
+    "llm_voice.tts.eleven_labs_text_to_speech_client",
+    "llm_voice.tts.google_text_to_speech_client",
+    "llm_voice.tts.google_cloud_text_to_speech_client",
+]
+
+# Seconds importing all of MODULES may take. Importing openai alone takes
+# longer than this, so loading any SDK eagerly goes over it.
+IMPORT_TIME_BUDGET = 0.5
+
+ROOT: Path = Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_does_not_load_provider_sdks(module: str) -> None:
+    # A fresh interpreter, the test process may already have loaded the SDKs.
+    code: str = (
+        f"import json, sys, {module}\n"
+        f"print(json.dumps([m for m in {SDK_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert json.loads(result.stdout) == []
+
+
+def test_import_time_is_within_budget() -> None:
+    code: str = (
+        "import importlib, time\n"
+        "started = time.perf_counter()\n"
+        f"for module in {MODULES!r}:\n"
+        "    importlib.import_module(module)\n"
+        "print(time.perf_counter() - started)"
+    )
+    # The best of a few runs, so a busy machine does not fail the check.
+    seconds: float = min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(3)
+    )
+
+    assert seconds < IMPORT_TIME_BUDGET
@@ -0,0 +1,112 @@
+"""Tests for the chat completion chunks of the OpenAI and Ollama clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.llm.base import ChatMessage, MessageRole
+from llm_voice.llm.conversation import estimate_tokens
+from llm_voice.loadtest import mock_provider_server
+from llm_voice.loadtest.mock_provider_server import (
+    MockProviderConfig,
+    MockProviderServer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from llm_voice.interfaces.stream_chunk import StreamChunk, TokenUsage
+
+FIRST_TOKEN_LATENCY = 0.05
+TOKENS_PER_SECOND = 100.0
+MESSAGES: list[ChatMessage] = [
+    ChatMessage(role=MessageRole.USER, content="Say hi to everyone."),
+]
+
+
+@pytest.fixture
+def server() -> Iterator[MockProviderServer]:
+    config = MockProviderConfig(
+        response_text="Hi there.",
+        tokens_per_second=TOKENS_PER_SECOND,
+        first_token_latency=FIRST_TOKEN_LATENCY,
+        latency_jitter=0.0,
+    )
+
+    with MockProviderServer(config) as server:
+        yield server
+
+
+@pytest.fixture
+def null_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Send null instead of empty message content, as some servers do."""
+    write_chunk = mock_provider_server._Handler._write_chunk
+
+    def write_null_content(self: mock_provider_server._Handler, data: bytes) -> None:
+        write_chunk(self, data.replace(b'"content": ""', b'"content": null'))
+
+    monkeypatch.setattr(
+        mock_provider_server._Handler, "_write_chunk", write_null_content
+    )
+
+
+def test_openai_chunks_have_the_finish_reason_and_usage(
+    server: MockProviderServer,
+) -> None:
+    pytest.importorskip("openai")
+    from llm_voice.llm.openai_client import OpenAIClient
+
+    client = OpenAIClient(api_key="mock", model="mock", base_url=server.url + "/v1")
+    chunks: list[StreamChunk] = list(client.generate_chat_completion_chunks(MESSAGES))
+
+    assert [chunk.text for chunk in chunks] == ["Hi", " there", ".", "", ""]
+    # The finish chunk has no content and the usage chunk no choices.
+    assert [chunk.finish_reason for chunk in chunks] == [None] * 3 + ["stop", None]
+    assert [chunk.usage for chunk in chunks[:-1]] == [None] * 4
+    assert chunks[-1].usage is not None
+    assert chunks[-1].usage.prompt_tokens == estimate_tokens(MESSAGES[0].content)
+    assert chunks[-1].usage.completion_tokens == 3
+    assert chunks[-1].usage.eval_duration is None
+    received: list[float] = [chunk.received for chunk in chunks]
+    assert received == sorted(received)
+
+
+def test_ollama_chunks_have_the_usage_and_timings(server: MockProviderServer) -> None:
+    pytest.importorskip("ollama")
+    from llm_voice.llm.ollama_client import OllamaClient
+
+    client = OllamaClient(model_name="mock", host=server.url)
+    chunks: list[StreamChunk] = list(client.generate_chat_completion_chunks(MESSAGES))
+
+    assert [chunk.text for chunk in chunks] == ["Hi", " there", ".", ""]
+    assert [chunk.finish_reason for chunk in chunks] == [None] * 3 + ["stop"]
+
+    usage: TokenUsage | None = chunks[-1].usage
+    assert usage is not None
+    assert usage.prompt_tokens == estimate_tokens(MESSAGES[0].content)
+    assert usage.completion_tokens == 3
+    # Ollama reports nanoseconds, the client converts them to seconds.
+    assert usage.load_duration == 0.0
+    assert usage.prompt_eval_duration is not None
+    assert FIRST_TOKEN_LATENCY <= usage.prompt_eval_duration < 1.0
+    assert usage.eval_duration is not None
+    assert 2 / TOKENS_PER_SECOND <= usage.eval_duration < 1.0
+    assert usage.total_duration is not None
+    assert usage.total_duration == pytest.approx(
+        usage.prompt_eval_duration + usage.eval_duration
+    )
+    assert usage.eval_rate == pytest.approx(3 / usage.eval_duration)
+
+
+@pytest.mark.usefixtures("null_content")
+def test_ollama_chunks_skip_null_content(server: MockProviderServer) -> None:
+    pytest.importorskip("ollama")
+    from llm_voice.llm.ollama_client import OllamaClient
+
+    client = OllamaClient(model_name="mock", host=server.url)
+    chunks: list[StreamChunk] = list(client.generate_chat_completion_chunks(MESSAGES))
+
+    assert [chunk.text for chunk in chunks] == ["Hi", " there", ".", ""]
+    assert chunks[-1].usage is not None
@@ -0,0 +1,73 @@
+"""Tests for the ProcessPoolTextToSpeechClient class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.tts.base import PcmTextToSpeechClient
+from llm_voice.tts.process_pool_text_to_speech_client import (
+    ProcessPoolTextToSpeechClient,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TIMEOUT = 10.0
+
+
+class WordTextToSpeechClient(PcmTextToSpeechClient):
+    """Client that synthesizes one sample per character."""
+
+    sample_rate = 16000
+    supports_speaking_rate = True
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        return bytes(len(text_to_speak) * 2)
+
+
+@pytest.fixture
+def client() -> Iterator[ProcessPoolTextToSpeechClient]:
+    with ProcessPoolTextToSpeechClient(
+        WordTextToSpeechClient,
+        workers=2,
+        start_method="spawn",
+    ) as client:
+        yield client
+
+
+def test_synthesize_returns_the_worker_audio(
+    client: ProcessPoolTextToSpeechClient,
+) -> None:
+    assert client.sample_rate == 16000
+    assert client.submit("Hello.").result(TIMEOUT) == bytes(12)
+
+
+def test_unreadable_result_fails_only_its_request(
+    client: ProcessPoolTextToSpeechClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    take_block = client._take_block
+
+    def missing_block(block_name: str, length: int) -> bytes:
+        # Free the block, then fail as if it had disappeared.
+        take_block(block_name, length)
+        raise FileNotFoundError(block_name)
+
+    monkeypatch.setattr(client, "_take_block", missing_block)
+
+    with pytest.raises(TextToSpeechError):
+        client.submit("Hello.").result(TIMEOUT)
+
+    monkeypatch.setattr(client, "_take_block", take_block)
+
+    assert client.submit("Hi.").result(TIMEOUT) == bytes(6)
+
+
+def test_closed_pool_fails_new_requests(client: ProcessPoolTextToSpeechClient) -> None:
+    client.close()
+
+    with pytest.raises(TextToSpeechError):
+        client.submit("Hello.")
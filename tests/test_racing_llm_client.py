@@ -0,0 +1,88 @@
+"""Tests for the RacingLLMClient class."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.llm.base import ChatMessage, MessageRole
+from llm_voice.llm.racing_llm_client import RacingLLMClient
+from llm_voice.loadtest.mock_provider_server import (
+    MockProviderConfig,
+    MockProviderServer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from llm_voice.llm.base import LLMClient
+
+MESSAGES: list[ChatMessage] = [ChatMessage(role=MessageRole.USER, content="Hi")]
+
+
+@pytest.fixture
+def fast_server() -> Iterator[MockProviderServer]:
+    config = MockProviderConfig(
+        response_text="Fast answer.", first_token_latency=0.1, latency_jitter=0.0
+    )
+
+    with MockProviderServer(config) as server:
+        yield server
+
+
+@pytest.fixture
+def stalled_server() -> Iterator[MockProviderServer]:
+    # Sends its first token first, then nothing for ten seconds.
+    config = MockProviderConfig(
+        response_text="Slow answer.",
+        first_token_latency=0.0,
+        latency_jitter=0.0,
+        tokens_per_second=0.1,
+    )
+
+    with MockProviderServer(config) as server:
+        yield server
+
+
+def create_client(provider: str, server: MockProviderServer) -> LLMClient:
+    if provider == "openai":
+        from llm_voice.llm.openai_client import OpenAIClient
+
+        return OpenAIClient(api_key="mock", model="mock", base_url=f"{server.url}/v1")
+
+    from llm_voice.llm.ollama_client import OllamaClient
+
+    return OllamaClient("mock", host=server.url)
+
+
+@pytest.mark.parametrize("provider", ["openai", "ollama"])
+def test_stalled_loser_is_cancelled_immediately(
+    provider: str,
+    fast_server: MockProviderServer,
+    stalled_server: MockProviderServer,
+) -> None:
+    racer = RacingLLMClient(
+        {
+            "stalled": create_client(provider, stalled_server),
+            "fast": create_client(provider, fast_server),
+        },
+        first_tokens=2,
+    )
+
+    assert "".join(racer.generate_chat_completion_stream(MESSAGES)) == "Fast answer."
+
+    deadline: float = time.monotonic() + 2.0
+
+    while time.monotonic() < deadline and any(
+        thread.name == "llm-race-stalled" for thread in threading.enumerate()
+    ):
+        time.sleep(0.05)
+
+    assert not any(
+        thread.name == "llm-race-stalled" for thread in threading.enumerate()
+    )
+    assert racer.get_stats()["fast"].wins == 1
+    assert racer.get_stats()["stalled"].failures == 0
@@ -0,0 +1,173 @@
+"""Tests for the RouterTextToSpeechClient class."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from llm_voice.errors.text_to_speech_error import TextToSpeechError
+from llm_voice.errors.text_to_speech_timeout_error import TextToSpeechTimeoutError
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.tts.base import PcmTextToSpeechClient, TextToSpeechClient
+from llm_voice.tts.request_policy import request_deadline
+from llm_voice.tts.router_text_to_speech_client import (
+    CircuitState,
+    RouterTextToSpeechClient,
+)
+
+
+class FakeTextToSpeechClient(TextToSpeechClient):
+    """Client that returns fixed audio or raises a fixed error."""
+
+    audio_extension = ".mp3"
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls: int = 0
+        self._error: Exception | None = error
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        self.calls += 1
+
+        def request(_timeout: float) -> bytes:
+            if self._error is not None:
+                raise self._error
+
+            return text_to_speak.encode()
+
+        return self.request_policy.call(request)
+
+    def convert_text_to_audio(
+        self,
+        text_to_speak: str,
+        audio_file_path: Path,
+        force: bool = True,
+    ) -> None:
+        audio_file_path.write_bytes(self.synthesize(text_to_speak))
+
+
+class SlowTextToSpeechClient(FakeTextToSpeechClient):
+    """Client whose requests run into their timeout."""
+
+    def synthesize(self, text_to_speak: str) -> bytes:
+        self.calls += 1
+
+        def request(timeout: float) -> bytes:
+            time.sleep(timeout)
+            raise TextToSpeechTimeoutError(f"No response within {timeout:.2f}s.")
+
+        return self.request_policy.call(request)
+
+
+class FakePcmTextToSpeechClient(PcmTextToSpeechClient):
+    """Client that synthesizes one second of silence or raises an error."""
+
+    def __init__(self, sample_rate: int, error: Exception | None = None) -> None:
+        self.sample_rate = sample_rate
+        self.calls: int = 0
+        self._error: Exception | None = error
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        self.calls += 1
+
+        if self._error is not None:
+            raise self._error
+
+        return bytes(self.sample_rate * 2)
+
+
+def test_failed_provider_is_skipped() -> None:
+    failing = FakeTextToSpeechClient(TextToSpeechError("HTTP 400"))
+    healthy = FakeTextToSpeechClient()
+    router = RouterTextToSpeechClient({"failing": failing, "healthy": healthy})
+
+    assert router.synthesize("Hi.") == b"Hi."
+    assert router.get_health()["failing"].failures == 1
+    assert router.get_decisions()[-1].provider == "healthy"
+
+
+def test_passed_deadline_is_not_a_provider_failure() -> None:
+    slow = FakeTextToSpeechClient()
+    fast = FakeTextToSpeechClient()
+    router = RouterTextToSpeechClient({"slow": slow, "fast": fast}, failure_threshold=1)
+
+    for _ in range(3):
+        with (
+            request_deadline(time.monotonic() - 1.0),
+            pytest.raises(TextToSpeechTimeoutError),
+        ):
+            router.synthesize("Hi.")
+
+    assert slow.calls == fast.calls == 0
+    assert all(
+        health.circuit_state == CircuitState.CLOSED and not health.failures
+        for health in router.get_health().values()
+    )
+    assert router.synthesize("Hi.") == b"Hi."
+
+
+def test_deadline_passing_during_a_request_stops_routing() -> None:
+    expired = FakeTextToSpeechClient(
+        TextToSpeechTimeoutError("The deadline passed.", retryable=False)
+    )
+    healthy = FakeTextToSpeechClient()
+    fallback = FakeTextToSpeechClient()
+    router = RouterTextToSpeechClient(
+        {"expired": expired, "healthy": healthy},
+        fallback,
+        failure_threshold=1,
+    )
+
+    with pytest.raises(TextToSpeechTimeoutError):
+        router.synthesize("Hi.")
+
+    assert healthy.calls == fallback.calls == 0
+    assert router.get_health()["expired"].circuit_state == CircuitState.CLOSED
+    assert router.get_decisions()[-1].provider is None
+
+
+def test_timeout_cut_short_by_the_deadline_is_not_a_provider_failure() -> None:
+    slow = SlowTextToSpeechClient()
+    healthy = FakeTextToSpeechClient()
+    router = RouterTextToSpeechClient(
+        {"slow": slow, "healthy": healthy},
+        failure_threshold=1,
+    )
+
+    with (
+        request_deadline(time.monotonic() + 0.2),
+        pytest.raises(TextToSpeechTimeoutError),
+    ):
+        router.synthesize("Hi.")
+
+    assert slow.calls == 1
+    assert healthy.calls == 0
+    assert router.get_health()["slow"].circuit_state == CircuitState.CLOSED
+    assert not router.get_health()["slow"].failures
+
+
+def test_fallback_without_the_negotiated_format_is_not_used() -> None:
+    provider = FakePcmTextToSpeechClient(24000, TextToSpeechError("HTTP 503"))
+    mp3_fallback = FakeTextToSpeechClient()
+    router = RouterTextToSpeechClient([provider], mp3_fallback)
+
+    router.negotiate_format([AudioFormat.PCM16], sample_rate=24000)
+
+    with pytest.raises(TextToSpeechError):
+        router.synthesize("Hi.")
+
+    assert mp3_fallback.calls == 0
+    assert router.get_decisions()[-1].attempted == ("FakePcmTextToSpeechClient",)
+
+
+def test_fallback_audio_is_resampled_to_the_negotiated_rate() -> None:
+    provider = FakePcmTextToSpeechClient(24000, TextToSpeechError("HTTP 503"))
+    fallback = FakePcmTextToSpeechClient(16000)
+    router = RouterTextToSpeechClient([provider], fallback)
+
+    spec = router.negotiate_format([AudioFormat.PCM16], sample_rate=24000)
+
+    assert spec.sample_rate == 24000
+    assert len(router.synthesize("Hi.")) == 24000 * 2
+    assert router.get_decisions()[-1].fallback_used
@@ -0,0 +1,129 @@
+"""Tests for recording a session and replaying it with SessionReplayer."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.interfaces.audio_format import AudioFormat
+from llm_voice.llm.base import LLMClient
+from llm_voice.loadtest.load_generator import NULL_OUTPUT_DEVICE
+from llm_voice.loadtest.null_pcm_player import NullPcmPlayer
+from llm_voice.replay.recording_llm_client import RecordingLLMClient
+from llm_voice.replay.recording_text_to_speech_client import (
+    RecordingTextToSpeechClient,
+)
+from llm_voice.replay.session_replayer import SessionReplayer
+from llm_voice.replay.session_store import SessionStore
+from llm_voice.tts.base import PcmTextToSpeechClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.pcm_audio import PcmAudio
+    from llm_voice.interfaces.sentence_timing import SentenceTiming
+    from llm_voice.llm.base import ChatMessage
+    from llm_voice.llm.conversation import Conversation
+
+TOKENS: list[str] = ["Yes", ".", " Sure", ".", " Right", ".", " Fine", "."]
+
+
+class TokenLLMClient(LLMClient):
+    """Client that streams fixed tokens."""
+
+    def generate_chat_completion(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> str | None:
+        return "".join(TOKENS)
+
+    def generate_chat_completion_stream(
+        self,
+        messages: list[ChatMessage] | Conversation,
+        *,
+        temperature: float = 0.5,
+    ) -> Iterator[str]:
+        for token in TOKENS:
+            time.sleep(0.01)
+            yield token
+
+
+class TextTextToSpeechClient(PcmTextToSpeechClient):
+    """Client whose audio is the encoded text, so it can be told apart."""
+
+    sample_rate = NULL_OUTPUT_DEVICE.default_sample_rate
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        time.sleep(0.02)
+        audio: bytes = text_to_speak.encode()
+        return audio + bytes(len(audio) % 2)
+
+
+class CapturingPcmPlayer(NullPcmPlayer):
+    """Player that keeps the audio it plays."""
+
+    def __init__(self, output_device: AudioDevice) -> None:
+        super().__init__(output_device)
+        self.played: list[bytes] = []
+
+    def play(self, audio: PcmAudio) -> None:
+        self.played.append(bytes(audio.data))
+        super().play(audio)
+
+
+def record(path: Path, requests: list[str]) -> bytes:
+    """Record the token stream and the given text to speech requests."""
+    with SessionStore(path, mode="w") as session:
+        llm_client = RecordingLLMClient(TokenLLMClient(), session)
+        tts_client = RecordingTextToSpeechClient(TextTextToSpeechClient(), session)
+        tts_client.negotiate_format([AudioFormat.PCM16])
+
+        assert "".join(llm_client.generate_chat_completion_stream([])) == "".join(
+            requests
+        )
+
+        return b"".join(tts_client.synthesize(text) for text in requests)
+
+
+@pytest.mark.parametrize(
+    "requests",
+    [
+        ["Yes.", " Sure.", " Right.", " Fine."],
+        ["Yes.", " Sure. Right.", " Fine."],
+        ["Yes. Sure. Right. Fine."],
+    ],
+)
+def test_replay_plays_the_recorded_audio(tmp_path: Path, requests: list[str]) -> None:
+    recorded: bytes = record(tmp_path, requests)
+    timings: list[SentenceTiming] = []
+    players: list[CapturingPcmPlayer] = []
+
+    def player_factory(output_device: AudioDevice) -> CapturingPcmPlayer:
+        players.append(CapturingPcmPlayer(output_device))
+        return players[-1]
+
+    SessionReplayer(tmp_path, time_scale=0.5).replay(
+        NULL_OUTPUT_DEVICE,
+        player_factory=player_factory,
+        on_sentence=timings.append,
+    )
+
+    assert [timing.error for timing in timings] == [None] * 4
+    assert b"".join(b"".join(player.played) for player in players) == recorded
+
+
+def test_replay_client_joins_recordings_of_a_merged_request(tmp_path: Path) -> None:
+    recorded: bytes = record(tmp_path, ["Yes.", " Sure.", " Right.", " Fine."])
+    replayer = SessionReplayer(tmp_path, time_scale=0)
+
+    audio: bytes = replayer.text_to_speech_client.synthesize(
+        "Yes.",
+    ) + replayer.text_to_speech_client.synthesize(" Sure. Right. Fine.")
+
+    assert audio == recorded
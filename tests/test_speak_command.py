@@ -0,0 +1,67 @@
+"""Tests for the llm-voice speak command."""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from llm_voice.cli import speak_command
+from llm_voice.cli.main import build_parser
+from tests.test_voice_responder_fast import TIMEOUT, SilenceTextToSpeechClient
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class InterruptedStdin:
+    """Stdin whose reader is interrupted after the first chunks of text."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.buffer = self
+        self._chunks: list[bytes] = chunks
+
+    def read1(self, _size: int) -> bytes:
+        if not self._chunks:
+            raise KeyboardInterrupt
+
+        return self._chunks.pop(0)
+
+
+def test_read_tokens_splits_words_whitespace_and_punctuation() -> None:
+    stream = io.BytesIO("Hi, wörld. Bye".encode())
+
+    assert list(speak_command.read_tokens(stream)) == [
+        "Hi",
+        ",",
+        " ",
+        "wörld",
+        ".",
+        " ",
+        "Bye",
+    ]
+
+
+def test_speak_returns_130_without_leaking_threads_on_ctrl_c(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        speak_command, "create_client", lambda _args: SilenceTextToSpeechClient()
+    )
+    monkeypatch.setattr(
+        sys, "stdin", InterruptedStdin([b"Hello there. ", b"This is cut"])
+    )
+    args = build_parser().parse_args(["speak", "--no-playback"])
+    threads_before: set[threading.Thread] = set(threading.enumerate())
+    exit_codes: list[int] = []
+
+    thread = threading.Thread(
+        target=lambda: exit_codes.append(args.run(args)), daemon=True
+    )
+    thread.start()
+    thread.join(TIMEOUT)
+
+    assert not thread.is_alive(), "speak did not return"
+    assert exit_codes == [130]
+    assert set(threading.enumerate()) <= threads_before
@@ -0,0 +1,180 @@
+"""Tests for the VoiceResponderFast class."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llm_voice.interfaces.filler_clip import FillerClip
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.loadtest.load_generator import NULL_OUTPUT_DEVICE
+from llm_voice.loadtest.null_pcm_player import NullPcmPlayer
+from llm_voice.responder.voice_responder_fast import VoiceResponderFast
+from llm_voice.tts.base import PcmTextToSpeechClient
+from llm_voice.utils.filler_clips import FillerClips
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from llm_voice.interfaces.audio_device import AudioDevice
+    from llm_voice.interfaces.sentence_timing import SentenceTiming
+
+TIMEOUT = 10.0
+
+
+class SilenceTextToSpeechClient(PcmTextToSpeechClient):
+    """Client that synthesizes a tenth of a second of silence per word."""
+
+    sample_rate = 24000
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        return bytes(len(text_to_speak.split()) * self.sample_rate // 10 * 2)
+
+
+class SlowSilenceTextToSpeechClient(SilenceTextToSpeechClient):
+    """Client that takes a tenth of a second per sentence."""
+
+    def synthesize_pcm(self, text_to_speak: str) -> bytes:
+        time.sleep(0.1)
+        return super().synthesize_pcm(text_to_speak)
+
+
+class RecordingPcmPlayer(NullPcmPlayer):
+    """Player that also records the duration of every audio it plays."""
+
+    def __init__(self, output_device: AudioDevice) -> None:
+        super().__init__(output_device)
+        self.durations: list[float] = []
+
+    def play(self, audio: PcmAudio) -> None:
+        self.durations.append(round(audio.duration, 2))
+        super().play(audio)
+
+
+def respond_in_thread(
+    responder: VoiceResponderFast,
+    tokens: Iterator[str],
+) -> BaseException | None:
+    """Run respond on another thread and return what it raised."""
+    errors: list[BaseException] = []
+
+    def run() -> None:
+        try:
+            responder.respond(tokens)
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(TIMEOUT)
+    assert not thread.is_alive(), "respond did not return"
+    return errors[0] if errors else None
+
+
+def failing_tokens(error: BaseException, sentences: int = 1) -> Iterator[str]:
+    yield from ["Hello", " there", "."]
+
+    for _ in range(sentences - 1):
+        yield from [" And", " more", "."]
+
+    yield from ["This", " is", " cut"]
+    raise error
+
+
+@pytest.fixture
+def timings() -> list[SentenceTiming]:
+    return []
+
+
+@pytest.fixture
+def responder(timings: list[SentenceTiming]) -> VoiceResponderFast:
+    return VoiceResponderFast(
+        SilenceTextToSpeechClient(),
+        NULL_OUTPUT_DEVICE,
+        player_factory=NullPcmPlayer,
+        on_sentence=timings.append,
+    )
+
+
+def test_respond_speaks_every_sentence(
+    responder: VoiceResponderFast,
+    timings: list[SentenceTiming],
+) -> None:
+    error = respond_in_thread(
+        responder, iter(["Hello", " there", ".", " No", " terminator"])
+    )
+
+    assert error is None
+    assert [timing.text for timing in timings] == ["Hello there.", " No terminator"]
+
+
+def test_respond_stops_workers_when_the_stream_raises(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    threads_before: set[threading.Thread] = set(threading.enumerate())
+    responder = VoiceResponderFast(
+        SlowSilenceTextToSpeechClient(),
+        NULL_OUTPUT_DEVICE,
+        coalesce_seconds=None,
+        player_factory=NullPcmPlayer,
+    )
+    tokens: Iterator[str] = failing_tokens(RuntimeError("HTTP 500"), sentences=5)
+
+    # The sentences still waiting for synthesis are cancelled.
+    with caplog.at_level(logging.ERROR):
+        error = respond_in_thread(responder, tokens)
+
+    assert isinstance(error, RuntimeError)
+    assert set(threading.enumerate()) <= threads_before | {threading.current_thread()}
+    assert [
+        record.getMessage()
+        for record in caplog.records
+        if record.levelno >= logging.ERROR
+    ] == []
+
+
+def test_respond_unwinds_when_interrupted_mid_stream(
+    responder: VoiceResponderFast,
+    timings: list[SentenceTiming],
+) -> None:
+    threads_before: set[threading.Thread] = set(threading.enumerate())
+
+    error = respond_in_thread(responder, failing_tokens(KeyboardInterrupt()))
+
+    assert isinstance(error, KeyboardInterrupt)
+    assert set(threading.enumerate()) <= threads_before | {threading.current_thread()}
+    assert all(timing.text == "Hello there." for timing in timings)
+
+
+def test_filler_clip_does_not_hold_up_the_first_sentence(
+    timings: list[SentenceTiming],
+) -> None:
+    sample_rate: int = NULL_OUTPUT_DEVICE.default_sample_rate
+    clip = FillerClip("hmm", PcmAudio(bytes(2 * sample_rate * 2), sample_rate))
+    players: list[RecordingPcmPlayer] = []
+
+    def player_factory(output_device: AudioDevice) -> RecordingPcmPlayer:
+        players.append(RecordingPcmPlayer(output_device))
+        return players[-1]
+
+    responder = VoiceResponderFast(
+        SilenceTextToSpeechClient(),
+        NULL_OUTPUT_DEVICE,
+        filler_clips=FillerClips([clip]),
+        filler_delay=0.1,
+        player_factory=player_factory,
+        on_sentence=timings.append,
+    )
+
+    def slow_tokens() -> Iterator[str]:
+        time.sleep(0.4)
+        yield from ["Hello", " there", "."]
+
+    assert respond_in_thread(responder, slow_tokens()) is None
+    # The sentence is submitted when it arrives, not once the clip is queued.
+    assert timings[0].submitted < 1.0
+    assert players[0].durations[:2] == [2.0, 0.2]
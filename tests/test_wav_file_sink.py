@@ -0,0 +1,48 @@
+"""Tests for the WavFileSink class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from llm_voice.interfaces.pcm_audio import PcmAudio
+from llm_voice.utils.wav_file import read_wav
+from llm_voice.utils.wav_file_sink import WavFileSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_audio_is_written_to_the_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "answer.wav"
+    sink = WavFileSink(path)
+
+    sink.play(PcmAudio(b"\x01\x00\x02\x00", 16000))
+    sink.play(PcmAudio(b"\x03\x00", 16000))
+    sink.close()
+
+    assert read_wav(path) == (b"\x01\x00\x02\x00\x03\x00", 16000, 1)
+
+
+def test_later_audio_is_converted_to_the_format_of_the_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "answer.wav"
+    sink = WavFileSink(path)
+
+    sink.play(PcmAudio(bytes(1600 * 2), 16000))
+    sink.play(PcmAudio(bytes(2400 * 2 * 2), 24000, channels=2))
+    sink.close()
+
+    pcm, sample_rate, channels = read_wav(path)
+    assert (sample_rate, channels) == (16000, 1)
+    assert len(pcm) == 3200 * 2
+
+
+def test_close_starts_a_new_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "answer.wav"
+    sink = WavFileSink(path)
+
+    sink.play(PcmAudio(b"\x01\x00", 16000))
+    sink.close()
+    sink.play(PcmAudio(b"\x02\x00", 24000))
+    sink.close()
+
+    assert read_wav(path) == (b"\x02\x00", 24000, 1)